@@ -0,0 +1,28 @@
+"""Books keyset pagination index
+
+Revision ID: 4c1e8a9b2d37
+Revises: 930be25ea0c8
+Create Date: 2026-10-16 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e8a9b2d37'
+down_revision: Union[str, Sequence[str], None] = '930be25ea0c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_books_deleted_created', 'books', ['deleted_at', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_books_deleted_created', table_name='books')
@@ -0,0 +1,49 @@
+"""Review/comment keyset indexes and book_stats counters
+
+Revision ID: 8f2d6c1a5e94
+Revises: 4c1e8a9b2d37
+Create Date: 2026-10-16 11:02:17.284511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2d6c1a5e94'
+down_revision: Union[str, Sequence[str], None] = '4c1e8a9b2d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_reviews_book_created', 'reviews', ['book_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_comments_book_created', 'comments', ['book_id', 'created_at', 'id'], unique=False)
+
+    op.create_table('book_stats',
+    sa.Column('book_id', sa.BigInteger(), nullable=False),
+    sa.Column('review_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('comment_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id')
+    )
+
+    # 기존 데이터 기준으로 카운터 초기화
+    op.execute("""
+        INSERT INTO book_stats (book_id, review_count, comment_count)
+        SELECT b.id,
+               (SELECT COUNT(*) FROM reviews r WHERE r.book_id = b.id),
+               (SELECT COUNT(*) FROM comments c WHERE c.book_id = b.id)
+        FROM books b
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('book_stats')
+    op.drop_index('idx_comments_book_created', table_name='comments')
+    op.drop_index('idx_reviews_book_created', table_name='reviews')
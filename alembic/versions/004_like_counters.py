@@ -0,0 +1,43 @@
+"""Denormalized like counters on reviews and comments
+
+Revision ID: b37e0f4d9a62
+Revises: 8f2d6c1a5e94
+Create Date: 2026-10-16 11:48:03.917640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b37e0f4d9a62'
+down_revision: Union[str, Sequence[str], None] = '8f2d6c1a5e94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reviews', sa.Column('like_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('comments', sa.Column('like_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+    # 기존 좋아요 데이터로 카운터 백필
+    op.execute("""
+        UPDATE reviews r
+        SET r.like_count = (SELECT COUNT(*) FROM review_likes l WHERE l.review_id = r.id)
+    """)
+    op.execute("""
+        UPDATE comments c
+        SET c.like_count = (SELECT COUNT(*) FROM comment_likes l WHERE l.comment_id = c.id)
+    """)
+
+    op.create_index('idx_reviews_book_likes', 'reviews', ['book_id', 'like_count', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_reviews_book_likes', table_name='reviews')
+    op.drop_column('comments', 'like_count')
+    op.drop_column('reviews', 'like_count')
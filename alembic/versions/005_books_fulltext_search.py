@@ -0,0 +1,45 @@
+"""Full-text search index on books (title, description, author names)
+
+Revision ID: d5a91c7e3f08
+Revises: b37e0f4d9a62
+Create Date: 2026-10-16 14:22:41.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a91c7e3f08'
+down_revision: Union[str, Sequence[str], None] = 'b37e0f4d9a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('books', sa.Column('author_names', sa.Text(), nullable=True))
+
+    # 기존 도서의 저자 이름 백필
+    op.execute("""
+        UPDATE books b
+        SET b.author_names = (
+            SELECT GROUP_CONCAT(a.name ORDER BY a.id SEPARATOR ', ')
+            FROM book_authors ba
+            JOIN authors a ON a.id = ba.author_id
+            WHERE ba.book_id = b.id
+        )
+    """)
+
+    op.create_index(
+        'ft_books_search', 'books', ['title', 'description', 'author_names'],
+        unique=False, mysql_prefix='FULLTEXT'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ft_books_search', table_name='books')
+    op.drop_column('books', 'author_names')
@@ -0,0 +1,54 @@
+"""Rating sum/histogram and library/wishlist counters on book_stats
+
+Revision ID: 2e7b4f90c1d3
+Revises: d5a91c7e3f08
+Create Date: 2026-10-16 15:07:52.116204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e7b4f90c1d3'
+down_revision: Union[str, Sequence[str], None] = 'd5a91c7e3f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEW_COLUMNS = (
+    'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5',
+    'library_count', 'wishlist_count',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in NEW_COLUMNS:
+        op.add_column('book_stats', sa.Column(column, sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+    # 집계 행이 없는 도서도 포함하여 기존 데이터로 백필
+    op.execute("""
+        INSERT IGNORE INTO book_stats (book_id)
+        SELECT id FROM books
+    """)
+    op.execute("""
+        UPDATE book_stats s
+        SET s.review_count = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id),
+            s.comment_count = (SELECT COUNT(*) FROM comments c WHERE c.book_id = s.book_id),
+            s.rating_sum = (SELECT COALESCE(SUM(r.rating), 0) FROM reviews r WHERE r.book_id = s.book_id),
+            s.rating_1 = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id AND r.rating = 1),
+            s.rating_2 = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id AND r.rating = 2),
+            s.rating_3 = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id AND r.rating = 3),
+            s.rating_4 = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id AND r.rating = 4),
+            s.rating_5 = (SELECT COUNT(*) FROM reviews r WHERE r.book_id = s.book_id AND r.rating = 5),
+            s.library_count = (SELECT COUNT(*) FROM library_items l WHERE l.book_id = s.book_id),
+            s.wishlist_count = (SELECT COUNT(*) FROM wishlist_items w WHERE w.book_id = s.book_id)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(NEW_COLUMNS):
+        op.drop_column('book_stats', column)
@@ -0,0 +1,30 @@
+"""Users keyset pagination and name prefix indexes
+
+Revision ID: 8f3d6b2a9e14
+Revises: 2e7b4f90c1d3
+Create Date: 2026-10-16 18:24:09.731560
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3d6b2a9e14'
+down_revision: Union[str, Sequence[str], None] = '2e7b4f90c1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_users_role_created', 'users', ['role', 'created_at', 'id'], unique=False)
+    op.create_index('idx_users_name', 'users', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_users_name', table_name='users')
+    op.drop_index('idx_users_role_created', table_name='users')
@@ -0,0 +1,30 @@
+"""Library and wishlist keyset pagination indexes
+
+Revision ID: 6a0c2e8d4b71
+Revises: 8f3d6b2a9e14
+Create Date: 2026-10-16 19:02:37.418902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a0c2e8d4b71'
+down_revision: Union[str, Sequence[str], None] = '8f3d6b2a9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_library_items_user_created', 'library_items', ['user_id', 'created_at', 'book_id'], unique=False)
+    op.create_index('idx_wishlist_items_user_created', 'wishlist_items', ['user_id', 'created_at', 'book_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_wishlist_items_user_created', table_name='wishlist_items')
+    op.drop_index('idx_library_items_user_created', table_name='library_items')
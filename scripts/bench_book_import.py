@@ -0,0 +1,68 @@
+"""
+도서 일괄 등록 처리량 측정 스크립트
+Usage: python scripts/bench_book_import.py --token <ADMIN_ACCESS_TOKEN> --books 20000
+
+- 임의 도서 NDJSON을 생성하여 POST /api/books/import로 스트리밍 업로드
+- 등록 건수/오류 건수와 분당 처리량(books/min)을 출력
+- 실행할 때마다 다른 ISBN 범위를 쓰도록 --isbn-start를 바꿔 사용
+"""
+import argparse
+import json
+import random
+import time
+
+import httpx
+
+
+def generate_rows(args: argparse.Namespace):
+    """NDJSON 행을 바이트로 생성 (저자/카테고리는 일부 겹치도록 풀에서 선택)"""
+    rng = random.Random(args.seed)
+    authors = [f"Bench Author {i}" for i in range(args.authors)]
+    categories = [f"Bench Category {i}" for i in range(args.categories)]
+    for i in range(args.books):
+        row = {
+            "title": f"Bench Book {args.isbn_start + i}",
+            "isbn": str(args.isbn_start + i).zfill(13),
+            "price": round(rng.uniform(5, 50), 2),
+            "publication_date": "2024-01-01",
+            "authors": rng.sample(authors, k=rng.randint(1, 3)),
+            "categories": rng.sample(categories, k=rng.randint(1, 2)),
+        }
+        yield (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도서 일괄 등록 처리량 측정")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--token", required=True, help="관리자 Access Token")
+    parser.add_argument("--books", type=int, default=20000)
+    parser.add_argument("--authors", type=int, default=2000, help="저자 이름 풀 크기")
+    parser.add_argument("--categories", type=int, default=50, help="카테고리 이름 풀 크기")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--isbn-start", type=int, default=9790000000000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    response = httpx.post(
+        f"{args.base_url}/api/books/import",
+        params={"format": "ndjson", "chunk_size": args.chunk_size},
+        headers={"Authorization": f"Bearer {args.token}", "Content-Type": "application/x-ndjson"},
+        content=generate_rows(args),
+        timeout=None,
+    )
+    elapsed = time.perf_counter() - started
+    response.raise_for_status()
+    payload = response.json()["payload"]
+
+    print("=" * 50)
+    print(f"books={args.books} chunk_size={args.chunk_size}")
+    print("=" * 50)
+    print(f"elapsed      : {elapsed:.2f}s")
+    print(f"imported     : {payload['imported']}")
+    print(f"failed       : {payload['failed']}")
+    print(f"throughput   : {payload['imported'] / elapsed * 60:.0f} books/min")
+
+
+if __name__ == "__main__":
+    main()
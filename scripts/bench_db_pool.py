@@ -0,0 +1,141 @@
+"""
+커넥션 풀 크기별 처리량/획득 대기시간 측정 스크립트
+Usage: python scripts/bench_db_pool.py --workers 4 --concurrency 40 --sizes 5,10,20,40
+
+- 워커 프로세스 1개가 받는 동시 요청(--concurrency)을 흉내 내어, 풀 크기별로
+  비동기 엔진에서 커넥션 획득 대기시간(p50/p95)과 처리량을 측정
+- 요청 1건은 --query를 --queries-per-request번 실행하는 것으로 가정 (기본: 5ms 쿼리 2회)
+- MariaDB max_connections와 --workers로 워커당 허용 가능한 최대 커넥션 수를 계산하여
+  대기시간이 충분히 작은 가장 작은 풀 크기를 DB_POOL_SIZE 권장값으로 출력
+
+서버 전체 기준 확인은 scripts/load_test.py로 부하를 주면서 /metrics의
+db_pool_checkout_seconds, db_pool_saturation을 관찰합니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from src.config import settings  # noqa: E402
+from src.metrics import InstrumentedAsyncQueuePool  # noqa: E402
+
+# 관리 도구/마이그레이션 등을 위해 남겨 둘 커넥션 수
+RESERVED_CONNECTIONS = 10
+# 동기/비동기 엔진이 각각 풀을 가짐
+ENGINES_PER_WORKER = 2
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def run_size(size: int, args: argparse.Namespace) -> dict:
+    engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=size,
+        max_overflow=args.overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_logging_name=f"bench-{size}",
+    )
+    # 연결 수립 시간은 측정에서 제외
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    waits: list[float] = []
+    timeouts = 0
+    remaining = args.requests
+
+    async def client():
+        nonlocal remaining, timeouts
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    waits.append((time.perf_counter() - started) * 1000)
+                    for _ in range(args.queries_per_request):
+                        await conn.execute(text(args.query))
+            except Exception:
+                timeouts += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(args.concurrency)])
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    waits.sort()
+    return {
+        "size": size,
+        "throughput": (args.requests - timeouts) / elapsed,
+        "p50": percentile(waits, 50),
+        "p95": percentile(waits, 95),
+        "timeouts": timeouts,
+    }
+
+
+async def max_connections() -> int:
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL)
+    async with engine.connect() as conn:
+        value = await conn.scalar(text("SELECT @@max_connections"))
+    await engine.dispose()
+    return int(value)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    limit = await max_connections()
+    per_worker = (limit - RESERVED_CONNECTIONS) // (args.workers * ENGINES_PER_WORKER)
+
+    print("=" * 64)
+    print(f"workers={args.workers} concurrency/worker={args.concurrency} requests={args.requests}")
+    print(f"max_connections={limit} -> pool_size+max_overflow <= {per_worker} per engine")
+    print("=" * 64)
+    print(f"{'pool_size':>9} {'req/s':>9} {'wait p50':>10} {'wait p95':>10} {'timeouts':>9}")
+
+    results = []
+    for size in args.sizes:
+        if size + args.overflow > per_worker:
+            print(f"{size:>9} {'skipped (exceeds max_connections budget)':>40}")
+            continue
+        result = await run_size(size, args)
+        results.append(result)
+        print(
+            f"{result['size']:>9} {result['throughput']:>9.1f} "
+            f"{result['p50']:>8.2f}ms {result['p95']:>8.2f}ms {result['timeouts']:>9}"
+        )
+
+    # 획득 대기 p95가 목표 이하이고 타임아웃이 없는 가장 작은 크기
+    fitting = [r for r in results if r["p95"] <= args.target_wait_ms and r["timeouts"] == 0]
+    print("-" * 64)
+    if fitting:
+        print(f"recommended DB_POOL_SIZE={fitting[0]['size']} DB_MAX_OVERFLOW={args.overflow}")
+    else:
+        print("no tested size met the wait target; try larger sizes or fewer workers")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커넥션 풀 크기별 획득 대기시간 측정")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="uvicorn 워커 수")
+    parser.add_argument("--concurrency", type=int, default=40, help="워커 1개의 동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in v.split(",")], default=[5, 10, 20, 40])
+    parser.add_argument("--overflow", type=int, default=0, help="측정 중 max_overflow (기본 0: 풀 크기만 비교)")
+    parser.add_argument("--query", default="SELECT SLEEP(0.005)")
+    parser.add_argument("--queries-per-request", type=int, default=2)
+    parser.add_argument("--target-wait-ms", type=float, default=1.0, help="허용할 획득 대기 p95")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
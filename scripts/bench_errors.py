@@ -0,0 +1,141 @@
+"""
+404 오류 응답 처리량 마이크로 벤치마크
+Usage: python scripts/bench_errors.py --iterations 20000
+
+존재하지 않는 id로 /api/books/{id}를 훑는 요청처럼 오류 응답만 만드는 경로를 비교합니다.
+- inline : 이전 라우터 방식. ErrorResponse(...) 검증 -> model_dump(mode="json") -> JSONResponse(json.dumps)
+- factory: src.schema.common.error_response. 검증 생략, 컴파일된 직렬화기로 바로 JSON bytes
+
+[render] 응답 객체 생성만, [asgi] 최소 FastAPI 앱에 ASGI로 직접 요청
+(라우트에서 inline 응답 반환 vs APIException 발생 -> 전역 처리기)하여 초당 처리 요청 수를 측정합니다.
+DB/Redis 없이 실행되며, 서버 전체 기준 확인은 scripts/load_test.py를 사용합니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request, status  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from src.auth.jwt import APIException  # noqa: E402
+from src.schema.common import ErrorResponse, error_response  # noqa: E402
+
+PATH = "/api/books/123456"
+MESSAGE = "해당 도서를 찾을 수 없습니다"
+
+
+def inline_error(path: str, book_id: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content=ErrorResponse(
+            timestamp=datetime.now(),
+            path=path,
+            status=404,
+            code="BOOK_NOT_FOUND",
+            message=MESSAGE,
+            details={"book_id": book_id}
+        ).model_dump(mode="json")
+    )
+
+
+def factory_error(path: str, book_id: int):
+    return error_response(404, "BOOK_NOT_FOUND", MESSAGE, path, {"book_id": book_id})
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/inline/{book_id}")
+    async def inline_route(request: Request, book_id: int):
+        return inline_error(request.url.path, book_id)
+
+    @app.get("/raise/{book_id}")
+    async def raise_route(book_id: int):
+        raise APIException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            code="BOOK_NOT_FOUND",
+            message=MESSAGE,
+            details={"book_id": book_id}
+        )
+
+    @app.exception_handler(APIException)
+    async def api_exception_handler(request: Request, exc: APIException):
+        return error_response(exc.status_code, exc.code, exc.message, request.url.path, exc.details)
+
+    return app
+
+
+async def asgi_rate(app: FastAPI, path: str, iterations: int) -> float:
+    """ASGI로 직접 GET 요청을 보내 초당 처리 수 반환 (HTTP 클라이언트/서버 비용 제외)"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1),
+        "server": ("bench", 80), "state": {},
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await app(dict(scope), receive, send)
+    assert statuses == [404], statuses
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return iterations / (time.perf_counter() - started)
+
+
+def render_rate(func, iterations: int) -> float:
+    func(PATH, 123456)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(PATH, 123456)
+    return iterations / (time.perf_counter() - started)
+
+
+def report(label: str, inline: float, factory: float) -> None:
+    print(label)
+    print(f"  {'inline':<8} {inline:>12,.0f}/s {1e6 / inline:>8.1f}us")
+    print(f"  {'factory':<8} {factory:>12,.0f}/s {1e6 / factory:>8.1f}us  ({factory / inline:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="404 오류 응답 처리량 비교")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    # 두 방식의 본문이 타임스탬프를 제외하고 같은지 먼저 확인
+    inline_body = inline_error(PATH, 1).body
+    factory_body = factory_error(PATH, 1).body
+    assert inline_body.split(b'"path"')[1] == factory_body.split(b'"path"')[1]
+
+    print("=" * 50)
+    print(f"iterations={args.iterations}")
+    print("=" * 50)
+    report(
+        "[render]",
+        render_rate(inline_error, args.iterations),
+        render_rate(factory_error, args.iterations),
+    )
+
+    app = build_app()
+    report(
+        "[asgi]",
+        asyncio.run(asgi_rate(app, "/inline/123456", args.iterations)),
+        asyncio.run(asgi_rate(app, "/raise/123456", args.iterations)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+JWT 검증/발급 백엔드별 처리량 비교 마이크로 벤치마크
+Usage: python scripts/bench_jwt.py --iterations 20000 --tokens 1000
+
+- jose  : python-jose 디코딩 (기본 백엔드)
+- hmac  : 표준 라이브러리 HS256/384/512 전용 백엔드 (JWT_BACKEND=hmac)
+- pyjwt : 설치되어 있으면 참고용으로 함께 측정
+- cached: verify_token 경로 (토큰 --tokens개를 번갈아 검증, 첫 검증 후 페이로드 캐시 적중)
+
+서버 전체 기준 확인은 scripts/load_test.py로 인증 API에 부하를 주면서 /api/health/cache의
+tokens.hit_ratio와 워커 CPU 사용률을 관찰합니다.
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import settings  # noqa: E402
+from src.auth import jwt as jwt_module  # noqa: E402
+from src.auth.jwt_backend import HMACBackend, JoseBackend  # noqa: E402
+
+
+def measure(label: str, func, tokens: list[str], iterations: int) -> float:
+    """iterations회 호출한 초당 처리량과 호출당 시간 출력"""
+    count = len(tokens)
+    started = time.perf_counter()
+    for i in range(iterations):
+        func(tokens[i % count])
+    elapsed = time.perf_counter() - started
+    rate = iterations / elapsed
+    print(f"  {label:<14} {rate:>12,.0f}/s {elapsed / iterations * 1e6:>9.1f}us")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT 백엔드/캐시 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=1000, help="번갈아 검증할 서로 다른 토큰 수")
+    args = parser.parse_args()
+
+    backends = [
+        JoseBackend(settings.SECRET_KEY, settings.ALGORITHM),
+        HMACBackend(settings.SECRET_KEY, settings.ALGORITHM),
+    ]
+    claims = {"sub": "1", "email": "user1@example.com", "role": "user"}
+    tokens = [jwt_module.create_access_token({**claims, "sub": str(i)}) for i in range(args.tokens)]
+
+    print("=" * 50)
+    print(f"algorithm={settings.ALGORITHM} iterations={args.iterations} tokens={args.tokens}")
+    print("=" * 50)
+
+    print("[decode]")
+    baseline = None
+    for backend in backends:
+        rate = measure(backend.name, backend.decode, tokens, args.iterations)
+        baseline = baseline or rate
+    try:
+        import jwt as pyjwt
+        # 기본 SECRET_KEY 길이 경고 무시
+        warnings.simplefilter("ignore")
+        measure("pyjwt", lambda t: pyjwt.decode(t, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+                tokens, args.iterations)
+    except ImportError:
+        print("  pyjwt          not installed")
+
+    # 첫 바퀴는 캐시 채우기
+    jwt_module.token_cache.clear()
+    for token in tokens:
+        jwt_module.verify_token(token)
+    rate = measure("cached", jwt_module.verify_token, tokens, args.iterations)
+    print(f"  cached/jose    {rate / baseline:>12.1f}x")
+
+    print("[encode]")
+    for backend in backends:
+        measure(backend.name, lambda _: backend.encode({**claims, "exp": time.time() + 3600}), tokens, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
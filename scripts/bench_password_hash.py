@@ -0,0 +1,110 @@
+"""
+비밀번호 해싱 실행 방식별 처리량 비교 벤치마크
+Usage: python scripts/bench_password_hash.py --logins 200 --concurrency 50 --workers 4
+
+- thread : 기존 방식. sync 핸들러처럼 Starlette 스레드풀(기본 40개)에서 bcrypt 실행
+- process: 전용 프로세스 풀(src.auth.password.verify_password_async)에서 실행
+- 두 방식 모두 로그인 부하 중 같은 스레드풀에 가벼운 작업(다른 sync 엔드포인트 역할)을
+  함께 넣어, 스레드풀 슬롯이 얼마나 오래 점유되는지 지연시간으로 비교
+
+서버 전체 기준 측정은 scripts/load_test.py로 POST /api/auth/login을 호출하여 비교합니다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import settings  # noqa: E402
+from src.auth import password  # noqa: E402
+
+# Starlette(anyio) 스레드풀 기본 크기
+THREADPOOL_SIZE = 40
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def run_mode(mode: str, args: argparse.Namespace, hashed: str) -> None:
+    loop = asyncio.get_running_loop()
+    threadpool = ThreadPoolExecutor(max_workers=THREADPOOL_SIZE)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    probe_latencies: list[float] = []
+    rejected = 0
+
+    async def login():
+        nonlocal rejected
+        async with semaphore:
+            if mode == "thread":
+                await loop.run_in_executor(threadpool, password.verify_password, "P@ssw0rd!", hashed)
+                return
+            try:
+                await password.verify_password_async("P@ssw0rd!", hashed)
+            except password.APIException:
+                rejected += 1
+
+    async def probe():
+        # 로그인 부하 동안 다른 sync 엔드포인트가 스레드풀 슬롯을 얻기까지의 지연
+        while not done.is_set():
+            started = time.perf_counter()
+            await loop.run_in_executor(threadpool, time.sleep, 0)
+            probe_latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.01)
+
+    if mode == "process":
+        # 워커 프로세스 기동 시간은 측정에서 제외
+        await password.verify_password_async("P@ssw0rd!", hashed)
+
+    done = asyncio.Event()
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(args.logins)])
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+    threadpool.shutdown()
+
+    probe_latencies.sort()
+    print(f"[{mode}]")
+    print(f"  elapsed          : {elapsed:.2f}s")
+    print(f"  logins/sec       : {(args.logins - rejected) / elapsed:.1f}")
+    print(f"  rejected (503)   : {rejected}")
+    print(f"  other sync p50   : {percentile(probe_latencies, 50):.1f}ms")
+    print(f"  other sync p95   : {percentile(probe_latencies, 95):.1f}ms")
+    if probe_latencies:
+        print(f"  other sync mean  : {statistics.fmean(probe_latencies):.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해싱 실행 방식 벤치마크")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-pending", type=int, default=settings.PASSWORD_HASH_MAX_PENDING)
+    parser.add_argument("--mode", choices=["thread", "process", "both"], default="both")
+    args = parser.parse_args()
+
+    settings.PASSWORD_HASH_WORKERS = args.workers
+    settings.PASSWORD_HASH_MAX_PENDING = args.max_pending
+    hashed = password.hash_password("P@ssw0rd!")
+
+    print("=" * 50)
+    print(f"logins={args.logins} concurrency={args.concurrency} workers={args.workers}")
+    print("=" * 50)
+    modes = ["thread", "process"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        asyncio.run(run_mode(mode, args, hashed))
+    password.shutdown_password_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+도서 목록(get_books, limit=100) 응답 직렬화 경로별 CPU 시간 마이크로 벤치마크
+Usage: python scripts/bench_serialization.py --items 100 --iterations 500
+
+DB/Redis 없이 get_books가 만드는 것과 같은 BookListResponse로 요청 1건의 직렬화 비용만 측정합니다.
+- model: 기본 경로. 라우트가 APIResponse를 반환하고 FastAPI가 response_model로 검증 후 dump_json
+  (fastapi.routing.serialize_response와 같은 TypeAdapter 호출)
+- fast : FAST_JSON_RESPONSES=true. 캐시 저장용으로 한 번 직렬화한 payload JSON을
+  PayloadJSONResponse 봉투에 그대로 사용
+- orjson: 참고용 (설치되어 있으면). model_dump() 후 orjson.dumps
+
+캐시 미스는 응답 모델 생성 + 캐시 저장용 직렬화를 포함하고,
+캐시 적중은 Redis에서 읽은 JSON 문자열에서 시작합니다.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.responses import PayloadJSONResponse  # noqa: E402
+from src.schema.books import BookListItem, BookListResponse, BookPagination, BookStatsSummary  # noqa: E402
+from src.schema.common import APIResponse  # noqa: E402
+
+MESSAGE = "도서 목록 조회에 성공했습니다."
+
+
+def build_payload(items: int) -> BookListResponse:
+    """get_books와 같은 방식(필드별 생성자 호출)으로 응답 payload 생성"""
+    books = [
+        BookListItem(
+            id=i,
+            title=f"앵무새 죽이기 {i}",
+            categories=["문학", "소설"],
+            authors=["하퍼 리"],
+            description="미국 남부의 인종 차별을 어린아이의 눈으로 그린 소설. " * 4,
+            isbn=f"978{i:010d}",
+            cover_image_url=f"https://example.com/covers/{i}.jpg",
+            price=Decimal("35000.00"),
+            publication_date=date(2020, 1, 1),
+            stats=BookStatsSummary(
+                review_count=12,
+                average_rating=4.25,
+                rating_histogram={1: 0, 2: 1, 3: 1, 4: 4, 5: 6},
+                comment_count=30,
+                library_count=80,
+                wishlist_count=45
+            )
+        )
+        for i in range(items)
+    ]
+    pagination = BookPagination(
+        total_books=10000, total_pages=100, current_page=1, page_size=items, page_sort=0
+    )
+    return BookListResponse(books=books, pagination=pagination)
+
+
+def measure(label: str, func, iterations: int) -> float:
+    """iterations회 호출한 요청당 CPU 시간(us) 출력"""
+    func()
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    per_call = (time.process_time() - started) / iterations * 1e6
+    print(f"  {label:<26} {per_call:>10.1f}us")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 경로별 CPU 시간 비교")
+    parser.add_argument("--items", type=int, default=100, help="목록 항목 수 (get_books limit)")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(APIResponse[BookListResponse])
+    payload = build_payload(args.items)
+    payload_json = payload.model_dump_json()
+
+    def model_route(value: BookListResponse) -> bytes:
+        # fastapi.routing.serialize_response (validate_python + dump_json)
+        response = APIResponse(is_success=True, message=MESSAGE, payload=value)
+        return adapter.dump_json(adapter.validate_python(response, from_attributes=True))
+
+    def miss_model():
+        value = build_payload(args.items)
+        value.model_dump_json()
+        return model_route(value)
+
+    def miss_fast():
+        value = build_payload(args.items)
+        return PayloadJSONResponse(MESSAGE, value.model_dump_json()).body
+
+    def hit_model():
+        return model_route(BookListResponse.model_validate_json(payload_json))
+
+    def hit_fast():
+        return PayloadJSONResponse(MESSAGE, payload_json).body
+
+    # 두 경로의 응답 본문이 같은지 먼저 확인
+    assert hit_model() == hit_fast() == miss_fast()
+
+    print("=" * 50)
+    print(f"items={args.items} iterations={args.iterations} body={len(hit_fast()):,} bytes")
+    print("=" * 50)
+    for title, model_func, fast_func in (
+        ("[cache miss]", miss_model, miss_fast),
+        ("[cache hit]", hit_model, hit_fast),
+    ):
+        print(title)
+        slow = measure("model (response_model)", model_func, args.iterations)
+        fast = measure("fast (PayloadJSONResponse)", fast_func, args.iterations)
+        print(f"  -> {slow - fast:,.1f}us CPU saved per request ({slow / fast:.1f}x)")
+
+    try:
+        import orjson
+    except ImportError:
+        return
+    print("[reference]")
+    response = APIResponse(is_success=True, message=MESSAGE, payload=payload)
+    measure("pydantic dump_json", lambda: adapter.dump_json(response), args.iterations)
+    measure(
+        "orjson(model_dump())",
+        lambda: orjson.dumps(response.model_dump(), default=str, option=orjson.OPT_NON_STR_KEYS),
+        args.iterations
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+간단한 동시성 부하 테스트 스크립트
+Usage: python scripts/load_test.py --path /api/books --concurrency 50 --requests 2000
+
+- 실행 중인 서버에 동시 요청을 보내 처리량(req/s)과 지연시간(p50/p95/p99)을 측정
+- 변경 전/후 비교: 같은 옵션으로 이전 커밋과 현재 커밋의 서버를 각각 띄워 실행
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    queue: asyncio.Queue,
+    args: argparse.Namespace,
+    latencies: list[float],
+    statuses: dict[int, int],
+):
+    """큐에서 요청 번호를 꺼내 순차적으로 요청"""
+    body = json.loads(args.json) if args.json else None
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        started = time.perf_counter()
+        try:
+            response = await client.request(args.method, args.path, json=body)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        except httpx.HTTPError:
+            statuses[0] = statuses.get(0, 0) + 1
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run(args: argparse.Namespace):
+    headers = {}
+    for header in args.header:
+        name, _, value = header.partition(":")
+        headers[name.strip()] = value.strip()
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(i)
+
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout
+    ) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            worker(client, queue, args, latencies, statuses)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print("=" * 50)
+    print(f"{args.method} {args.base_url}{args.path}")
+    print(f"concurrency={args.concurrency} requests={args.requests}")
+    print("=" * 50)
+    print(f"elapsed      : {elapsed:.2f}s")
+    print(f"throughput   : {args.requests / elapsed:.1f} req/s")
+    print(f"latency mean : {statistics.fmean(latencies):.1f}ms")
+    print(f"latency p50  : {percentile(latencies, 50):.1f}ms")
+    print(f"latency p95  : {percentile(latencies, 95):.1f}ms")
+    print(f"latency p99  : {percentile(latencies, 99):.1f}ms")
+    print(f"status codes : {dict(sorted(statuses.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 동시성 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--path", default="/api/books")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--json", default=None, help="요청 body (JSON 문자열)")
+    parser.add_argument("--header", action="append", default=[], help="'Name: value' 형식, 반복 가능")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+도서 집계(book_stats) 보정 스크립트
+Usage: python scripts/reconcile_book_stats.py --batch-size 500
+
+- 리뷰/댓글/라이브러리/위시리스트 원본 테이블로 도서별 집계를 다시 계산
+- 증분 갱신과 어긋난 행만 배치 단위로 덮어씀 (주기적 실행 또는 데이터 직접 수정 후 실행)
+"""
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import Session
+from src.database import engine
+from src.stats import reconcile_book_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="book_stats 보정")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 트랜잭션에서 처리할 도서 수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with Session(engine) as db:
+        fixed = reconcile_book_stats(db, batch_size=args.batch_size)
+    print(f"reconciled {fixed} book(s) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
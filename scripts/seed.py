@@ -38,6 +38,8 @@ from src.models import (
     CartItem, WishlistItem, LibraryItem,
     Order, OrderItem
 )
+from src.search import searchable_authors
+from src.stats import reconcile_book_stats
 
 # bcrypt 해시 생성
 import bcrypt
@@ -221,6 +223,8 @@ def seed_book_authors(db: Session, books: list[Book], authors: list[Author]):
         selected_authors = random.sample(authors, num_authors)
         for author in selected_authors:
             book_authors.append(BookAuthor(book_id=book.id, author_id=author.id))
+        # 전문 검색용 저자 이름
+        book.author_names = searchable_authors(author.name for author in selected_authors)
 
     db.add_all(book_authors)
     db.commit()
@@ -473,6 +477,9 @@ def main():
 
         seed_orders(db, users, books)
 
+        # 직접 삽입한 리뷰/댓글/라이브러리/위시리스트로 도서 집계 생성
+        reconcile_book_stats(db)
+
     print("=" * 50)
     print("Seed data created successfully!")
     print("=" * 50)
@@ -7,7 +7,12 @@ from src.auth.jwt import (
     get_current_user,
     get_current_admin_user,
 )
-from src.auth.password import hash_password, verify_password
+from src.auth.password import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+)
 
 __all__ = [
     "APIException",
@@ -18,4 +23,6 @@ __all__ = [
     "get_current_admin_user",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
 ]
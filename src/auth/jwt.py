@@ -1,11 +1,15 @@
 """JWT token utilities"""
 #외부 모듈
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Any
 
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt
 from jose.exceptions import JWTError, ExpiredSignatureError
 from sqlalchemy.orm import Session
 
@@ -14,6 +18,9 @@ from src.config import settings
 from src.database import get_db
 from src.models.user import User
 from src.redis import is_token_blacklisted
+from src.auth.jwt_backend import get_backend
+from src.auth.revocation import revocation_filter
+from src.auth.user_cache import user_cache, user_snapshot
 
 
 class APIException(Exception):
@@ -34,38 +41,98 @@ class APIException(Exception):
 
 security = HTTPBearer()
 
+# 토큰 인코딩/디코딩 백엔드 (jose 또는 hmac)
+jwt_backend = get_backend(settings.JWT_BACKEND, settings.SECRET_KEY, settings.ALGORITHM)
+
+
+class TokenPayloadCache:
+    """토큰 digest -> 검증된 페이로드 LRU 캐시 (토큰 exp까지 유효, 스레드 안전)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        # 토큰 원문 대신 짧은 digest를 키로 보관
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[dict[str, Any]]:
+        """캐시 조회 (없거나 exp가 지났으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, key: bytes, payload: dict[str, Any]) -> None:
+        """exp가 있는 페이로드만 저장 (최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (exp, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenPayloadCache(settings.JWT_CACHE_MAXSIZE)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Access Token 생성"""
-    to_encode = data.copy()
+    to_encode = {"jti": uuid.uuid4().hex, **data}
     expire = datetime.now(timezone.utc) + (
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt_backend.encode(to_encode)
 
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Refresh Token 생성"""
-    to_encode = data.copy()
+    # jti를 미리 정한 경우(Refresh Token 회전)에는 그대로 사용
+    to_encode = {"jti": uuid.uuid4().hex, **data}
     expire = datetime.now(timezone.utc) + (
         expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt_backend.encode(to_encode)
 
 
 def verify_token(token: str, token_type: str = "access") -> dict:
-    """토큰 검증 및 페이로드 반환"""
+    """
+    토큰 검증 및 페이로드 반환
+
+    서명/만료 검증을 통과한 페이로드는 exp까지 캐시하여 같은 토큰의 다음 요청에서 디코딩을 생략합니다.
+    폐기(로그아웃) 여부는 캐시와 별개로 get_current_user에서 확인합니다.
+    """
+    cache_key = token_cache.key(token)
+    payload = token_cache.get(cache_key)
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        if payload is None:
+            payload = jwt_backend.decode(token)
+            token_cache.set(cache_key, payload)
         if payload.get("type") != token_type:
             raise APIException(
                 status_code=401,
                 code="UNAUTHORIZED",
                 message="Invalid token type"
             )
-        return payload
+        return dict(payload)
     except ExpiredSignatureError:
         raise APIException(
             status_code=401,
@@ -86,17 +153,18 @@ def get_current_user(
 ) -> User:
     """현재 인증된 사용자 반환"""
     token = credentials.credentials
+    payload = verify_token(token, "access")
 
-    # 블랙리스트 확인
-    if is_token_blacklisted(token):
+    # 블랙리스트 확인 (jti 없는 이전 발급 토큰은 토큰 문자열로 Redis 직접 확인)
+    jti = payload.get("jti")
+    revoked = revocation_filter.is_revoked(jti) if jti else is_token_blacklisted(token)
+    if revoked:
         raise APIException(
             status_code=401,
             code="TOKEN_BLACKLISTED",
             message="Token has been revoked"
         )
 
-    payload = verify_token(token, "access")
-
     user_id = payload.get("sub")
     if user_id is None:
         raise APIException(
@@ -105,6 +173,11 @@ def get_current_user(
             message="Invalid token payload"
         )
 
+    # 프로세스 내 캐시 적중 시 DB 조회 생략 (세션에 연결되지 않은 User 반환)
+    snapshot = user_cache.get(int(user_id))
+    if snapshot is not None:
+        return User(**snapshot)
+
     user = db.query(User).filter(User.id == int(user_id)).first()
     if user is None:
         raise APIException(
@@ -113,6 +186,7 @@ def get_current_user(
             message="User not found"
         )
 
+    user_cache.set(user.id, user_snapshot(user))
     return user
 
 
@@ -0,0 +1,114 @@
+"""
+JWT 인코딩/디코딩 백엔드 (JWT_BACKEND)
+
+- jose: python-jose (기본, 모든 알고리즘 지원)
+- hmac: 표준 라이브러리 hmac/hashlib/json으로 HS256/HS384/HS512만 처리 (검증이 jose보다 수 배 빠름)
+
+두 백엔드는 같은 형식의 토큰을 만들고 서로의 토큰을 검증할 수 있으며,
+실패 시 jose 예외(ExpiredSignatureError, JWTError)를 발생시켜 verify_token의 오류 처리가 동일합니다.
+"""
+import base64
+import binascii
+import calendar
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime
+
+from jose import jwt as jose_jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+# jose와 같이 datetime을 정수 타임스탬프로 바꾸는 클레임
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+class JoseBackend:
+    name = "jose"
+
+    def __init__(self, secret: str, algorithm: str):
+        self.secret = secret
+        self.algorithm = algorithm
+
+    def encode(self, claims: dict) -> str:
+        return jose_jwt.encode(claims, self.secret, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict:
+        return jose_jwt.decode(token, self.secret, algorithms=[self.algorithm])
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class HMACBackend:
+    name = "hmac"
+
+    def __init__(self, secret: str, algorithm: str):
+        if algorithm not in _HMAC_DIGESTS:
+            raise ValueError(f"JWT_BACKEND=hmac supports only {', '.join(_HMAC_DIGESTS)}, not {algorithm}")
+        self.algorithm = algorithm
+        self._key = secret.encode()
+        self._digest = _HMAC_DIGESTS[algorithm]
+        # 헤더는 항상 같으므로 인코딩 결과를 재사용
+        self._header = _b64encode(
+            json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":")).encode()
+        )
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        return hmac.new(self._key, signing_input, self._digest).digest()
+
+    def encode(self, claims: dict) -> str:
+        claims = {
+            key: calendar.timegm(value.utctimetuple()) if key in _TIME_CLAIMS and isinstance(value, datetime) else value
+            for key, value in claims.items()
+        }
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = f"{self._header}.{payload}"
+        return f"{signing_input}.{_b64encode(self._sign(signing_input.encode()))}"
+
+    def decode(self, token: str) -> dict:
+        try:
+            signing_input, _, signature = token.rpartition(".")
+            header_segment, _, payload_segment = signing_input.partition(".")
+            if not header_segment or not payload_segment or "." in payload_segment:
+                raise JWTError("Not enough segments")
+            # 서명 확인 전에 헤더의 알고리즘을 설정값과 비교 (alg 혼동 공격 방지)
+            header = json.loads(_b64decode(header_segment))
+            if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                raise JWTError("The specified alg value is not allowed")
+            if not hmac.compare_digest(self._sign(signing_input.encode()), _b64decode(signature)):
+                raise JWTError("Signature verification failed")
+            payload = json.loads(_b64decode(payload_segment))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise JWTError("Invalid token") from e
+        if not isinstance(payload, dict):
+            raise JWTError("Invalid payload")
+
+        now = time.time()
+        exp = payload.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise JWTError("Expiration Time claim (exp) must be an integer.")
+            if exp < now:
+                raise ExpiredSignatureError("Signature has expired.")
+        nbf = payload.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+            raise JWTError("The token is not yet valid (nbf)")
+        return payload
+
+
+_BACKENDS = {JoseBackend.name: JoseBackend, HMACBackend.name: HMACBackend}
+
+
+def get_backend(name: str, secret: str, algorithm: str):
+    """설정 이름으로 백엔드 생성"""
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JWT_BACKEND: {name} (choose from {', '.join(_BACKENDS)})")
+    return _BACKENDS[name](secret, algorithm)
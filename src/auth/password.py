@@ -1,6 +1,16 @@
 """Password hashing utilities"""
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+from src.config import settings
+from src.auth.jwt import APIException
+
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """비밀번호 해시 생성"""
@@ -15,3 +25,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     password_bytes = plain_password.encode("utf-8")
     hashed_bytes = hashed_password.encode("utf-8")
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+# ==================== 비동기 API (전용 프로세스 풀) ====================
+
+# bcrypt는 CPU 바운드이므로 Starlette 스레드풀 대신 별도 프로세스에서 실행
+_executor: Optional[Executor] = None
+# 풀에 제출되어 대기/실행 중인 작업 수 (이벤트 루프 스레드에서만 변경)
+_pending = 0
+
+
+def get_password_executor() -> Optional[Executor]:
+    """
+    해싱 전용 프로세스 풀 (최초 호출 시 생성)
+
+    PASSWORD_HASH_WORKERS=0이면 None을 반환하여 이벤트 루프 기본 스레드풀을 사용합니다.
+    """
+    global _executor
+    if _executor is None and settings.PASSWORD_HASH_WORKERS > 0:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            # 서버 프로세스의 스레드/커넥션 상태를 복제하지 않도록 spawn 사용
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    """프로세스 풀 종료 (앱 종료 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run_in_pool(func: Callable[..., T], *args) -> T:
+    """대기열 한도를 넘으면 즉시 503, 아니면 풀에서 실행"""
+    global _pending
+    if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise APIException(
+            status_code=503,
+            code="SERVICE_UNAVAILABLE",
+            message="요청이 많아 잠시 후 다시 시도해주세요",
+            details={"reason": "password hashing queue is full"}
+        )
+
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), func, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해시 생성 (프로세스 풀)"""
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (프로세스 풀)"""
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
@@ -0,0 +1,193 @@
+"""
+Access Token 폐기 확인 (프로세스 내 Bloom 필터 + Redis 블랙리스트)
+
+- 로그아웃한 토큰의 jti는 Redis 블랙리스트(blacklist:<jti>)에 토큰 만료 시각까지 저장
+- 각 워커는 폐기된 jti를 Bloom 필터로 들고 있어, 필터에 없는 토큰(대부분의 요청)은 Redis 왕복 없이 통과
+- 필터에 있으면(실제 폐기 또는 오탐) Redis EXISTS로 정확히 확인
+- 폐기 시 pub/sub으로 다른 워커 필터에 즉시 추가하고, 백그라운드 스레드가 REVOKED_TOKEN_FILTER_REBUILD_SECONDS마다
+  Redis에서 다시 만들어 만료된 jti를 비움 (pub/sub 메시지를 놓친 경우도 이 주기 안에 반영,
+  재생성은 요청 경로에서 실행되지 않음)
+- 구독/초기 적재에 실패한 워커는 필터를 믿지 않고 모든 요청을 Redis로 확인
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+from typing import Iterable, Optional
+
+from redis.exceptions import RedisError
+
+from src.config import settings
+from src.metrics import Counter, registry
+from src.redis import is_token_blacklisted, redis_client, revoke_session, revoked_jtis
+
+logger = logging.getLogger(__name__)
+
+# 토큰 폐기 시 모든 워커가 구독하는 채널
+REVOKED_TOKEN_CHANNEL = "auth:token-revoked"
+
+auth_revocation_checks_total = registry.register(Counter(
+    "auth_revocation_checks_total",
+    "Access token revocation checks by outcome (filter_pass skips Redis)",
+    ("result",)
+))
+
+
+class BloomFilter:
+    """문자열 집합 Bloom 필터 (오탐 있음, 누락 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        # m = -n ln p / (ln 2)^2, k = m/n ln 2
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # 128비트 해시 하나를 둘로 나눠 k개 위치 생성 (double hashing)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        positions = list(self._positions(item))
+        # 비트 OR는 읽고-쓰기이므로 동시 추가 시 비트가 유실되지 않도록 잠금
+        with self._lock:
+            for pos in positions:
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationFilter:
+    """워커별 폐기 jti 필터 (주기적으로 Redis에서 다시 생성)"""
+
+    def __init__(self, capacity: int, error_rate: float, rebuild_seconds: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._next = None
+        self._built_at = float("-inf")
+        self._stop_rebuilding: Optional[threading.Event] = None
+        # 구독 중이고 한 번 이상 적재된 경우에만 필터 불통과를 신뢰
+        self.subscribed = False
+
+    @property
+    def ready(self) -> bool:
+        return self.subscribed and self._built_at > float("-inf")
+
+    def add(self, jti: str) -> None:
+        self._bloom.add(jti)
+        # 재생성 중 들어온 폐기는 새 필터에도 추가 (교체 시 유실 방지)
+        pending = self._next
+        if pending is not None:
+            pending.add(jti)
+
+    def rebuild(self) -> None:
+        """Redis의 미만료 폐기 jti로 필터를 새로 만들어 교체"""
+        bloom = self._next = BloomFilter(self.capacity, self.error_rate)
+        try:
+            for jti in revoked_jtis():
+                bloom.add(jti)
+            self._bloom = bloom
+            self._built_at = time.monotonic()
+        finally:
+            self._next = None
+
+    def _rebuild_loop(self, stop: threading.Event) -> None:
+        # 주기마다 다시 만들고, 실패하면 기존 필터를 유지한 채 다음 주기에 재시도
+        while not stop.wait(self.rebuild_seconds):
+            try:
+                self.rebuild()
+            except RedisError:
+                logger.warning("revocation filter rebuild failed; keeping previous filter", exc_info=True)
+
+    def start_rebuilding(self) -> None:
+        """주기적 재생성 스레드 시작 (요청 경로에서 재생성하지 않도록 워커당 스레드 1개)"""
+        if self._stop_rebuilding is not None:
+            return
+        stop = self._stop_rebuilding = threading.Event()
+        threading.Thread(
+            target=self._rebuild_loop, args=(stop,), name="revocation-filter-rebuild", daemon=True
+        ).start()
+
+    def stop_rebuilding(self) -> None:
+        if self._stop_rebuilding is not None:
+            self._stop_rebuilding.set()
+            self._stop_rebuilding = None
+
+    def is_revoked(self, jti: str) -> bool:
+        """jti 폐기 여부 (필터 불통과 시 Redis 생략)"""
+        if self.ready:
+            if jti not in self._bloom:
+                auth_revocation_checks_total.inc(result="filter_pass")
+                return False
+            revoked = is_token_blacklisted(jti)
+            auth_revocation_checks_total.inc(result="revoked" if revoked else "false_positive")
+            return revoked
+        auth_revocation_checks_total.inc(result="unfiltered")
+        return is_token_blacklisted(jti)
+
+
+revocation_filter = RevocationFilter(
+    settings.REVOKED_TOKEN_FILTER_CAPACITY,
+    settings.REVOKED_TOKEN_FILTER_ERROR_RATE,
+    settings.REVOKED_TOKEN_FILTER_REBUILD_SECONDS,
+)
+
+
+async def revoke_tokens(user_id: int, family: Optional[str], jti: str, expires_at: int) -> None:
+    """로그아웃 - 블랙리스트 저장/Refresh Token family 삭제/다른 워커 전파 후 현재 워커 필터에 추가"""
+    await revoke_session(user_id, family, jti, expires_at, REVOKED_TOKEN_CHANNEL)
+    revocation_filter.add(jti)
+
+
+def _on_revoked_message(message: dict) -> None:
+    if isinstance(message.get("data"), str):
+        revocation_filter.add(message["data"])
+    else:
+        logger.warning("invalid token revocation message: %r", message)
+
+
+def _on_listener_error(exc: Exception, pubsub, thread) -> None:
+    # 재연결 전 사이에 놓친 메시지는 다음 재생성에서 반영
+    logger.warning("token revocation listener error: %s", exc)
+    time.sleep(1.0)
+
+
+def start_revocation_listener():
+    """
+    폐기 채널 구독 스레드 시작 후 필터 적재 및 주기적 재생성 스레드 시작 (앱 시작 시 호출, 실패 시 None)
+
+    구독을 먼저 해야 적재와 구독 사이에 발생한 폐기를 놓치지 않습니다.
+    """
+    try:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{REVOKED_TOKEN_CHANNEL: _on_revoked_message})
+        thread = pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=_on_listener_error
+        )
+    except RedisError:
+        logger.warning("token revocation listener could not subscribe; checking Redis per request", exc_info=True)
+        return None
+    try:
+        revocation_filter.rebuild()
+    except RedisError:
+        logger.warning("revocation filter initial load failed; retrying on next rebuild", exc_info=True)
+    revocation_filter.subscribed = True
+    revocation_filter.start_rebuilding()
+    return thread
+
+
+def stop_revocation_listener(thread) -> None:
+    revocation_filter.subscribed = False
+    revocation_filter.stop_rebuilding()
+    if thread is not None:
+        thread.stop()
@@ -0,0 +1,112 @@
+"""인증 사용자 프로세스 내 캐시 (LRU + TTL, Redis pub/sub 무효화)"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from src.config import settings
+from src.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 사용자 정보 변경 시 모든 워커가 구독하는 채널
+USER_INVALIDATE_CHANNEL = "auth:user-invalidate"
+
+# 캐시에 담는 컬럼 (password_hash 등 민감 정보 제외)
+USER_SNAPSHOT_FIELDS = ("id", "email", "name", "role", "created_at", "updated_at")
+
+
+class UserCache:
+    """user_id -> 사용자 스냅샷 LRU 캐시 (TTL 만료, 스레드 안전)"""
+
+    def __init__(self, maxsize: int, ttl_seconds: int):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, user_id: int) -> Optional[dict[str, Any]]:
+        """캐시 조회 (없거나 만료 시 None)"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, user_id: int, snapshot: dict[str, Any]) -> None:
+        """캐시 저장 (최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, user_id: int) -> None:
+        """특정 사용자 항목 제거"""
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """전체 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(settings.USER_CACHE_MAXSIZE, settings.USER_CACHE_TTL_SECONDS)
+
+
+def user_snapshot(user) -> dict[str, Any]:
+    """User ORM 객체에서 캐시할 컬럼만 추출"""
+    return {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+
+
+def publish_user_invalidation(user_id: int) -> None:
+    """
+    사용자 정보/권한 변경 시 호출 - 현재 워커에서 즉시 제거하고 다른 워커에 전파
+
+    Redis 장애 시에도 다른 워커의 항목은 TTL 내에 만료됩니다.
+    """
+    user_cache.invalidate(user_id)
+    try:
+        redis_client.publish(USER_INVALIDATE_CHANNEL, str(user_id))
+    except RedisError:
+        logger.warning("user cache invalidation publish failed: %s", user_id, exc_info=True)
+
+
+def _on_invalidate_message(message: dict) -> None:
+    try:
+        user_cache.invalidate(int(message["data"]))
+    except (TypeError, ValueError):
+        logger.warning("invalid user cache invalidation message: %r", message)
+
+
+def _on_listener_error(exc: Exception, pubsub, thread) -> None:
+    # 연결이 끊겨도 스레드를 유지 (다음 get_message에서 재연결/재구독)
+    logger.warning("user cache listener error: %s", exc)
+    time.sleep(1.0)
+
+
+def start_user_cache_listener():
+    """무효화 채널 구독 스레드 시작 (앱 시작 시 호출, 실패 시 None)"""
+    try:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{USER_INVALIDATE_CHANNEL: _on_invalidate_message})
+        return pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=_on_listener_error
+        )
+    except RedisError:
+        logger.warning("user cache listener could not subscribe; relying on TTL", exc_info=True)
+        return None
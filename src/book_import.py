@@ -0,0 +1,174 @@
+"""도서 일괄 등록(NDJSON/CSV) 유틸리티"""
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog import get_or_create_ids
+from src.search import searchable_authors
+from src.models.book import Book
+from src.models.author import Author
+from src.models.category import Category
+from src.models.book_author import BookAuthor
+from src.models.book_category import BookCategory
+from src.schema.books import BookCreate, BookImportError
+
+# CSV 한 칸에 여러 저자/카테고리를 담을 때의 구분자
+CSV_LIST_SEPARATOR = "|"
+CSV_LIST_FIELDS = ("authors", "categories")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """요청 바디 스트림을 줄 단위로 변환 (청크 경계에 걸친 줄/멀티바이트 문자 처리)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _csv_row(header: list[str], line: str) -> dict:
+    values = next(csv.reader([line]))
+    raw = {}
+    for name, value in zip(header, values):
+        value = value.strip()
+        if name in CSV_LIST_FIELDS:
+            raw[name] = [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+        else:
+            # 빈 칸은 값 없음(None)으로 처리
+            raw[name] = value or None
+    return raw
+
+
+async def iter_import_rows(
+    lines: AsyncIterator[str],
+    fmt: str
+) -> AsyncIterator[tuple[int, Union[BookCreate, BookImportError]]]:
+    """
+    업로드 행을 BookCreate로 검증하여 (행 번호, BookCreate 또는 BookImportError)로 반환
+
+    - ndjson: 한 줄에 JSON 객체 하나
+    - csv: 첫 줄은 헤더, authors/categories는 '|'로 구분 (따옴표 안 줄바꿈 미지원)
+    - 행 번호는 빈 줄과 CSV 헤더를 제외한 1부터 시작
+    """
+    header = None
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        if fmt == "csv" and header is None:
+            header = [name.strip() for name in next(csv.reader([line]))]
+            continue
+
+        row_number += 1
+        raw = None
+        try:
+            raw = _csv_row(header, line) if fmt == "csv" else json.loads(line)
+            yield row_number, BookCreate.model_validate(raw)
+        except json.JSONDecodeError as e:
+            yield row_number, BookImportError(
+                row=row_number,
+                code="INVALID_FORMAT",
+                message="JSON 형식이 올바르지 않습니다",
+                details={"error": str(e)}
+            )
+        except ValidationError as e:
+            yield row_number, BookImportError(
+                row=row_number,
+                isbn=raw.get("isbn") if isinstance(raw, dict) else None,
+                code="VALIDATION_FAILED",
+                message="입력값 검증 실패",
+                details={
+                    ".".join(str(loc) for loc in error["loc"]) or "row": error["msg"]
+                    for error in e.errors()
+                }
+            )
+
+
+async def _insert_chunk(db: AsyncSession, rows: list[tuple[int, BookCreate]]) -> list[BookImportError]:
+    """이미 등록된 ISBN을 제외하고 books/book_authors/book_categories에 다중 행 INSERT"""
+    existing = set(await db.scalars(
+        select(Book.isbn).where(Book.isbn.in_([book.isbn for _, book in rows]))
+    ))
+    errors = [
+        BookImportError(
+            row=row_number,
+            isbn=book.isbn,
+            code="DUPLICATE_ISBN",
+            message="이미 등록된 ISBN입니다"
+        )
+        for row_number, book in rows if book.isbn in existing
+    ]
+    rows = [(row_number, book) for row_number, book in rows if book.isbn not in existing]
+    if not rows:
+        return errors
+
+    author_ids = await get_or_create_ids(db, Author, (name for _, book in rows for name in book.authors))
+    category_ids = await get_or_create_ids(db, Category, (name for _, book in rows for name in book.categories))
+
+    await db.execute(insert(Book.__table__), [
+        {
+            "title": book.title,
+            "description": book.description,
+            "isbn": book.isbn,
+            "cover_image_url": book.cover_image_url,
+            "price": book.price,
+            "publication_date": book.publication_date,
+            "author_names": searchable_authors(dict.fromkeys(book.authors))
+        }
+        for _, book in rows
+    ])
+    # MySQL은 다중 행 INSERT의 id를 돌려주지 않으므로 ISBN(UNIQUE)으로 조회
+    book_ids = dict((await db.execute(
+        select(Book.isbn, Book.id).where(Book.isbn.in_([book.isbn for _, book in rows]))
+    )).all())
+
+    await db.execute(insert(BookAuthor.__table__), [
+        {"book_id": book_ids[book.isbn], "author_id": author_id}
+        for _, book in rows
+        for author_id in dict.fromkeys(author_ids[name] for name in book.authors)
+    ])
+    await db.execute(insert(BookCategory.__table__), [
+        {"book_id": book_ids[book.isbn], "category_id": category_id}
+        for _, book in rows
+        for category_id in dict.fromkeys(category_ids[name] for name in book.categories)
+    ])
+    return errors
+
+
+async def import_chunk(db: AsyncSession, rows: list[tuple[int, BookCreate]]) -> list[BookImportError]:
+    """
+    검증된 행 묶음을 한 트랜잭션으로 저장하고 실패한 행의 오류 목록을 반환
+
+    동시 등록(IntegrityError), 잘못된 값(DataError), 잠금 대기 시간 초과(OperationalError) 등
+    DB 오류로 묶음 전체가 실패하면 롤백 후 묶음의 모든 행을 오류로 보고합니다.
+    이전 묶음은 이미 커밋되었으므로 요청을 중단하지 않고 다음 묶음을 계속 처리합니다.
+    """
+    try:
+        errors = await _insert_chunk(db, rows)
+        await db.commit()
+    except SQLAlchemyError as e:
+        await db.rollback()
+        errors = [
+            BookImportError(
+                row=row_number,
+                isbn=book.isbn,
+                code="CHUNK_FAILED",
+                message="같은 묶음의 저장이 실패하여 등록되지 않았습니다",
+                details={"error": str(getattr(e, "orig", None) or e)}
+            )
+            for row_number, book in rows
+        ]
+    # 묶음마다 조회한 저자/카테고리 엔티티가 세션에 쌓이지 않도록 비움
+    db.expunge_all()
+    return errors
@@ -0,0 +1,184 @@
+"""도서 조회 Read-through 캐시 (Redis)"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from src.config import settings
+from src.redis import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# 목록 캐시 버전 - 관리자 쓰기 시 INCR 하면 이전 버전 키는 모두 무효 (O(1))
+BOOK_LIST_VERSION_KEY = "cache:books:version"
+
+# 모니터링용 캐시 적중/실패 카운터 (프로세스 단위)
+cache_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+
+def book_detail_key(book_id: int) -> str:
+    """도서 상세 캐시 키"""
+    return f"cache:books:detail:{book_id}"
+
+
+async def book_list_key(params: dict) -> Optional[str]:
+    """현재 목록 버전과 쿼리 파라미터로 도서 목록 캐시 키 생성 (Redis 장애 시 None)"""
+    if not settings.BOOK_CACHE_ENABLED:
+        return None
+    try:
+        version = await async_redis_client.get(BOOK_LIST_VERSION_KEY) or "0"
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache version lookup failed", exc_info=True)
+        return None
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"cache:books:list:v{version}:{digest}"
+
+
+async def cache_get_raw(key: Optional[str]) -> Optional[str]:
+    """캐시된 JSON 문자열 조회 (검증하지 않음, 없거나 Redis 장애 시 None)"""
+    if key is None or not settings.BOOK_CACHE_ENABLED:
+        return None
+    try:
+        raw = await async_redis_client.get(key)
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache get failed: %s", key, exc_info=True)
+        return None
+
+    if raw is None:
+        cache_stats["misses"] += 1
+        return None
+    cache_stats["hits"] += 1
+    return raw
+
+
+async def cache_get(key: Optional[str], model: type[T]) -> Optional[T]:
+    """캐시 조회 (없거나 Redis 장애 시 None)"""
+    raw = await cache_get_raw(key)
+    return model.model_validate_json(raw) if raw is not None else None
+
+
+async def cache_set_raw(key: Optional[str], raw: str) -> None:
+    """이미 직렬화된 JSON 저장 (TTL 적용, 실패해도 요청은 계속 진행)"""
+    if key is None or not settings.BOOK_CACHE_ENABLED:
+        return
+    try:
+        await async_redis_client.setex(key, settings.BOOK_CACHE_TTL_SECONDS, raw)
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache set failed: %s", key, exc_info=True)
+
+
+async def cache_set(key: Optional[str], value: BaseModel) -> None:
+    """캐시 저장 (TTL 적용, 실패해도 요청은 계속 진행)"""
+    if key is None or not settings.BOOK_CACHE_ENABLED:
+        return
+    await cache_set_raw(key, value.model_dump_json())
+
+
+async def cache_get_many(keys: list[str], model: type[T]) -> list[Optional[T]]:
+    """여러 키를 MGET 1회로 조회 (키 순서대로, 없거나 Redis 장애 시 None)"""
+    if not keys or not settings.BOOK_CACHE_ENABLED:
+        return [None] * len(keys)
+    try:
+        raws = await async_redis_client.mget(keys)
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache mget failed", exc_info=True)
+        return [None] * len(keys)
+
+    values = []
+    for raw in raws:
+        if raw is None:
+            cache_stats["misses"] += 1
+            values.append(None)
+        else:
+            cache_stats["hits"] += 1
+            values.append(model.model_validate_json(raw))
+    return values
+
+
+async def cache_set_many(values: dict[str, BaseModel]) -> None:
+    """여러 항목을 파이프라인 1회로 저장 (TTL 적용, 실패해도 요청은 계속 진행)"""
+    if not values or not settings.BOOK_CACHE_ENABLED:
+        return
+    try:
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.setex(key, settings.BOOK_CACHE_TTL_SECONDS, value.model_dump_json())
+            await pipe.execute()
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache mset failed", exc_info=True)
+
+
+# 지연 재무효화 작업 (완료 전 GC 방지용 참조)
+_pending_invalidations: set[asyncio.Task] = set()
+
+
+def _invalidate_again_after_replica_lag(invalidate, *args) -> None:
+    """
+    복제본 사용 시 REPLICA_MAX_LAG_SECONDS 후 한 번 더 무효화
+
+    무효화 직후 아직 복제되지 않은 복제본 데이터로 캐시가 다시 채워졌을 수 있으므로,
+    허용 지연이 지난 뒤 그 사이에 저장된 항목을 버립니다.
+    """
+    if not settings.ASYNC_REPLICA_DATABASE_URL:
+        return
+    loop = asyncio.get_running_loop()
+
+    def run():
+        task = loop.create_task(invalidate(*args))
+        _pending_invalidations.add(task)
+        task.add_done_callback(_pending_invalidations.discard)
+
+    loop.call_later(settings.REPLICA_MAX_LAG_SECONDS, run)
+
+
+async def invalidate_books(book_id: Optional[int] = None) -> None:
+    """도서 쓰기 후 캐시 무효화 - 목록 버전 증가 + 해당 도서 상세 키 삭제"""
+    if not settings.BOOK_CACHE_ENABLED:
+        return
+    await _invalidate_books(book_id)
+    _invalidate_again_after_replica_lag(_invalidate_books, book_id)
+
+
+async def _invalidate_books(book_id: Optional[int]) -> None:
+    try:
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.incr(BOOK_LIST_VERSION_KEY)
+            if book_id is not None:
+                pipe.delete(book_detail_key(book_id))
+            await pipe.execute()
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache invalidation failed", exc_info=True)
+
+
+async def invalidate_book_detail(book_id: int) -> None:
+    """
+    집계(리뷰/댓글/라이브러리/위시리스트 수) 변경 후 해당 도서 상세 키만 삭제
+
+    변경이 잦으므로 목록 버전은 올리지 않으며, 목록의 집계는 TTL 동안 이전 값일 수 있습니다.
+    """
+    if not settings.BOOK_CACHE_ENABLED:
+        return
+    await _invalidate_book_detail(book_id)
+    _invalidate_again_after_replica_lag(_invalidate_book_detail, book_id)
+
+
+async def _invalidate_book_detail(book_id: int) -> None:
+    try:
+        await async_redis_client.delete(book_detail_key(book_id))
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("book cache invalidation failed", exc_info=True)
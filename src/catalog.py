@@ -0,0 +1,58 @@
+"""저자/카테고리 일괄 get-or-create 유틸리티"""
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _find_rows(db: AsyncSession, model, names: list[str], all_exist: bool = False) -> dict:
+    """
+    요청한 이름별 기존 행 조회 (IN 쿼리 1회, 필요 시 이름별 쿼리)
+
+    같은 이름인지는 컬럼 collation이 결정합니다. IN 결과 중 요청 문자열과 정확히 같지 않은 행
+    (대소문자/악센트/후행 공백만 다른 행 - 예: 'Cafe' 요청에 'Café' 행)이 있으면, 아직 매칭되지 않은
+    이름은 name = :name 으로 하나씩 다시 조회하여 DB가 같다고 판단한 행을 사용합니다.
+    all_exist: 모든 이름의 행이 있음이 보장된 경우 (생성 직후 - 요청 안에서 collation상 같은 이름이
+    한 행으로 합쳐졌을 수 있으므로 매칭되지 않은 이름은 항상 다시 조회)
+    """
+    rows = (await db.scalars(select(model).where(model.name.in_(names)))).all()
+    by_name = {row.name: row for row in rows}
+    found = {name: by_name[name] for name in names if name in by_name}
+
+    if len(found) < len(names) and (all_exist or len(by_name) > len(set(found.values()))):
+        for name in names:
+            if name not in found:
+                row = await db.scalar(select(model).where(model.name == name))
+                if row is not None:
+                    found[name] = row
+    return found
+
+
+async def get_or_create_ids(db: AsyncSession, model, names: Iterable[str]) -> dict[str, int]:
+    """
+    이름 목록을 id로 변환 (없는 이름은 생성)
+
+    - 기존 행은 IN 쿼리 1회로 조회 (표기만 다른 이름은 이름별 조회로 보완)
+    - 없는 이름은 다중 행 INSERT ... ON DUPLICATE KEY 1회로 생성
+      (다른 관리자가 동시에 같은 이름을 생성하거나 요청 안에 collation상 같은 이름이 있어도
+      UNIQUE(name) 충돌 없이 기존 행 사용)
+    - 생성한 행의 id는 같은 방식으로 다시 조회
+
+    조회한 엔티티는 세션 identity map에 남으므로 이후 db.get(model, id)는 추가 쿼리 없이 반환됩니다.
+    반환값: {요청한 이름: id}
+    """
+    unique_names = list(dict.fromkeys(names))
+    if not unique_names:
+        return {}
+
+    found = await _find_rows(db, model, unique_names)
+
+    missing = [name for name in unique_names if name not in found]
+    if missing:
+        # 동시 생성으로 이미 존재하면 갱신 없이 그대로 둠 (id = id)
+        stmt = insert(model).values([{"name": name} for name in missing])
+        await db.execute(stmt.on_duplicate_key_update(id=model.id))
+        found.update(await _find_rows(db, model, missing, all_exist=True))
+
+    return {name: found[name].id for name in unique_names}
@@ -19,17 +19,100 @@ class Settings:
         "DATABASE_URL",
         f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}" 
     )
+    # 비동기 라우터용 (aiomysql 드라이버)
+    ASYNC_DATABASE_URL: str = os.getenv(
+        "ASYNC_DATABASE_URL",
+        DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+    )
     
+    # 읽기 전용 복제본 (비어 있으면 조회도 primary 사용)
+    REPLICA_DATABASE_URL: str = os.getenv("REPLICA_DATABASE_URL", "")
+    ASYNC_REPLICA_DATABASE_URL: str = os.getenv(
+        "ASYNC_REPLICA_DATABASE_URL",
+        REPLICA_DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+    )
+    # 쓰기 후 이 시간(초) 동안 같은 호출자의 조회는 primary 사용 (read-your-writes)
+    REPLICA_STICKY_SECONDS: int = int(os.getenv("REPLICA_STICKY_SECONDS", 5))
+    # 복제 지연이 이보다 크면 primary 사용
+    REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 2))
+    REPLICA_CHECK_INTERVAL_SECONDS: float = float(os.getenv("REPLICA_CHECK_INTERVAL_SECONDS", 5))
+
+    # 커넥션 풀 (워커 프로세스마다, 동기/비동기 엔진 각각 적용)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    # 커넥션을 얻지 못하면 이 시간(초) 후 실패
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 300))
+    # always: 체크아웃마다 ping, idle: DB_POOL_PING_IDLE_SECONDS 이상 쉰 커넥션만 ping, off: ping 안 함
+    DB_POOL_PRE_PING: str = os.getenv("DB_POOL_PRE_PING", "idle")
+    DB_POOL_PING_IDLE_SECONDS: float = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", 30))
+
     #JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your_secret_key")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
+    # JWT 백엔드 (jose: python-jose, hmac: 표준 라이브러리 HS256/384/512 전용 - 더 빠름)
+    JWT_BACKEND: str = os.getenv("JWT_BACKEND", "jose")
+    # 검증된 토큰 페이로드 캐시 최대 항목 수 (0이면 비활성화)
+    JWT_CACHE_MAXSIZE: int = int(os.getenv("JWT_CACHE_MAXSIZE", 10000))
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+    # 사용자당 동시에 유지할 Refresh Token family(로그인 기기) 수
+    REFRESH_TOKEN_MAX_FAMILIES: int = int(os.getenv("REFRESH_TOKEN_MAX_FAMILIES", 10))
 
     #Redis
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB: int = int(os.getenv("REDIS_DB", 0))
+    # 워커 프로세스당 클라이언트(동기/비동기 각각) 커넥션 풀
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    REDIS_POOL_TIMEOUT_MS: int = int(os.getenv("REDIS_POOL_TIMEOUT_MS", 100))
+    REDIS_SOCKET_TIMEOUT_MS: int = int(os.getenv("REDIS_SOCKET_TIMEOUT_MS", 200))
+    REDIS_CONNECT_TIMEOUT_MS: int = int(os.getenv("REDIS_CONNECT_TIMEOUT_MS", 200))
+    # 토큰 관리 명령 차단기 (연속 실패 횟수, 열린 뒤 재시도까지 대기 시간)
+    REDIS_CIRCUIT_FAILURES: int = int(os.getenv("REDIS_CIRCUIT_FAILURES", 5))
+    REDIS_CIRCUIT_RESET_SECONDS: float = float(os.getenv("REDIS_CIRCUIT_RESET_SECONDS", 10))
+
+    # 레이트리밋 (Redis 공유 카운터, 실패/지연 시 워커별 메모리 카운터로 전환)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_STORAGE_URI: str = os.getenv(
+        "RATE_LIMIT_STORAGE_URI",
+        f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+    )
+    # sliding-window-counter, moving-window, fixed-window
+    RATE_LIMIT_STRATEGY: str = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+    RATE_LIMIT_REDIS_TIMEOUT_MS: int = int(os.getenv("RATE_LIMIT_REDIS_TIMEOUT_MS", 50))
+    RATE_LIMIT_DEFAULT: str = os.getenv("RATE_LIMIT_DEFAULT", "60/minute")
+    RATE_LIMIT_LOGIN: str = os.getenv("RATE_LIMIT_LOGIN", "5/minute")
+    RATE_LIMIT_WRITE: str = os.getenv("RATE_LIMIT_WRITE", "30/minute")
+
+    # 도서 조회 캐시 (Redis)
+    BOOK_CACHE_ENABLED: bool = os.getenv("BOOK_CACHE_ENABLED", "true").lower() == "true"
+    BOOK_CACHE_TTL_SECONDS: int = int(os.getenv("BOOK_CACHE_TTL_SECONDS", 300))
+    # 캐시된/한 번 직렬화한 payload JSON을 다시 검증하지 않고 응답 본문에 그대로 사용 (src.responses)
+    FAST_JSON_RESPONSES: bool = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+    # 도서 검색 백엔드 (mysql: FULLTEXT 인덱스, memory: 프로세스 내 역색인)
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "mysql")
+
+    # 인증 사용자 캐시 (프로세스 내 LRU)
+    USER_CACHE_MAXSIZE: int = int(os.getenv("USER_CACHE_MAXSIZE", 10000))
+    USER_CACHE_TTL_SECONDS: int = int(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+
+    # 폐기 토큰 필터 (워커별 Bloom 필터, 적중 시에만 Redis 블랙리스트 확인)
+    REVOKED_TOKEN_FILTER_CAPACITY: int = int(os.getenv("REVOKED_TOKEN_FILTER_CAPACITY", 100000))
+    REVOKED_TOKEN_FILTER_ERROR_RATE: float = float(os.getenv("REVOKED_TOKEN_FILTER_ERROR_RATE", 0.001))
+    REVOKED_TOKEN_FILTER_REBUILD_SECONDS: float = float(os.getenv("REVOKED_TOKEN_FILTER_REBUILD_SECONDS", 300))
+
+    # 비밀번호 해싱 프로세스 풀 (0이면 기본 스레드풀 사용)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    # 대기/실행 중인 해싱 작업 한도 (초과 시 503)
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+
+    # 쿼리 점검 (요청별 문장 형태 집계 후 같은 형태가 임계값 이상 반복되면 N+1 의심 경고)
+    QUERY_DEBUG: bool = os.getenv("QUERY_DEBUG", "false").lower() == "true"
+    QUERY_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", 10))
+    # 느린 쿼리 로그 기준(ms, 0이면 비활성화)
+    SLOW_QUERY_MS: int = int(os.getenv("SLOW_QUERY_MS", 500))
 
     # Google OAuth
     GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
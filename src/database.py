@@ -1,21 +1,114 @@
 """
 Database 연결 설정
 """
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from src.config import settings
+from src.metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+    instrument_pool,
+)
+
+
+def pool_options(name: str) -> dict:
+    """Settings의 커넥션 풀 설정 (엔진 워커 프로세스 1개 기준)"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # always: 체크아웃마다 ping, idle: 오래 쉰 커넥션만 ping(ping_idle_connections), off: ping 안 함
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+        "pool_logging_name": name,
+    }
+
+
+def ping_idle_connections(engine, idle_seconds: float) -> None:
+    """
+    idle_seconds 이상 풀에서 쉬고 있던 커넥션만 체크아웃 시 ping
+
+    연속 요청에서 재사용되는 커넥션은 왕복을 생략하고, 서버가 끊었을 수 있는 커넥션만 확인합니다.
+    ping이 실패하면 DisconnectionError로 풀이 새 커넥션을 연결해 다시 체크아웃합니다.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(engine, "checkin")
+    def _mark_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.pop("checked_in_at", None)
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise exc.DisconnectionError("idle connection ping failed") from e
+
 
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False
+    poolclass=InstrumentedQueuePool,
+    echo=False,
+    **pool_options("sync")
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (async def 라우터용 - 이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    echo=False,
+    **pool_options("async")
+)
+
+# 읽기 전용 복제본 엔진 (조회 라우트용, src.replica.get_read_db)
+replica_async_engine = create_async_engine(
+    settings.ASYNC_REPLICA_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    echo=False,
+    **pool_options("replica")
+) if settings.ASYNC_REPLICA_DATABASE_URL else None
+
+if settings.DB_POOL_PRE_PING == "idle":
+    ping_idle_connections(engine, settings.DB_POOL_PING_IDLE_SECONDS)
+    ping_idle_connections(async_engine, settings.DB_POOL_PING_IDLE_SECONDS)
+    if replica_async_engine is not None:
+        ping_idle_connections(replica_async_engine, settings.DB_POOL_PING_IDLE_SECONDS)
+
+# 쿼리 수/시간, 커넥션 풀 메트릭 (/metrics)
+instrument_engine(engine)
+instrument_engine(async_engine)
+instrument_pool(engine, "sync")
+instrument_pool(async_engine, "async")
+if replica_async_engine is not None:
+    instrument_engine(replica_async_engine)
+    instrument_pool(replica_async_engine, "replica")
+
+# commit 후 lazy load(MissingGreenlet)를 피하기 위해 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+) if replica_async_engine is not None else None
+
 Base = declarative_base()
 
 
@@ -26,3 +119,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """비동기 DB 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
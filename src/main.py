@@ -2,12 +2,18 @@
 from src.config import settings
 
 #FastAPI
-from datetime import datetime
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 from src.routers import users, auth, books, health, reviews, comments, library, wishlist
 from src.auth.jwt import APIException
-from src.schema.common import ErrorResponse
+from src.schema.common import error_response
+from src.auth.user_cache import start_user_cache_listener
+from src.auth.revocation import start_revocation_listener, stop_revocation_listener
+from src.auth.password import shutdown_password_executor
+from src.metrics import MetricsMiddleware, registry, CONTENT_TYPE
+from src.redis import async_redis_pool, RedisUnavailableError
+from redis.exceptions import RedisError
 
 #CORS
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,9 +21,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 #레이트리밋
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIASGIMiddleware
+from src.rate_limit import limiter
+#읽기 복제본 (쓰기 후 primary 고정)
+from src.replica import ReadYourWritesMiddleware
 
 import uvicorn
 
@@ -26,9 +34,6 @@ import uvicorn
 ## 서버실행
 PORT_NUM = settings.PORT_NUM
 
-#레이트리밋 설정 (IP 기반, 분당 60회 기본 제한)
-limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
-
 #API 문서 메타데이터
 tags_metadata = [
     {
@@ -66,8 +71,23 @@ tags_metadata = [
     },
 ]
 
+#앱 시작/종료 훅
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 사용자 캐시 무효화 채널 구독 (Redis 미연결 시 TTL 만료에 의존)
+    listener = start_user_cache_listener()
+    # 폐기 토큰 필터 적재 및 구독 (실패 시 요청마다 Redis 블랙리스트 확인)
+    revocation_listener = start_revocation_listener()
+    yield
+    if listener is not None:
+        listener.stop()
+    stop_revocation_listener(revocation_listener)
+    # 이벤트 루프와 묶인 비동기 Redis 커넥션 정리
+    await async_redis_pool.disconnect()
+    shutdown_password_executor()
+
 #FastAPI 인스턴스 생성
-app = FastAPI(openapi_tags = tags_metadata)
+app = FastAPI(openapi_tags = tags_metadata, lifespan=lifespan)
 
 #CORS 설정 (테스트용 허용 도메인)
 origins = [
@@ -79,6 +99,13 @@ origins = [
     "http://127.0.0.1:5500",
 ]
 
+# 성공한 쓰기 요청의 호출자를 잠시 primary에 고정 (가장 안쪽 미들웨어)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# 기본 한도는 미들웨어, 로그인/쓰기 한도는 라우트 데코레이터에서 검사
+# (CORS 안쪽에 두어 429 응답에도 CORS 헤더가 붙도록 먼저 등록)
+app.add_middleware(SlowAPIASGIMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,        # 허용할 도메인 목록
@@ -93,22 +120,21 @@ app.add_middleware(
     secret_key=settings.SECRET_KEY
 )
 
+# 메트릭 수집 (가장 바깥 미들웨어로 등록하여 CORS/세션 처리 시간까지 포함)
+app.add_middleware(MetricsMiddleware)
+
 #레이트리밋 등록
 app.state.limiter = limiter
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
     """레이트리밋 초과 시 ErrorResponse 형식으로 반환"""
-    return JSONResponse(
+    return error_response(
         status_code=429,
-        content=ErrorResponse(
-            timestamp=datetime.now(),
-            path=str(request.url.path),
-            status=429,
-            code="TOO_MANY_REQUESTS",
-            message="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
-            details={"limit": str(exc.detail)}
-        ).model_dump(mode="json")
+        code="TOO_MANY_REQUESTS",
+        message="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+        path=request.url.path,
+        details={"limit": str(exc.detail)}
     )
 
 app.include_router(users.router)
@@ -123,19 +149,41 @@ app.include_router(health.router)
 #전역 에러 처리
 @app.exception_handler(APIException)
 async def api_exception_handler(request: Request, exc: APIException):
-    """APIException을 ErrorResponse 형식으로 변환"""
-    return JSONResponse(
+    """APIException을 ErrorResponse 형식으로 변환 (라우터의 모든 오류 응답이 여기서 생성됨)"""
+    return error_response(
         status_code=exc.status_code,
-        content=ErrorResponse(
-            timestamp=datetime.now(),
-            path=str(request.url.path),
-            status=exc.status_code,
-            code=exc.code,
-            message=exc.message,
-            details=exc.details
-        ).model_dump(mode="json")
+        code=exc.code,
+        message=exc.message,
+        path=request.url.path,
+        details=exc.details
     )
 
+@app.exception_handler(RedisUnavailableError)
+async def token_store_unavailable_handler(request: Request, exc: RedisUnavailableError):
+    """토큰 저장소 차단기(token_breaker) 열림 시 503 반환"""
+    return error_response(
+        status_code=503,
+        code="SERVICE_UNAVAILABLE",
+        message="인증 저장소를 일시적으로 사용할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        path=request.url.path
+    )
+
+@app.exception_handler(RedisError)
+async def redis_error_handler(request: Request, exc: RedisError):
+    """처리되지 않은 Redis 장애(연결 실패/시간 초과 등) 시 503 반환"""
+    return error_response(
+        status_code=503,
+        code="SERVICE_UNAVAILABLE",
+        message="일시적으로 서비스를 사용할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        path=request.url.path
+    )
+
+#Prometheus 메트릭
+@app.get("/metrics", include_in_schema=False)
+@limiter.exempt
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
 #루트 엔드포인트
 @app.get("/")
 async def root():
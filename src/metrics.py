@@ -0,0 +1,441 @@
+"""
+Prometheus 텍스트 형식 메트릭 (외부 라이브러리/서비스 없이 프로세스 내 집계)
+
+- HTTP: 라우트 템플릿별 지연시간 히스토그램, 상태 코드별 요청 수, 처리 중 요청 수
+- DB: SQLAlchemy 엔진 이벤트로 쿼리 수/시간 집계 (요청 단위 히스토그램 포함)
+- 커넥션 풀: 커넥션 획득 대기시간, 사용 중/오버플로 커넥션 수, 포화도
+
+값은 워커 프로세스마다 따로 집계되므로 여러 워커 배포 시 Prometheus에서 워커별로 수집합니다.
+"""
+import threading
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.config import settings
+from src.query_debug import (
+    check_query_budget,
+    log_slow_query,
+    report_repeated_statements,
+    statement_shape,
+)
+
+# 기본 지연시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 매칭되는 라우트가 없는 요청(404 등)은 경로 대신 이 값으로 묶어 라벨 수가 늘지 않게 함
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """라벨 값 조합별 값을 보관하는 메트릭 기본 클래스"""
+    kind = ""
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    def _render_samples(self, items) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # [버킷별 개수..., 합계, 개수]
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0
+
+    def _render_samples(self, items) -> list[str]:
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += state[i]
+                labels = _format_labels(self.labels, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {state[-1]}")
+        return lines
+
+
+class CallbackGauge(_Metric):
+    """조회 시점에 callback으로 값을 읽는 게이지 (callback은 {라벨 값 튜플: 값} 반환)"""
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...], callback):
+        super().__init__(name, description, labels)
+        self._callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples(sorted(self._callback().items())))
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self) -> None:
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ==================== HTTP ====================
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total",
+    "Total HTTP requests by route template and status code",
+    ("method", "route", "status")
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds by route template",
+    ("method", "route")
+))
+http_requests_in_progress = registry.register(Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being processed"
+))
+
+# ==================== DB ====================
+
+db_queries_total = registry.register(Counter(
+    "db_queries_total",
+    "Total SQL statements executed"
+))
+db_query_duration_seconds = registry.register(Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time in seconds"
+))
+http_request_db_queries = registry.register(Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request by route template",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS
+))
+http_request_db_seconds = registry.register(Histogram(
+    "http_request_db_seconds",
+    "Total SQL execution time per HTTP request in seconds by route template",
+    ("method", "route")
+))
+db_slow_queries_total = registry.register(Counter(
+    "db_slow_queries_total",
+    "SQL statements slower than SLOW_QUERY_MS by route template",
+    ("method", "route")
+))
+db_suspected_n_plus_one_total = registry.register(Counter(
+    "db_suspected_n_plus_one_total",
+    "Requests repeating one statement shape QUERY_N_PLUS_ONE_THRESHOLD times or more (QUERY_DEBUG only)",
+    ("method", "route")
+))
+http_request_query_budget_exceeded_total = registry.register(Counter(
+    "http_request_query_budget_exceeded_total",
+    "Requests exceeding the route's declared query budget",
+    ("method", "route")
+))
+
+
+# ==================== 커넥션 풀 ====================
+
+db_pool_checkout_seconds = registry.register(Histogram(
+    "db_pool_checkout_seconds",
+    "Time to obtain a pooled connection (queue wait, new connection, liveness ping)",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+))
+db_pool_checkout_timeouts_total = registry.register(Counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that gave up after DB_POOL_TIMEOUT",
+    ("pool",)
+))
+
+# 이름별 엔진 (dispose 후 새 풀이 만들어져도 engine.pool로 현재 풀을 읽음)
+_pooled_engines: dict[str, object] = {}
+
+
+def _pool_values(read) -> dict[tuple[str, ...], float]:
+    values = {}
+    for name, engine in list(_pooled_engines.items()):
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            values[(name,)] = read(pool)
+    return values
+
+
+def _pool_saturation(pool: QueuePool) -> float:
+    # 풀 최대 커넥션 수(pool_size + max_overflow) 대비 사용 중인 커넥션 비율
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    return pool.checkedout() / capacity if capacity else 0.0
+
+
+registry.register(CallbackGauge(
+    "db_pool_size", "Configured pool_size", ("pool",),
+    lambda: _pool_values(lambda pool: pool.size())
+))
+registry.register(CallbackGauge(
+    "db_pool_checked_out", "Connections currently checked out", ("pool",),
+    lambda: _pool_values(lambda pool: pool.checkedout())
+))
+registry.register(CallbackGauge(
+    "db_pool_overflow", "Overflow connections currently open beyond pool_size", ("pool",),
+    lambda: _pool_values(lambda pool: max(pool.overflow(), 0))
+))
+registry.register(CallbackGauge(
+    "db_pool_saturation", "Checked-out connections / (pool_size + max_overflow)", ("pool",),
+    lambda: _pool_values(_pool_saturation)
+))
+
+
+class _CheckoutTimingMixin:
+    """connect() 소요 시간(획득 대기 + 새 연결 + ping)을 풀 이름(pool_logging_name) 라벨로 기록"""
+
+    def connect(self):
+        name = getattr(self, "logging_name", None) or "default"
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts_total.inc(pool=name)
+            raise
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started, pool=name)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(engine, name: str) -> None:
+    """풀 상태 게이지(db_pool_*)에 엔진 등록 (풀 종류가 QueuePool일 때만 값이 나옴)"""
+    _pooled_engines[name] = getattr(engine, "sync_engine", engine)
+
+
+class QueryStats:
+    """한 요청에서 실행된 쿼리 수/시간 (QUERY_DEBUG일 때 문장 형태별 횟수 포함)"""
+    __slots__ = ("count", "seconds", "shapes", "scope")
+
+    def __init__(self, scope: Optional[dict] = None, track_shapes: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Optional[StatementCounter] = StatementCounter() if track_shapes else None
+        self.scope = scope
+
+    def labels(self) -> dict:
+        """method/route 라벨 (라우팅 전이면 매칭 전 상태로 표시)"""
+        if self.scope is None:
+            return {"method": "-", "route": "-"}
+        route = self.scope.get("route")
+        return {
+            "method": self.scope["method"],
+            "route": getattr(route, "path", None) or UNMATCHED_ROUTE
+        }
+
+
+# 요청 단위 집계 (sync 핸들러의 스레드풀, AsyncSession의 greenlet에도 컨텍스트가 복사되어 같은 객체를 공유)
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 쿼리 집계 (요청 밖이면 None)"""
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    _record_query(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리도 실행 시간을 집계하고 시작 시각 스택을 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        _record_query(exception_context.statement or "", elapsed)
+
+
+def _record_query(statement: str, elapsed: float) -> None:
+    db_queries_total.inc()
+    db_query_duration_seconds.observe(elapsed)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if stats.shapes is not None:
+            stats.shapes[statement_shape(statement)] += 1
+
+    labels = stats.labels() if stats is not None else {"method": "-", "route": "-"}
+    if log_slow_query(statement, elapsed, **labels):
+        db_slow_queries_total.inc(**labels)
+
+
+def instrument_engine(engine) -> None:
+    """엔진(동기/비동기)에 쿼리 집계 이벤트 등록 (중복 등록 시 무시)"""
+    engine = getattr(engine, "sync_engine", engine)
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# ==================== 미들웨어 ====================
+
+class MetricsMiddleware:
+    """
+    요청 지연시간/상태 코드/쿼리 수 집계 ASGI 미들웨어
+
+    라우트 라벨은 라우팅 후 scope["route"]의 경로 템플릿(/api/books/{book_id})을 사용합니다.
+    요청이 끝나면 라우트의 쿼리 예산(query_budget)과 N+1 의심 패턴(QUERY_DEBUG)을 점검합니다.
+    """
+
+    def __init__(self, app, exclude_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = QueryStats(scope, track_shapes=settings.QUERY_DEBUG)
+        token = _query_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            _query_stats.reset(token)
+
+            labels = stats.labels()
+            http_requests_total.inc(**labels, status=str(status))
+            http_request_duration_seconds.observe(elapsed, **labels)
+            http_request_db_queries.observe(stats.count, **labels)
+            http_request_db_seconds.observe(stats.seconds, **labels)
+
+            route = scope.get("route")
+            if check_query_budget(getattr(route, "endpoint", None), count=stats.count, shapes=stats.shapes, **labels):
+                http_request_query_budget_exceeded_total.inc(**labels)
+            if stats.shapes and report_repeated_statements(stats.shapes, **labels):
+                db_suspected_n_plus_one_total.inc(**labels)
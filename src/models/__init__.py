@@ -16,6 +16,7 @@ from src.models.wishlist_item import WishlistItem
 from src.models.library_item import LibraryItem
 from src.models.order import Order
 from src.models.order_item import OrderItem
+from src.models.book_stats import BookStats
 
 __all__ = [
     "User",
@@ -33,4 +34,5 @@ __all__ = [
     "LibraryItem",
     "Order",
     "OrderItem",
+    "BookStats",
 ]
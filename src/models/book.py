@@ -1,5 +1,5 @@
 """Book Model"""
-from sqlalchemy import Column, BigInteger, String, Text, DECIMAL, Date, TIMESTAMP, text
+from sqlalchemy import Column, BigInteger, String, Text, DECIMAL, Date, TIMESTAMP, Index, text
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -17,6 +17,13 @@ class Book(Base):
     created_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
     deleted_at = Column(TIMESTAMP, nullable=True, index=True)
+    # 전문 검색용 저자 이름 (book_authors 비정규화, 도서 등록/수정 시 갱신)
+    author_names = Column(Text)
+
+    __table_args__ = (
+        Index("idx_books_deleted_created", "deleted_at", "created_at", "id"),
+        Index("ft_books_search", "title", "description", "author_names", mysql_prefix="FULLTEXT"),
+    )
 
     # Relationships
     authors = relationship("Author", secondary="book_authors", back_populates="books")
@@ -27,3 +34,5 @@ class Book(Base):
     wishlist_items = relationship("WishlistItem", back_populates="book", cascade="all, delete-orphan")
     library_items = relationship("LibraryItem", back_populates="book")
     order_items = relationship("OrderItem", back_populates="book")
+    # 집계 행 (없을 수 있음, 조회 시 joinedload로 함께 로드)
+    stats = relationship("BookStats", uselist=False, viewonly=True)
@@ -0,0 +1,22 @@
+"""Book Stats Model"""
+from sqlalchemy import Column, BigInteger, Integer, TIMESTAMP, ForeignKey, text
+from src.database import Base
+
+
+class BookStats(Base):
+    """도서별 집계 (COUNT/AVG 대신 증분 갱신)"""
+    __tablename__ = "book_stats"
+
+    book_id = Column(BigInteger, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    comment_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    # 별점 합계와 1~5점 분포 (평균 = rating_sum / review_count)
+    rating_sum = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    rating_1 = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    rating_2 = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    rating_3 = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    rating_4 = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    rating_5 = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    library_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    wishlist_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
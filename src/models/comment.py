@@ -1,5 +1,5 @@
 """Comment Model"""
-from sqlalchemy import Column, BigInteger, Text, TIMESTAMP, ForeignKey, Index, text
+from sqlalchemy import Column, BigInteger, Integer, Text, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -11,12 +11,14 @@ class Comment(Base):
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     book_id = Column(BigInteger, ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
+    like_count = Column(Integer, nullable=False, default=0, server_default=text("0"))  # comment_likes 비정규화
     created_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
 
     __table_args__ = (
         Index("idx_comments_user", "user_id"),
         Index("idx_comments_book", "book_id"),
+        Index("idx_comments_book_created", "book_id", "created_at", "id"),
     )
 
     # Relationships
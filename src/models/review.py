@@ -12,12 +12,15 @@ class Review(Base):
     book_id = Column(BigInteger, ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
     rating = Column(Integer, nullable=False)  # 1-5
     content = Column(Text, nullable=False)
+    like_count = Column(Integer, nullable=False, default=0, server_default=text("0"))  # review_likes 비정규화
     created_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
 
     __table_args__ = (
         Index("idx_reviews_user_book", "user_id", "book_id"),
         Index("idx_reviews_book", "book_id"),
+        Index("idx_reviews_book_created", "book_id", "created_at", "id"),
+        Index("idx_reviews_book_likes", "book_id", "like_count", "created_at"),
         Index("idx_reviews_rating", "rating"),
     )
 
@@ -1,5 +1,5 @@
 """User Model"""
-from sqlalchemy import Column, BigInteger, String, Enum, TIMESTAMP, text
+from sqlalchemy import Column, BigInteger, String, Enum, TIMESTAMP, Index, text
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -15,6 +15,13 @@ class User(Base):
     created_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
 
+    __table_args__ = (
+        # 관리자용 사용자 목록 (role = 'user' + 가입일 커서)
+        Index("idx_users_role_created", "role", "created_at", "id"),
+        # 이름 접두어 검색
+        Index("idx_users_name", "name"),
+    )
+
     # Relationships
     reviews = relationship("Review", back_populates="user", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan")
@@ -13,6 +13,8 @@ class WishlistItem(Base):
 
     __table_args__ = (
         Index("idx_wishlist_items_book", "book_id"),
+        # 내 목록 추가일순 keyset 페이지네이션
+        Index("idx_wishlist_items_user_created", "user_id", "created_at", "book_id"),
     )
 
     # Relationships
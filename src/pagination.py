@@ -0,0 +1,94 @@
+"""Keyset(커서) 페이지네이션 유틸리티"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from sqlalchemy import and_, or_
+
+from src.auth.jwt import APIException
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def _invalid_cursor(cursor: str) -> APIException:
+    return APIException(
+        status_code=400,
+        code="INVALID_CURSOR",
+        message="유효하지 않은 커서입니다",
+        details={"cursor": cursor}
+    )
+
+
+def encode_cursor(created_at: datetime, last_id: int) -> str:
+    """(created_at, id)를 불투명한 커서 문자열로 인코딩"""
+    return _encode([created_at.isoformat(), last_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 디코딩"""
+    try:
+        created_at, last_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(last_id)
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise _invalid_cursor(cursor)
+
+
+def encode_score_cursor(score: float, last_id: int) -> str:
+    """검색 결과용 (관련도 점수, id) 커서 인코딩"""
+    return _encode([score, last_id])
+
+
+def decode_score_cursor(cursor: str) -> tuple[float, int]:
+    """검색 결과용 커서를 (관련도 점수, id)로 디코딩"""
+    try:
+        score, last_id = _decode(cursor)
+        return float(score), int(last_id)
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise _invalid_cursor(cursor)
+
+
+def encode_sort_cursor(value: Any, last_id: int) -> str:
+    """임의 정렬 키용 (정렬 값, id) 커서 인코딩 (datetime/Decimal은 문자열로)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    return _encode([value, last_id])
+
+
+def decode_sort_cursor(cursor: str, parse: Callable[[Any], Any]) -> tuple[Any, int]:
+    """임의 정렬 키용 커서를 (parse(정렬 값), id)로 디코딩"""
+    try:
+        value, last_id = _decode(cursor)
+        return parse(value), int(last_id)
+    except (ValueError, TypeError, ArithmeticError, binascii.Error, UnicodeError):
+        # Decimal 파싱 실패(InvalidOperation)는 ArithmeticError
+        raise _invalid_cursor(cursor)
+
+
+def seek_condition(created_col, id_col, created_at: datetime, last_id: int, ascending: bool):
+    """
+    (created_at, id) 정렬 기준으로 커서 이후의 행만 고르는 seek 조건
+
+    OFFSET 스캔 대신 인덱스 범위 탐색이 가능하도록 OR 형태로 전개합니다.
+    """
+    if ascending:
+        return or_(
+            created_col > created_at,
+            and_(created_col == created_at, id_col > last_id)
+        )
+    return or_(
+        created_col < created_at,
+        and_(created_col == created_at, id_col < last_id)
+    )
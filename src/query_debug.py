@@ -0,0 +1,125 @@
+"""
+요청 단위 쿼리 점검 (쿼리 예산, N+1 의심 패턴, 느린 쿼리 로그)
+
+- query_budget: 라우트 함수에 요청당 허용 쿼리 수를 선언 (초과 시 경고 로그 + 위반 기록)
+- QUERY_DEBUG: 요청마다 문장 형태를 모아 같은 형태가 임계값 이상 반복되면 N+1 의심으로 경고
+- SLOW_QUERY_MS: 이보다 오래 걸린 쿼리를 라우트와 함께 경고 로그로 기록
+
+집계는 src.metrics의 요청 컨텍스트(QueryStats)를 사용합니다.
+"""
+import logging
+import re
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 로그에 남기는 SQL 최대 길이
+_MAX_STATEMENT_LENGTH = 500
+
+# IN (%s, %s, ...) 처럼 바인딩 수만 다른 목록을 하나로 묶음
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?|%\([^)]*\)s)(?:\s*,\s*(?:%s|\?|%\([^)]*\)s))*\s*\)")
+_NUMBER_LITERAL = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """바인딩 값/목록 길이와 무관한 문장 형태 (같은 쿼리의 반복 판별용)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _NUMBER_LITERAL.sub("N", shape)
+
+
+def _truncate(statement: str) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > _MAX_STATEMENT_LENGTH:
+        return statement[:_MAX_STATEMENT_LENGTH] + "..."
+    return statement
+
+
+# ==================== 쿼리 예산 ====================
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    라우트 함수의 요청당 쿼리 예산 선언 (인증 사용자 조회 포함)
+
+    @router.get(...) 아래에 붙입니다.
+        @router.get("/books/{book_id}")
+        @query_budget(1)
+        async def get_book_detail(...): ...
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return decorator
+
+
+def get_query_budget(endpoint: Optional[Callable]) -> Optional[int]:
+    return getattr(endpoint, "__query_budget__", None)
+
+
+@dataclass(frozen=True)
+class QueryBudgetViolation:
+    method: str
+    route: str
+    budget: int
+    count: int
+    # QUERY_DEBUG일 때 가장 많이 반복된 문장 형태
+    top_statement: Optional[str] = None
+
+    def __str__(self) -> str:
+        message = f"{self.method} {self.route}: {self.count} queries (budget {self.budget})"
+        if self.top_statement:
+            message += f", most repeated: {self.top_statement}"
+        return message
+
+
+# 최근 예산 위반 기록 (테스트에서 검사, 운영에서는 최근 항목만 유지)
+budget_violations: deque[QueryBudgetViolation] = deque(maxlen=100)
+
+
+def check_query_budget(
+    endpoint: Optional[Callable],
+    method: str,
+    route: str,
+    count: int,
+    shapes: Optional[Counter] = None
+) -> Optional[QueryBudgetViolation]:
+    """선언된 예산을 초과하면 위반을 기록하고 반환"""
+    budget = get_query_budget(endpoint)
+    if budget is None or count <= budget:
+        return None
+
+    top_statement = None
+    if shapes:
+        top_statement = _truncate(shapes.most_common(1)[0][0])
+    violation = QueryBudgetViolation(method, route, budget, count, top_statement)
+    budget_violations.append(violation)
+    logger.warning("query budget exceeded: %s", violation)
+    return violation
+
+
+# ==================== N+1 / 느린 쿼리 ====================
+
+def find_repeated_statements(shapes: Counter, threshold: int) -> list[tuple[str, int]]:
+    """threshold번 이상 반복된 문장 형태 목록 (N+1 의심)"""
+    return [(shape, count) for shape, count in shapes.most_common() if count >= threshold]
+
+
+def report_repeated_statements(shapes: Counter, method: str, route: str) -> int:
+    """N+1 의심 문장을 경고 로그로 남기고 그 수를 반환"""
+    repeated = find_repeated_statements(shapes, settings.QUERY_N_PLUS_ONE_THRESHOLD)
+    for shape, count in repeated:
+        logger.warning("suspected N+1 on %s %s: %d x %s", method, route, count, _truncate(shape))
+    return len(repeated)
+
+
+def log_slow_query(statement: str, elapsed: float, method: str, route: str) -> bool:
+    """SLOW_QUERY_MS를 넘은 쿼리를 라우트와 함께 기록 (0이면 비활성화)"""
+    if settings.SLOW_QUERY_MS <= 0 or elapsed * 1000 < settings.SLOW_QUERY_MS:
+        return False
+    logger.warning("slow query on %s %s: %.1fms %s", method, route, elapsed * 1000, _truncate(statement))
+    return True
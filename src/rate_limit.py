@@ -0,0 +1,49 @@
+"""
+레이트리밋 (slowapi + Redis 저장소)
+
+- 카운터는 Redis에 저장되어 모든 워커가 같은 한도를 공유 (limits의 Lua 스크립트로 검사 1회당 왕복 1회)
+- 키: 인증 요청은 JWT sub(사용자), 그 외는 클라이언트 IP
+- 한도: 전체 기본(RATE_LIMIT_DEFAULT), 로그인(login_limit), 쓰기 API 공유(write_limit)
+- Redis 응답이 RATE_LIMIT_REDIS_TIMEOUT_MS를 넘거나 실패하면 워커별 메모리 카운터로 전환하고,
+  이후 주기적으로 Redis 복구를 확인
+"""
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from src.config import settings
+from src.auth.jwt import APIException, verify_token
+
+
+def rate_limit_key(request: Request) -> str:
+    """유효한 Access Token이면 사용자 기준, 아니면 IP 기준 키"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        # 서명을 검증한 sub만 사용 (임의 sub로 다른 사용자의 한도 소진/한도 우회 방지)
+        try:
+            user_id = verify_token(token, "access").get("sub")
+        except APIException:
+            user_id = None
+        if user_id is not None:
+            return f"user:{user_id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+_timeout = settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000
+
+limiter = Limiter(
+    key_func=rate_limit_key,
+    default_limits=[settings.RATE_LIMIT_DEFAULT],
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options={"socket_timeout": _timeout, "socket_connect_timeout": _timeout},
+    key_prefix="ratelimit",
+    in_memory_fallback_enabled=True,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+# 로그인 계열 라우트별 한도 (비밀번호 대입 방지)
+login_limit = limiter.limit(settings.RATE_LIMIT_LOGIN)
+
+# 쓰기(POST/PATCH/DELETE) 라우트 공유 한도 - 라우트마다가 아니라 합산
+write_limit = limiter.shared_limit(settings.RATE_LIMIT_WRITE, scope="write")
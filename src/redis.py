@@ -1,47 +1,240 @@
-"""Redis client for token management"""
-import redis
-from src.config import settings
+"""
+Redis client for token management
+
+- 동기/비동기 클라이언트 모두 Settings로 크기를 정한 BlockingConnectionPool 사용
+  (풀이 가득 차면 REDIS_POOL_TIMEOUT_MS까지만 대기)
+- 명령은 REDIS_SOCKET_TIMEOUT_MS 안에 응답하지 않으면 실패
+- 토큰 관리 명령은 차단기(token_breaker)를 거쳐, 연속 실패 시 REDIS_CIRCUIT_RESET_SECONDS 동안
+  Redis를 호출하지 않고 바로 RedisUnavailableError(503)로 실패
+- 로그인/로그아웃처럼 여러 명령이 필요한 흐름은 파이프라인으로 왕복 1회
+"""
+import threading
+import time
+from typing import Optional
 
+import redis
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
-# Redis 클라이언트 생성
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    decode_responses=True
+from src.config import settings
+from src.metrics import Gauge, registry
+
+
+def _pool_options() -> dict:
+    return {
+        "host": settings.REDIS_HOST,
+        "port": settings.REDIS_PORT,
+        "db": settings.REDIS_DB,
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT_MS / 1000,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT_MS / 1000,
+        "socket_connect_timeout": settings.REDIS_CONNECT_TIMEOUT_MS / 1000,
+        "decode_responses": True,
+    }
+
+
+# Redis 클라이언트 생성 (동기 라우터/의존성, pub/sub 구독 스레드용)
+redis_pool = redis.BlockingConnectionPool(**_pool_options())
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# 비동기 Redis 클라이언트 (async def 라우터용 - 이벤트 루프를 막지 않음)
+async_redis_pool = aioredis.BlockingConnectionPool(**_pool_options())
+async_redis_client = aioredis.Redis(connection_pool=async_redis_pool)
+
+
+# ==================== 차단기 ====================
+
+redis_circuit_open = registry.register(Gauge(
+    "redis_circuit_open",
+    "1 while the Redis circuit breaker is open",
+    ("name",)
+))
+
+
+class RedisUnavailableError(RedisError):
+    """차단기가 열려 Redis 호출을 생략함"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 Redis 호출을 잠시 중단하는 차단기 (동기/비동기 공용 with 블록)
+
+    failure_threshold번 연속 실패하면 열리고, reset_seconds 후 한 호출만 시험(half-open)하여
+    성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def __enter__(self):
+        with self._lock:
+            if self.opened_at is None:
+                return self
+            if self._probing or time.monotonic() - self.opened_at < self.reset_seconds:
+                raise RedisUnavailableError(f"redis circuit '{self.name}' is open")
+            self._probing = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        with self._lock:
+            probing, self._probing = self._probing, False
+            if exc_type is None:
+                self.failures = 0
+                if self.opened_at is not None:
+                    self.opened_at = None
+                    redis_circuit_open.set(0, name=self.name)
+            elif issubclass(exc_type, RedisError):
+                self.failures += 1
+                if probing or self.failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+                    redis_circuit_open.set(1, name=self.name)
+        return False
+
+
+token_breaker = CircuitBreaker(
+    "tokens", settings.REDIS_CIRCUIT_FAILURES, settings.REDIS_CIRCUIT_RESET_SECONDS
 )
 
 
 # ==================== Access Token 블랙리스트 ====================
 
-def blacklist_access_token(token: str, expires_in: int) -> None:
-    """Access Token을 블랙리스트에 추가 (로그아웃 시)"""
-    redis_client.setex(f"blacklist:{token}", expires_in, "1")
-
+# 폐기된 jti 목록 (score=토큰 만료 시각) - 워커 시작 시 폐기 필터를 채우는 용도
+REVOKED_JTI_INDEX = "blacklist:index"
 
-def is_token_blacklisted(token: str) -> bool:
-    """토큰이 블랙리스트에 있는지 확인"""
-    return redis_client.exists(f"blacklist:{token}") > 0
 
+def is_token_blacklisted(jti: str) -> bool:
+    """jti가 블랙리스트에 있는지 확인 (jti 없는 이전 토큰은 토큰 문자열 자체로 확인)"""
+    with token_breaker:
+        return redis_client.exists(f"blacklist:{jti}") > 0
 
-# ==================== Refresh Token 관리 ====================
 
-def store_refresh_token(user_id: int, token: str, expires_in: int) -> None:
-    """Refresh Token을 Redis에 저장"""
-    redis_client.setex(f"refresh:{user_id}", expires_in, token)
+def revoked_jtis() -> list[str]:
+    """아직 만료되지 않은 폐기 jti 전체"""
+    with token_breaker:
+        return redis_client.zrangebyscore(REVOKED_JTI_INDEX, int(time.time()), "+inf")
 
 
-def get_refresh_token(user_id: int) -> str | None:
-    """저장된 Refresh Token 조회"""
-    return redis_client.get(f"refresh:{user_id}")
-
-
-def delete_refresh_token(user_id: int) -> None:
-    """Refresh Token 삭제 (로그아웃 시)"""
-    redis_client.delete(f"refresh:{user_id}")
-
-
-def is_valid_refresh_token(user_id: int, token: str) -> bool:
-    """Refresh Token이 유효한지 확인"""
-    stored_token = get_refresh_token(user_id)
-    return stored_token == token
+# ==================== Refresh Token 관리 ====================
+#
+# 사용자마다 해시 키 1개 (refresh:families:{user_id}), 필드 = 로그인 기기별 토큰 family,
+# 값 = "{현재 유효한 refresh jti}:{만료 시각}"
+# - 로그인: 새 family 추가 (만료된 family 정리, REFRESH_TOKEN_MAX_FAMILIES 초과 시 가장 먼저 만료되는 family 제거)
+# - 갱신: 제시한 jti가 family의 현재 jti와 같을 때만 새 jti로 교체 (회전)
+#         이미 교체된 jti가 다시 오면 탈취로 보고 family 전체 폐기 (재사용 감지)
+# - 전체 폐기(탈퇴/비밀번호 변경): 키 삭제 1회
+
+REFRESH_ROTATED = "rotated"
+REFRESH_REUSED = "reused"
+REFRESH_MISSING = "missing"
+
+
+def refresh_families_key(user_id: int) -> str:
+    return f"refresh:families:{user_id}"
+
+
+_ADD_FAMILY = async_redis_client.register_script("""
+local now, max_families = tonumber(ARGV[3]), tonumber(ARGV[4])
+local fields = redis.call('HGETALL', KEYS[1])
+local live, oldest_field, oldest_exp = 0, nil, nil
+for i = 1, #fields, 2 do
+    if fields[i] ~= ARGV[1] then
+        local exp = tonumber(string.match(fields[i + 1], ':(%d+)$') or '0')
+        if exp <= now then
+            redis.call('HDEL', KEYS[1], fields[i])
+        else
+            live = live + 1
+            if oldest_exp == nil or exp < oldest_exp then
+                oldest_field, oldest_exp = fields[i], exp
+            end
+        end
+    end
+end
+if live >= max_families and oldest_field then
+    redis.call('HDEL', KEYS[1], oldest_field)
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+""")
+
+_ROTATE_FAMILY = async_redis_client.register_script("""
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if not current then
+    return 0
+end
+if string.match(current, '^([^:]+)') ~= ARGV[2] then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return -1
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+""")
+
+
+async def store_refresh_token(user_id: int, family: str, jti: str, expires_at: int) -> None:
+    """로그인 시 새 Refresh Token family 저장"""
+    now = int(time.time())
+    with token_breaker:
+        await _ADD_FAMILY(
+            keys=[refresh_families_key(user_id)],
+            args=[family, f"{jti}:{expires_at}", now, settings.REFRESH_TOKEN_MAX_FAMILIES, max(expires_at - now, 1)],
+        )
+
+
+async def rotate_refresh_token(user_id: int, family: str, jti: str, new_jti: str, expires_at: int) -> str:
+    """
+    Refresh Token 회전 (원자적 비교 후 교체)
+
+    반환값: REFRESH_ROTATED(교체됨), REFRESH_REUSED(이미 사용된 토큰 - family 폐기), REFRESH_MISSING(폐기/만료된 family)
+    """
+    with token_breaker:
+        result = await _ROTATE_FAMILY(
+            keys=[refresh_families_key(user_id)],
+            args=[family, jti, f"{new_jti}:{expires_at}", max(expires_at - int(time.time()), 1)],
+        )
+    return {1: REFRESH_ROTATED, -1: REFRESH_REUSED}.get(int(result), REFRESH_MISSING)
+
+
+def revoke_all_refresh_tokens(user_id: int) -> None:
+    """사용자의 모든 Refresh Token family 폐기 (회원 탈퇴 시)"""
+    with token_breaker:
+        redis_client.delete(refresh_families_key(user_id))
+
+
+async def revoke_all_refresh_tokens_async(user_id: int) -> None:
+    """사용자의 모든 Refresh Token family 폐기 (비밀번호 변경 시)"""
+    with token_breaker:
+        await async_redis_client.delete(refresh_families_key(user_id))
+
+
+# ==================== 로그아웃 ====================
+
+async def revoke_session(user_id: int, family: Optional[str], jti: str, expires_at: int, channel: str) -> None:
+    """
+    로그아웃 - Access Token 블랙리스트 등록, 현재 기기 Refresh Token family 삭제, 폐기 전파를 파이프라인 1회로 처리
+
+    family가 없는 이전 발급 토큰은 사용자의 모든 family를 삭제합니다.
+    """
+    now = int(time.time())
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.setex(f"blacklist:{jti}", max(expires_at - now, 1), "1")
+        pipe.zadd(REVOKED_JTI_INDEX, {jti: expires_at})
+        pipe.zremrangebyscore(REVOKED_JTI_INDEX, "-inf", now)
+        if family:
+            pipe.hdel(refresh_families_key(user_id), family)
+        else:
+            pipe.delete(refresh_families_key(user_id))
+        pipe.publish(channel, jti)
+        with token_breaker:
+            await pipe.execute()
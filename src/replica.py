@@ -0,0 +1,191 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+- get_read_db: 순수 조회 라우트용 세션 의존성 (복제본 미설정 시 primary와 동일)
+- Read-your-writes: 쓰기 요청이 성공하면 호출자(사용자 또는 IP)를 REPLICA_STICKY_SECONDS 동안
+  primary에 고정 (Redis 키, 워커 간 공유)
+- 복제 지연이 REPLICA_MAX_LAG_SECONDS를 넘거나 복제본에 연결할 수 없으면 primary로 전환
+  (상태는 REPLICA_CHECK_INTERVAL_SECONDS마다 다시 확인)
+"""
+import logging
+import time
+from typing import Optional
+
+from fastapi import Request
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.database import AsyncSessionLocal, ReplicaSessionLocal
+from src.metrics import Counter, registry
+from src.rate_limit import rate_limit_key
+from src.redis import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+db_read_sessions_total = registry.register(Counter(
+    "db_read_sessions_total",
+    "Read-only sessions by target database and routing reason",
+    ("target", "reason")
+))
+
+# 쓰기로 간주하지 않는 메서드
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def read_only(endpoint):
+    """
+    GET이 아니지만 쓰기를 하지 않는 라우트 표시 (예: 긴 id 목록을 본문으로 받는 POST 조회)
+
+    성공해도 호출자를 primary에 고정하지 않습니다.
+    """
+    endpoint.__read_only__ = True
+    return endpoint
+
+
+def sticky_key(caller: str) -> str:
+    """호출자별 primary 고정 키"""
+    return f"db:sticky:{caller}"
+
+
+class ReplicaRouter:
+    """조회 세션을 복제본/primary 중 어디에서 열지 결정"""
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: Optional[async_sessionmaker],
+        redis=async_redis_client,
+        sticky_seconds: int = settings.REPLICA_STICKY_SECONDS,
+        max_lag_seconds: float = settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds: float = settings.REPLICA_CHECK_INTERVAL_SECONDS
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.redis = redis
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._healthy = True
+        self._checked_at = float("-inf")
+        self._checking = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.replica is not None
+
+    # ==================== Read-your-writes ====================
+
+    async def mark_write(self, caller: str) -> None:
+        """호출자의 쓰기 직후 조회를 primary로 보내도록 표시"""
+        try:
+            await self.redis.setex(sticky_key(caller), self.sticky_seconds, "1")
+        except RedisError:
+            logger.warning("replica sticky mark failed: %s", caller, exc_info=True)
+
+    async def _is_sticky(self, caller: str) -> bool:
+        try:
+            return await self.redis.exists(sticky_key(caller)) > 0
+        except RedisError:
+            # 최근 쓰기 여부를 알 수 없으면 일관성을 위해 primary 사용
+            logger.warning("replica sticky lookup failed: %s", caller, exc_info=True)
+            return True
+
+    # ==================== 복제본 상태 ====================
+
+    async def _check_replica(self) -> bool:
+        try:
+            async with self.replica() as db:
+                status = (await db.execute(text("SHOW SLAVE STATUS"))).mappings().first()
+        except DBAPIError:
+            logger.warning("replica health check failed", exc_info=True)
+            return False
+        if status is None:
+            # 복제 설정이 없는 DB(테스트용 로컬 DB 등)는 지연 없음으로 간주
+            return True
+        lag = status.get("Seconds_Behind_Master")
+        # 복제 SQL 스레드가 멈추면 NULL
+        return lag is not None and lag <= self.max_lag_seconds
+
+    async def _replica_healthy(self) -> bool:
+        """캐시된 복제본 상태 (만료 시 한 요청만 다시 확인하고 나머지는 이전 값 사용)"""
+        if self._checking or time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return self._healthy
+        self._checking = True
+        try:
+            self._healthy = await self._check_replica()
+            self._checked_at = time.monotonic()
+        finally:
+            self._checking = False
+        return self._healthy
+
+    def mark_down(self) -> None:
+        """복제본 연결 실패 - 다음 확인 주기까지 primary 사용"""
+        self._healthy = False
+        self._checked_at = time.monotonic()
+
+    # ==================== 세션 선택 ====================
+
+    def _primary(self, reason: str) -> AsyncSession:
+        db_read_sessions_total.inc(target="primary", reason=reason)
+        return self.primary()
+
+    async def session(self, request: Request) -> AsyncSession:
+        if not self.enabled:
+            return self._primary("no_replica")
+        if await self._is_sticky(rate_limit_key(request)):
+            return self._primary("sticky")
+        if not await self._replica_healthy():
+            return self._primary("replica_unhealthy")
+
+        db = self.replica()
+        try:
+            # 연결 실패를 요청 처리 전에 확인하여 primary로 전환
+            await db.connection()
+        except DBAPIError:
+            logger.warning("replica connection failed; falling back to primary", exc_info=True)
+            await db.close()
+            self.mark_down()
+            return self._primary("replica_unavailable")
+        db_read_sessions_total.inc(target="replica", reason="ok")
+        return db
+
+
+read_router = ReplicaRouter(AsyncSessionLocal, ReplicaSessionLocal)
+
+
+async def get_read_db(request: Request):
+    """
+    조회 전용 DB 세션 의존성 (복제본 또는 primary)
+
+    쓰기를 하지 않는 라우트에서만 사용합니다.
+    """
+    async with await read_router.session(request) as db:
+        yield db
+
+
+class ReadYourWritesMiddleware:
+    """성공한 쓰기 요청의 호출자를 primary에 고정 (응답을 보내기 전에 표시)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in _READ_METHODS or not read_router.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            # 라우팅 후 scope에 기록된 라우트로 @read_only 여부 확인
+            endpoint = getattr(scope.get("route"), "endpoint", None)
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and not getattr(endpoint, "__read_only__", False)
+            ):
+                await read_router.mark_write(rate_limit_key(Request(scope)))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,50 @@
+"""
+검증/직렬화를 한 번만 하는 성공 응답 (FAST_JSON_RESPONSES)
+
+라우트가 APIResponse 모델을 반환하면 FastAPI가 response_model로 다시 검증한 뒤 JSON으로 직렬화합니다.
+도서 목록/상세의 payload는 캐시에 저장할 때 이미 검증·직렬화되므로, 이 설정을 켜면
+- 캐시 적중: 캐시된 JSON을 모델로 다시 파싱·검증하지 않고
+- 캐시 미스: 캐시 저장용으로 한 번 직렬화한 JSON을 다시 직렬화하지 않고
+APIResponse 봉투에 그대로 넣은 Response를 반환합니다 (Response를 반환하면 FastAPI는 response_model
+처리를 건너뜀). 응답 본문은 기본 경로와 바이트 단위로 같습니다.
+"""
+import json
+from functools import lru_cache
+from typing import Union
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from src.config import settings
+from src.schema.common import APIResponse
+
+
+@lru_cache(maxsize=256)
+def _envelope_prefix(message: str) -> bytes:
+    # FastAPI(pydantic dump_json)와 같은 형식: 공백 없음, 비ASCII 문자 그대로
+    encoded = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+    return f'{{"is_success":true,"message":{encoded},"payload":'.encode("utf-8")
+
+
+class PayloadJSONResponse(Response):
+    """APIResponse(is_success=True) 봉투 + 미리 직렬화된 payload JSON"""
+    media_type = "application/json"
+
+    def __init__(self, message: str, payload_json: Union[str, bytes], status_code: int = 200):
+        if isinstance(payload_json, str):
+            payload_json = payload_json.encode("utf-8")
+        super().__init__(_envelope_prefix(message) + payload_json + b"}", status_code=status_code)
+
+
+def cached_payload_response(message: str, payload_json: str, model: type[BaseModel]):
+    """캐시에서 읽은 payload JSON으로 성공 응답 생성 (설정이 꺼져 있으면 모델로 검증해 반환)"""
+    if settings.FAST_JSON_RESPONSES:
+        return PayloadJSONResponse(message, payload_json)
+    return APIResponse(is_success=True, message=message, payload=model.model_validate_json(payload_json))
+
+
+def payload_response(message: str, payload: BaseModel, payload_json: str):
+    """새로 만든 payload와 그 JSON(캐시 저장용)으로 성공 응답 생성 (설정이 꺼져 있으면 모델 반환)"""
+    if settings.FAST_JSON_RESPONSES:
+        return PayloadJSONResponse(message, payload_json)
+    return APIResponse(is_success=True, message=message, payload=payload)
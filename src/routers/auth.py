@@ -1,33 +1,37 @@
 #외부 모듈
-from datetime import datetime
+from datetime import timedelta
 import secrets
+import time
+import uuid
 from fastapi import APIRouter, status, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from redis.exceptions import RedisError
 
 
 #내부 모듈
 from src.schema.auth import AuthLogin, LoginResponse, TokenRefresh, TokenRefreshResponse, FirebaseLogin
 from src.schema.common import APIResponse, ErrorResponse
-from src.database import get_db
+from src.database import get_db, get_async_db
+from src.rate_limit import login_limit
 from src.models.user import User
 from src.config import settings
 from src.auth.jwt import (
+    APIException,
     create_access_token,
     create_refresh_token,
     verify_token,
     get_current_user,
 )
-from src.auth.password import verify_password, hash_password
+from src.auth.password import verify_password_async, hash_password_async
 from src.auth.oauth import get_google_oauth_client
 from src.auth.firebase_auth import verify_firebase_token
-from src.redis import (
-    store_refresh_token,
-    is_valid_refresh_token,
-    delete_refresh_token,
-    blacklist_access_token,
-)
+from src.redis import REFRESH_REUSED, REFRESH_ROTATED, rotate_refresh_token, store_refresh_token
+from src.auth.revocation import revoke_tokens
 
 
 security = HTTPBearer()
@@ -36,6 +40,35 @@ security = HTTPBearer()
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 
 
+def _token_pair(user: User, family: str) -> tuple[str, str, str, int]:
+    """
+    같은 family(로그인 기기)의 Access/Refresh Token 발급
+
+    반환값: (access_token, refresh_token, refresh jti, refresh 만료 시각)
+    """
+    token_data = {"sub": str(user.id), "email": user.email, "role": user.role, "fam": family}
+    refresh_jti = uuid.uuid4().hex
+    refresh_expires_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    access_token = create_access_token(data=token_data)
+    refresh_token = create_refresh_token(
+        data={**token_data, "jti": refresh_jti},
+        expires_delta=timedelta(seconds=refresh_expires_seconds)
+    )
+    return access_token, refresh_token, refresh_jti, int(time.time()) + refresh_expires_seconds
+
+
+async def _login_tokens(user: User) -> LoginResponse:
+    """로그인 - 새 family로 토큰 발급 후 Refresh Token을 Redis에 저장"""
+    family = uuid.uuid4().hex
+    access_token, refresh_token, refresh_jti, expires_at = _token_pair(user, family)
+    await store_refresh_token(user.id, family, refresh_jti, expires_at)
+    return LoginResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer"
+    )
+
+
 # ==================== 인증 및 토큰 관리 ====================
 
 # 로그인
@@ -47,54 +80,34 @@ router = APIRouter(prefix="/api/auth", tags=["Auth"])
     responses={
         401: {"model": ErrorResponse, "description": "이메일 또는 비밀번호 불일치"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "비밀번호 검증 대기열 초과 또는 인증 저장소(Redis) 일시 장애"},
     }
 )
-def login(request: Request, user_credentials: AuthLogin, db: Session = Depends(get_db)):
+@login_limit
+async def login(request: Request, user_credentials: AuthLogin, db: AsyncSession = Depends(get_async_db)):
     """사용자 로그인 및 JWT 토큰 발급"""
     # 사용자 조회
-    user = db.query(User).filter(User.email == user_credentials.email).first()
+    user = await db.scalar(select(User).where(User.email == user_credentials.email))
     if not user:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="UNAUTHORIZED",
-                message="Invalid email or password"
-            ).model_dump(mode="json")
+            code="UNAUTHORIZED",
+            message="Invalid email or password"
         )
 
-    # 비밀번호 검증
-    if not verify_password(user_credentials.password, str(user.password_hash)):
-        return JSONResponse(
+    # 비밀번호 검증 (해싱 전용 프로세스 풀에서 실행)
+    if not await verify_password_async(user_credentials.password, str(user.password_hash)):
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="UNAUTHORIZED",
-                message="Invalid email or password"
-            ).model_dump(mode="json")
+            code="UNAUTHORIZED",
+            message="Invalid email or password"
         )
 
-    # JWT 토큰 생성
-    token_data = {"sub": str(user.id), "email": user.email, "role": user.role}
-    access_token = create_access_token(data=token_data)
-    refresh_token = create_refresh_token(data=token_data)
-
-    # Refresh Token을 Redis에 저장
-    refresh_expires_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-    store_refresh_token(user.id, refresh_token, refresh_expires_seconds)
-
+    # JWT 토큰 발급 및 Refresh Token 저장 (기기별 family)
     return APIResponse(
         is_success=True,
         message="로그인 성공",
-        payload=LoginResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer"
-        )
+        payload=await _login_tokens(user)
     )
 
 
@@ -105,63 +118,63 @@ def login(request: Request, user_credentials: AuthLogin, db: Session = Depends(g
     response_model=APIResponse[TokenRefreshResponse],
     status_code=status.HTTP_200_OK,
     responses={
-        401: {"model": ErrorResponse, "description": "유효하지 않거나 만료된 Refresh Token"},
+        401: {"model": ErrorResponse, "description": "유효하지 않거나 만료된(또는 이미 사용된) Refresh Token"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "인증 저장소(Redis) 일시 장애"},
     }
 )
-def refresh_token_endpoint(request: Request, token_request: TokenRefresh, db: Session = Depends(get_db)):
-    """Refresh Token으로 새로운 Access Token 발급"""
+async def refresh_token_endpoint(request: Request, token_request: TokenRefresh, db: AsyncSession = Depends(get_async_db)):
+    """
+    Refresh Token으로 새로운 Access Token과 Refresh Token 발급 (회전)
+    - 사용한 Refresh Token은 즉시 무효화되며, 다시 사용하면 같은 기기의 세션 전체가 폐기됩니다.
+    """
     # Refresh Token 검증
     payload = verify_token(token_request.refresh_token, token_type="refresh")
 
     # 사용자 존재 확인
     user_id = payload.get("sub")
     if user_id is None:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="UNAUTHORIZED",
-                message="Invalid token payload"
-            ).model_dump(mode="json")
+            code="UNAUTHORIZED",
+            message="Invalid token payload"
         )
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = await db.get(User, int(user_id))
     if not user:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="USER_NOT_FOUND",
-                message="User not found"
-            ).model_dump(mode="json")
+            code="USER_NOT_FOUND",
+            message="User not found"
         )
 
-    # Redis에서 Refresh Token 유효성 확인
-    if not is_valid_refresh_token(int(user_id), token_request.refresh_token):
-        return JSONResponse(
+    # family의 현재 Refresh Token인지 확인 후 새 토큰으로 회전 (Redis 원자적 비교/교체 1회)
+    # family/jti가 없는 이전 발급 토큰은 회전할 수 없으므로 다시 로그인 필요
+    family, jti = payload.get("fam"), payload.get("jti")
+    result = None
+    if family and jti:
+        access_token, refresh_token, new_jti, expires_at = _token_pair(user, family)
+        result = await rotate_refresh_token(user.id, family, jti, new_jti, expires_at)
+
+    if result == REFRESH_REUSED:
+        # 이미 교체된 토큰 재사용 - 탈취로 보고 해당 family 폐기 (정상 사용자도 다시 로그인)
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="INVALID_REFRESH_TOKEN",
-                message="Refresh token is invalid or expired"
-            ).model_dump(mode="json")
+            code="REFRESH_TOKEN_REUSED",
+            message="Refresh token has already been used; session revoked"
+        )
+    if result != REFRESH_ROTATED:
+        raise APIException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            code="INVALID_REFRESH_TOKEN",
+            message="Refresh token is invalid or expired"
         )
-
-    # 새 Access Token 발급
-    token_data = {"sub": str(user.id), "email": user.email, "role": user.role}
-    new_access_token = create_access_token(data=token_data)
 
     return APIResponse(
         is_success=True,
         message="토큰 갱신 성공",
         payload=TokenRefreshResponse(
-            access_token=new_access_token,
+            access_token=access_token,
+            refresh_token=refresh_token,
             token_type="bearer"
         )
     )
@@ -176,24 +189,24 @@ def refresh_token_endpoint(request: Request, token_request: TokenRefresh, db: Se
     responses={
         401: {"model": ErrorResponse, "description": "인증 필요 (유효하지 않은 토큰)"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "인증 저장소(Redis) 일시 장애"},
     }
 )
-def logout(
+async def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: User = Depends(get_current_user)
 ):
     """
     로그아웃 처리
     - Access Token을 블랙리스트에 추가
-    - Refresh Token을 Redis에서 삭제
+    - 현재 기기의 Refresh Token family를 Redis에서 삭제 (다른 기기 세션은 유지)
     """
-    # Access Token 블랙리스트에 추가
-    access_token = credentials.credentials
-    access_expires_seconds = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    blacklist_access_token(access_token, access_expires_seconds)
-
-    # Refresh Token 삭제
-    delete_refresh_token(current_user.id)
+    # Access Token 블랙리스트 추가(jti 기준, 토큰 만료 시각까지)와 Refresh Token 삭제를 Redis 왕복 1회로 처리
+    # jti 없는 이전 발급 토큰은 토큰 문자열 자체를 키로 사용
+    payload = verify_token(credentials.credentials, "access")
+    await revoke_tokens(
+        current_user.id, payload.get("fam"), payload.get("jti") or credentials.credentials, int(payload["exp"])
+    )
 
     return APIResponse(
         is_success=True,
@@ -234,6 +247,7 @@ async def google_login(request: Request):
     responses={
         401: {"model": ErrorResponse, "description": "Google 인증 실패"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "인증 저장소(Redis) 일시 장애"},
     }
 )
 async def google_callback(request: Request, db: Session = Depends(get_db)):
@@ -251,15 +265,10 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
         # 사용자 정보 가져오기
         user_info = token.get('userinfo')
         if not user_info:
-            return JSONResponse(
+            raise APIException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                content=ErrorResponse(
-                    timestamp=datetime.now(),
-                    path=str(request.url.path),
-                    status=401,
-                    code="UNAUTHORIZED",
-                    message="Failed to retrieve user information from Google"
-                ).model_dump(mode="json")
+                code="UNAUTHORIZED",
+                message="Failed to retrieve user information from Google"
             )
             
         email = user_info.get('email')
@@ -272,7 +281,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
         if not user:
             # 임시 랜덤 비밀번호 생성 (소셜 로그인 사용자는 이 비밀번호를 알 수 없음)
             random_password = secrets.token_urlsafe(32)
-            hashed_password = hash_password(random_password)
+            hashed_password = await hash_password_async(random_password)
             
             user = User(
                 email=email,
@@ -284,35 +293,22 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
             db.commit()
             db.refresh(user)
             
-        # JWT 토큰 생성
-        token_data = {"sub": str(user.id), "email": user.email, "role": user.role}
-        access_token = create_access_token(data=token_data)
-        refresh_token = create_refresh_token(data=token_data)
-        
-        # Refresh Token을 Redis에 저장
-        refresh_expires_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-        store_refresh_token(user.id, refresh_token, refresh_expires_seconds)
-        
+        # JWT 토큰 발급 및 Refresh Token 저장 (기기별 family)
         return APIResponse(
             is_success=True,
             message="Google 로그인 성공",
-            payload=LoginResponse(
-                access_token=access_token,
-                refresh_token=refresh_token,
-                token_type="bearer"
-            )
+            payload=await _login_tokens(user)
         )
         
+    # Redis 장애는 전역 처리기에서 503으로 응답
+    except (APIException, RedisError):
+        raise
+
     except Exception as e:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=500,
-                code="INTERNAL_SERVER_ERROR",
-                message=f"Google authentication failed: {str(e)}"
-            ).model_dump(mode="json")
+            code="INTERNAL_SERVER_ERROR",
+            message=f"Google authentication failed: {str(e)}"
         )
 
 
@@ -327,42 +323,39 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
     responses={
         401: {"model": ErrorResponse, "description": "Firebase 인증 실패"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "인증 저장소(Redis) 일시 장애"},
     }
 )
-def firebase_login(request: Request, firebase_request: FirebaseLogin, db: Session = Depends(get_db)):
+@login_limit
+async def firebase_login(request: Request, firebase_request: FirebaseLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Firebase Authentication 로그인
     - 클라이언트에서 Firebase로 로그인 후 받은 ID Token을 전송
     - 서버에서 ID Token 검증 후 JWT 토큰 발급
     """
     try:
-        # Firebase ID Token 검증
-        decoded_token = verify_firebase_token(firebase_request.id_token)
+        # Firebase ID Token 검증 (공개키 조회가 블로킹이므로 스레드풀에서 실행)
+        decoded_token = await run_in_threadpool(verify_firebase_token, firebase_request.id_token)
 
         # 사용자 정보 추출
         email = decoded_token.get('email')
         name = decoded_token.get('name', email.split('@')[0] if email else 'User')
 
         if not email:
-            return JSONResponse(
+            raise APIException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                content=ErrorResponse(
-                    timestamp=datetime.now(),
-                    path=str(request.url.path),
-                    status=401,
-                    code="UNAUTHORIZED",
-                    message="Email not found in Firebase token"
-                ).model_dump(mode="json")
+                code="UNAUTHORIZED",
+                message="Email not found in Firebase token"
             )
 
         # 기존 사용자 조회
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
 
         # 신규 사용자인 경우 자동 회원가입
         if not user:
             # 임시 랜덤 비밀번호 생성 (소셜 로그인 사용자는 이 비밀번호를 알 수 없음)
             random_password = secrets.token_urlsafe(32)
-            hashed_password = hash_password(random_password)
+            hashed_password = await hash_password_async(random_password)
 
             user = User(
                 email=email,
@@ -371,48 +364,30 @@ def firebase_login(request: Request, firebase_request: FirebaseLogin, db: Sessio
                 role="user"
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
-
-        # JWT 토큰 생성
-        token_data = {"sub": str(user.id), "email": user.email, "role": user.role}
-        access_token = create_access_token(data=token_data)
-        refresh_token = create_refresh_token(data=token_data)
-
-        # Refresh Token을 Redis에 저장
-        refresh_expires_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-        store_refresh_token(user.id, refresh_token, refresh_expires_seconds)
+            await db.commit()
+            await db.refresh(user)
 
+        # JWT 토큰 발급 및 Refresh Token 저장 (기기별 family)
         return APIResponse(
             is_success=True,
             message="Firebase 로그인 성공",
-            payload=LoginResponse(
-                access_token=access_token,
-                refresh_token=refresh_token,
-                token_type="bearer"
-            )
+            payload=await _login_tokens(user)
         )
 
+    # Redis 장애는 전역 처리기에서 503으로 응답
+    except (APIException, RedisError):
+        raise
+
     except ValueError as e:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=401,
-                code="UNAUTHORIZED",
-                message=str(e)
-            ).model_dump(mode="json")
+            code="UNAUTHORIZED",
+            message=str(e)
         )
 
     except Exception as e:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=500,
-                code="INTERNAL_SERVER_ERROR",
-                message=f"Firebase authentication failed: {str(e)}"
-            ).model_dump(mode="json")
+            code="INTERNAL_SERVER_ERROR",
+            message=f"Firebase authentication failed: {str(e)}"
         )
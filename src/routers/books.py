@@ -4,29 +4,87 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 #내부 모듈
-from src.database import get_db
+from src.database import get_async_db
+from src.replica import get_read_db, read_only
+from src.rate_limit import write_limit
+from src.query_debug import query_budget
 from src.schema.books import (
+    BOOK_BATCH_MAX_IDS,
+    BookBatchRequest,
+    BookBatchResponse,
     BookCreate,
     BookCreateResponse,
     BookListItem,
     BookListResponse,
     BookPagination,
+    BookCursorPagination,
+    BookImportError,
+    BookImportResponse,
+    BookSearchItem,
+    BookSearchPagination,
+    BookSearchResponse,
     BookUpdate
 )
 from src.schema.common import APIResponse, ErrorResponse
+from src.pagination import (
+    encode_cursor,
+    decode_cursor,
+    encode_score_cursor,
+    decode_score_cursor,
+    seek_condition
+)
+from src.cache import (
+    book_detail_key,
+    book_list_key,
+    cache_get_many,
+    cache_get_raw,
+    cache_set_many,
+    cache_set_raw,
+    invalidate_books
+)
+from src.responses import cached_payload_response, payload_response
+from src.catalog import get_or_create_ids
+from src.book_import import import_chunk, iter_import_rows, iter_lines
+from src.search import search_backend, searchable_authors
+from src.stats import book_stats_summary
 from src.models.book import Book
 from src.models.author import Author
 from src.models.category import Category
-from src.auth.jwt import get_current_admin_user
+from src.models.book_stats import BookStats
+from src.auth.jwt import APIException, get_current_admin_user
 from src.models.user import User
 
 
 router = APIRouter(prefix="/api/books", tags=["Books"])
 
+
+def _book_list_item(book: Book) -> BookListItem:
+    """저자/카테고리/집계를 불러온 Book을 목록/상세 응답 아이템으로 변환"""
+    return BookListItem(
+        id=book.id,
+        title=book.title,
+        categories=[cat.name for cat in book.categories],
+        authors=[auth.name for auth in book.authors],
+        description=book.description,
+        isbn=book.isbn,
+        cover_image_url=book.cover_image_url,
+        price=book.price,
+        publication_date=book.publication_date,
+        stats=book_stats_summary(book.stats)
+    )
+
+
+async def _resolve_names(db: AsyncSession, model, names: list[str]) -> list:
+    """이름 목록을 엔티티 목록으로 변환 (없으면 생성, 중복 제거, 입력 순서 유지)"""
+    ids = await get_or_create_ids(db, model, names)
+    # get_or_create_ids가 조회한 엔티티는 identity map에 있으므로 db.get은 추가 쿼리 없음
+    return [await db.get(model, entity_id) for entity_id in dict.fromkeys(ids.values())]
+
 # ==================== 도서 CRUD ====================
 
 # Create (도서 등록) - 관리자 전용
@@ -43,10 +101,11 @@ router = APIRouter(prefix="/api/books", tags=["Books"])
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def create_book(
     request: Request,
     book_data: BookCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -56,39 +115,18 @@ async def create_book(
     - 저자/카테고리가 없으면 자동 생성
     """
     # ISBN 중복 검사
-    existing_book = db.query(Book).filter(Book.isbn == book_data.isbn).first()
+    existing_book = await db.scalar(select(Book).where(Book.isbn == book_data.isbn))
     if existing_book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=409,
-                code="DUPLICATE_ISBN",
-                message="이미 등록된 ISBN입니다",
-                details={"isbn": book_data.isbn}
-            ).model_dump(mode="json")
+            code="DUPLICATE_ISBN",
+            message="이미 등록된 ISBN입니다",
+            details={"isbn": book_data.isbn}
         )
 
-    # 저자 처리 (없으면 생성)
-    authors = []
-    for author_name in book_data.authors:
-        author = db.query(Author).filter(Author.name == author_name).first()
-        if not author:
-            author = Author(name=author_name)
-            db.add(author)
-            db.flush()  # ID 할당을 위해 flush
-        authors.append(author)
-
-    # 카테고리 처리 (없으면 생성)
-    categories = []
-    for category_name in book_data.categories:
-        category = db.query(Category).filter(Category.name == category_name).first()
-        if not category:
-            category = Category(name=category_name)
-            db.add(category)
-            db.flush()
-        categories.append(category)
+    # 저자/카테고리 처리 (없으면 생성, 이름 수와 무관하게 일괄 처리)
+    authors = await _resolve_names(db, Author, book_data.authors)
+    categories = await _resolve_names(db, Category, book_data.categories)
 
     # 도서 생성
     new_book = Book(
@@ -97,14 +135,20 @@ async def create_book(
         isbn=book_data.isbn,
         cover_image_url=book_data.cover_image_url,
         price=book_data.price,
-        publication_date=book_data.publication_date
+        publication_date=book_data.publication_date,
+        author_names=searchable_authors(author.name for author in authors)
     )
     new_book.authors = authors
     new_book.categories = categories
 
     db.add(new_book)
-    db.commit()
-    db.refresh(new_book)
+    await db.commit()
+    # 서버 기본값(created_at)만 다시 읽음 (관계 컬렉션은 메모리 값 유지)
+    await db.refresh(new_book, ["created_at"])
+    await invalidate_books()
+    search_backend.index_book(
+        new_book.id, new_book.title, new_book.description, [author.name for author in authors]
+    )
 
     # 응답 생성
     response_data = BookCreateResponse(
@@ -127,6 +171,94 @@ async def create_book(
     )
 
 
+# Create (도서 일괄 등록) - 관리자 전용
+@router.post(
+    "/import",
+    summary="도서 일괄 등록 (관리자)",
+    response_model=APIResponse[BookImportResponse],
+    status_code=status.HTTP_200_OK,
+    responses={
+        401: {"model": ErrorResponse, "description": "인증 필요"},
+        403: {"model": ErrorResponse, "description": "관리자 권한 필요"},
+        422: {"model": ErrorResponse, "description": "입력값 검증 실패"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+            "required": True,
+        }
+    }
+)
+@write_limit
+async def import_books(
+    request: Request,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="업로드 형식 (ndjson, csv)"),
+    chunk_size: int = Query(1000, ge=1, le=5000, description="한 트랜잭션으로 저장할 행 수"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    NDJSON 또는 CSV 본문을 스트리밍으로 읽어 도서를 일괄 등록합니다.
+    - 관리자 권한 필요
+    - 각 행은 도서 등록(BookCreate)과 같은 규칙으로 검증
+    - CSV는 첫 줄이 헤더, authors/categories는 '|'로 구분
+    - chunk_size 행마다 다중 행 INSERT 후 커밋 (실패한 행은 errors에 행 번호와 함께 보고)
+    """
+    total_rows = 0
+    imported = 0
+    errors: list[BookImportError] = []
+    seen_isbns: set[str] = set()
+    pending: list[tuple[int, BookCreate]] = []
+
+    async for row_number, row in iter_import_rows(iter_lines(request.stream()), fmt):
+        total_rows += 1
+        if isinstance(row, BookImportError):
+            errors.append(row)
+            continue
+        # 같은 파일 안에서 중복된 ISBN
+        if row.isbn in seen_isbns:
+            errors.append(BookImportError(
+                row=row_number,
+                isbn=row.isbn,
+                code="DUPLICATE_ISBN",
+                message="파일 안에서 중복된 ISBN입니다"
+            ))
+            continue
+        seen_isbns.add(row.isbn)
+
+        pending.append((row_number, row))
+        if len(pending) >= chunk_size:
+            chunk_errors = await import_chunk(db, pending)
+            imported += len(pending) - len(chunk_errors)
+            errors.extend(chunk_errors)
+            pending = []
+
+    if pending:
+        chunk_errors = await import_chunk(db, pending)
+        imported += len(pending) - len(chunk_errors)
+        errors.extend(chunk_errors)
+
+    if imported:
+        await invalidate_books()
+        search_backend.invalidate()
+
+    errors.sort(key=lambda error: error.row)
+    return APIResponse(
+        is_success=True,
+        message="도서 일괄 등록이 완료되었습니다.",
+        payload=BookImportResponse(
+            total_rows=total_rows,
+            imported=imported,
+            failed=len(errors),
+            errors=errors
+        )
+    )
+
+
 # Read (도서 목록 조회) - 페이지네이션
 @router.get(
     "/",
@@ -134,15 +266,20 @@ async def create_book(
     response_model=APIResponse[BookListResponse],
     status_code=status.HTTP_200_OK,
     responses={
+        400: {"model": ErrorResponse, "description": "유효하지 않은 커서 또는 정렬 조합"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 async def get_books(
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     sort_by: int = Query(0, ge=0, le=1, description="정렬 기준 (0: 내림차순, 1: 오름차순)"),
-    db: Session = Depends(get_db)
+    sort: str = Query("latest", pattern="^(latest|rating)$", description="정렬 키 (latest: 등록일, rating: 평균 별점)"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor, 지정 시 커서 기반 조회)"),
+    include_total: bool = Query(False, description="커서 조회 시 전체 개수 포함 여부"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     도서 목록을 페이지네이션하여 조회합니다.
@@ -150,34 +287,160 @@ async def get_books(
     - 삭제된 도서 제외 (soft delete)
     - 카테고리 필터링 지원
     - 정렬: 0=내림차순(최신순), 1=오름차순(오래된순)
+    - sort=rating: 평균 별점순 (리뷰 없는 도서는 마지막, 페이지 번호 조회만 지원)
+    - cursor 지정 시 OFFSET 대신 (created_at, id) 기준 seek 조회 (전체 개수는 include_total일 때만 계산)
+    - 결과는 쿼리 파라미터별로 Redis에 캐시 (관리자 쓰기 시 버전 증가로 무효화)
     """
+    # 캐시 조회
+    cache_key = await book_list_key({
+        "page": page, "limit": limit, "category": category, "sort_by": sort_by, "sort": sort,
+        "cursor": cursor, "include_total": include_total
+    })
+    cached = await cache_get_raw(cache_key)
+    if cached is not None:
+        return cached_payload_response("도서 목록 조회에 성공했습니다.", cached, BookListResponse)
+
+    ascending = sort_by == 1
+    by_rating = sort == "rating"
+
+    # 별점 정렬은 (created_at, id) 커서와 순서가 달라 OFFSET 페이지네이션만 지원
+    if by_rating and cursor is not None:
+        raise APIException(
+            status_code=400,
+            code="BAD_REQUEST",
+            message="sort=rating은 커서 조회를 지원하지 않습니다",
+            details={"sort": sort}
+        )
+
     # 기본 쿼리 (삭제되지 않은 도서만)
-    query = db.query(Book).filter(Book.deleted_at.is_(None))
+    query = select(Book).where(Book.deleted_at.is_(None))
 
     # 카테고리 필터
     if category:
-        query = query.join(Book.categories).filter(Category.name == category)
+        query = query.join(Book.categories).where(Category.name == category)
 
-    # 정렬
-    if sort_by == 1:
-        query = query.order_by(Book.created_at.asc())
-    else:
-        query = query.order_by(Book.created_at.desc())
+    # 전체 개수 (커서 모드에서는 요청 시에만)
+    total_books = None
+    if cursor is None or include_total:
+        total_books = await db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
 
-    # 전체 개수
-    total_books = query.count()
-    total_pages = math.ceil(total_books / limit) if total_books > 0 else 1
+    # 커서 이후 행만 조회
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            seek_condition(Book.created_at, Book.id, cursor_created_at, cursor_id, ascending)
+        )
 
-    # 페이지네이션 적용
-    offset = (page - 1) * limit
-    books = query.options(
-        joinedload(Book.authors),
-        joinedload(Book.categories)
-    ).offset(offset).limit(limit).all()
+    # 평균 별점 정렬 (book_stats, 리뷰 없는 도서는 방향과 무관하게 마지막)
+    if by_rating:
+        average_rating = BookStats.rating_sum / func.nullif(BookStats.review_count, 0)
+        query = query.outerjoin(BookStats, BookStats.book_id == Book.id).order_by(
+            average_rating.is_(None),
+            average_rating.asc() if ascending else average_rating.desc()
+        )
+
+    # 정렬 (동일 created_at 내에서는 id로 순서 고정)
+    if ascending:
+        query = query.order_by(Book.created_at.asc(), Book.id.asc())
+    else:
+        query = query.order_by(Book.created_at.desc(), Book.id.desc())
+
+    # 페이지네이션 적용 (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+    if cursor is None:
+        query = query.offset((page - 1) * limit)
+    result = await db.execute(
+        query.options(
+            joinedload(Book.authors),
+            joinedload(Book.categories),
+            joinedload(Book.stats)
+        ).limit(limit + 1)
+    )
+    books = result.unique().scalars().all()
+
+    has_next = len(books) > limit
+    books = books[:limit]
+    next_cursor = encode_cursor(books[-1].created_at, books[-1].id) if has_next and not by_rating else None
 
     # 응답 생성
+    book_items = [_book_list_item(book) for book in books]
+
+    if cursor is not None:
+        pagination = BookCursorPagination(
+            next_cursor=next_cursor,
+            has_next=has_next,
+            page_size=limit,
+            page_sort=sort_by,
+            total_books=total_books
+        )
+    else:
+        pagination = BookPagination(
+            total_books=total_books,
+            total_pages=math.ceil(total_books / limit) if total_books > 0 else 1,
+            current_page=page,
+            page_size=limit,
+            page_sort=sort_by,
+            next_cursor=next_cursor
+        )
+
+    payload = BookListResponse(books=book_items, pagination=pagination)
+    # 캐시 저장과 응답(FAST_JSON_RESPONSES)에 같은 직렬화 결과 사용
+    payload_json = payload.model_dump_json()
+    await cache_set_raw(cache_key, payload_json)
+
+    return payload_response("도서 목록 조회에 성공했습니다.", payload, payload_json)
+
+
+# Read (도서 검색)
+@router.get(
+    "/search",
+    summary="도서 검색",
+    response_model=APIResponse[BookSearchResponse],
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "유효하지 않은 커서"},
+        422: {"model": ErrorResponse, "description": "입력값 검증 실패"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    }
+)
+async def search_books(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (제목, 설명, 저자)"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    제목/설명/저자 이름으로 도서를 검색합니다.
+    - 인증 불필요
+    - 삭제된 도서 제외
+    - 관련도 점수 내림차순 (같은 점수는 최신 id 순)
+    - (점수, id) 커서 기반 페이지네이션
+    """
+    after = decode_score_cursor(cursor) if cursor is not None else None
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    hits = await search_backend.search(db, q, limit + 1, after)
+    has_next = len(hits) > limit
+    hits = hits[:limit]
+
+    books_by_id = {}
+    if hits:
+        result = await db.execute(
+            select(Book).options(
+                joinedload(Book.authors),
+                joinedload(Book.categories),
+                joinedload(Book.stats)
+            ).where(
+                Book.id.in_([book_id for book_id, _ in hits]),
+                Book.deleted_at.is_(None)
+            )
+        )
+        books_by_id = {book.id: book for book in result.unique().scalars()}
+
+    # 검색 결과 순서 유지 (색인과 DB 사이에 삭제된 도서는 제외)
     book_items = [
-        BookListItem(
+        BookSearchItem(
             id=book.id,
             title=book.title,
             categories=[cat.name for cat in book.categories],
@@ -186,23 +449,138 @@ async def get_books(
             isbn=book.isbn,
             cover_image_url=book.cover_image_url,
             price=book.price,
-            publication_date=book.publication_date
+            publication_date=book.publication_date,
+            stats=book_stats_summary(book.stats),
+            score=score
         )
-        for book in books
+        for book_id, score in hits
+        if (book := books_by_id.get(book_id)) is not None
     ]
 
-    pagination = BookPagination(
-        total_books=total_books,
-        total_pages=total_pages,
-        current_page=page,
-        page_size=limit,
-        page_sort=sort_by
+    return APIResponse(
+        is_success=True,
+        message="도서 검색에 성공했습니다.",
+        payload=BookSearchResponse(
+            books=book_items,
+            pagination=BookSearchPagination(
+                next_cursor=encode_score_cursor(hits[-1][1], hits[-1][0]) if has_next else None,
+                has_next=has_next,
+                page_size=limit
+            )
+        )
+    )
+
+
+# Read (도서 일괄 조회)
+async def _get_books_batch(db: AsyncSession, ids: list[int]) -> BookBatchResponse:
+    """
+    id 목록의 도서를 요청 순서대로 조회 (중복 id는 한 번만)
+
+    - 상세 캐시를 MGET 1회로 먼저 확인하고, 없는 도서만 DB에서 조회 후 캐시에 저장
+    - DB 조회는 도서 수와 관계없이 3회 (도서+집계, 저자, 카테고리)
+    - 없거나 삭제된 도서 id는 missing_ids로 반환
+    """
+    ids = list(dict.fromkeys(ids))
+    cached = await cache_get_many([book_detail_key(book_id) for book_id in ids], BookListItem)
+    items = {book_id: item for book_id, item in zip(ids, cached) if item is not None}
+
+    uncached = [book_id for book_id in ids if book_id not in items]
+    if uncached:
+        # 여러 권을 joinedload로 한 번에 불러오면 저자x카테고리 행이 곱해지므로 컬렉션은 selectinload
+        result = await db.execute(
+            select(Book).options(
+                joinedload(Book.stats),
+                selectinload(Book.authors),
+                selectinload(Book.categories)
+            ).where(
+                Book.id.in_(uncached),
+                Book.deleted_at.is_(None)
+            )
+        )
+        loaded = {book.id: _book_list_item(book) for book in result.scalars()}
+        await cache_set_many({book_detail_key(book_id): item for book_id, item in loaded.items()})
+        items.update(loaded)
+
+    return BookBatchResponse(
+        books=[items[book_id] for book_id in ids if book_id in items],
+        missing_ids=[book_id for book_id in ids if book_id not in items]
+    )
+
+
+def _parse_batch_ids(values: list[str]) -> list[int]:
+    """ids=1,2,3 또는 ids=1&ids=2 형식의 id 목록 파싱"""
+    try:
+        ids = [int(part) for value in values for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise APIException(
+            status_code=400,
+            code="BAD_REQUEST",
+            message="ids는 쉼표로 구분한 도서 id 목록이어야 합니다",
+            details={"ids": values}
+        )
+    if not ids or len(ids) > BOOK_BATCH_MAX_IDS:
+        raise APIException(
+            status_code=400,
+            code="BAD_REQUEST",
+            message=f"ids는 1개 이상 {BOOK_BATCH_MAX_IDS}개 이하여야 합니다",
+            details={"count": len(ids)}
+        )
+    return ids
+
+
+@router.get(
+    "/batch",
+    summary="도서 일괄 조회",
+    response_model=APIResponse[BookBatchResponse],
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "유효하지 않은 id 목록"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    }
+)
+@query_budget(3)
+async def get_books_batch(
+    ids: list[str] = Query(..., description=f"도서 id 목록 (쉼표 구분, 최대 {BOOK_BATCH_MAX_IDS}개)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    여러 도서의 상세 정보를 한 번에 조회합니다. (라이브러리/위시리스트/추천 목록 화면용)
+    - 인증 불필요
+    - 응답은 요청한 id 순서를 따름 (중복 id는 한 번만)
+    - 없거나 삭제된 도서는 missing_ids로 반환
+    - 긴 목록은 POST /api/books/batch 사용
+    """
+    return APIResponse(
+        is_success=True,
+        message="도서 일괄 조회에 성공했습니다.",
+        payload=await _get_books_batch(db, _parse_batch_ids(ids))
     )
 
+
+@router.post(
+    "/batch",
+    summary="도서 일괄 조회 (POST)",
+    response_model=APIResponse[BookBatchResponse],
+    status_code=status.HTTP_200_OK,
+    responses={
+        422: {"model": ErrorResponse, "description": "입력값 검증 실패"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    }
+)
+@query_budget(3)
+@read_only
+async def post_books_batch(
+    batch: BookBatchRequest,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    GET /api/books/batch와 같으며 id 목록을 요청 본문으로 받습니다. (URL 길이 제한 회피)
+    - 조회 전용이므로 쓰기 요청 한도/primary 고정 대상이 아님
+    """
     return APIResponse(
         is_success=True,
-        message="도서 목록 조회에 성공했습니다.",
-        payload=BookListResponse(books=book_items, pagination=pagination)
+        message="도서 일괄 조회에 성공했습니다.",
+        payload=await _get_books_batch(db, batch.ids)
     )
 
 
@@ -217,55 +595,50 @@ async def get_books(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(1)
 async def get_book_detail(
     request: Request,
     book_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     특정 도서의 상세 정보를 조회합니다.
     - 인증 불필요
     - 삭제된 도서는 조회 불가
+    - 결과는 Redis에 캐시 (수정/삭제 시 무효화)
     """
-    book = db.query(Book).options(
-        joinedload(Book.authors),
-        joinedload(Book.categories)
-    ).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    # 캐시 조회
+    cached = await cache_get_raw(book_detail_key(book_id))
+    if cached is not None:
+        return cached_payload_response("도서 상세 조회에 성공했습니다.", cached, BookListItem)
+
+    result = await db.execute(
+        select(Book).options(
+            joinedload(Book.authors),
+            joinedload(Book.categories),
+            joinedload(Book.stats)
+        ).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
+    book = result.unique().scalar_one_or_none()
 
     #도서 존재 여부 확인
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
-    response_data = BookListItem(
-        id=book.id,
-        title=book.title,
-        categories=[cat.name for cat in book.categories],
-        authors=[auth.name for auth in book.authors],
-        description=book.description,
-        isbn=book.isbn,
-        cover_image_url=book.cover_image_url,
-        price=book.price,
-        publication_date=book.publication_date
-    )
+    response_data = _book_list_item(book)
+    response_json = response_data.model_dump_json()
 
-    return APIResponse(
-        is_success=True,
-        message="도서 상세 조회에 성공했습니다.",
-        payload=response_data
-    )
+    await cache_set_raw(book_detail_key(book_id), response_json)
+
+    return payload_response("도서 상세 조회에 성공했습니다.", response_data, response_json)
 
 
 # Update (도서 수정) - 관리자 전용
@@ -283,11 +656,12 @@ async def get_book_detail(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def update_book(
     request: Request,
     book_id: int,
     book_data: BookUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -298,44 +672,40 @@ async def update_book(
     - 저자/카테고리 변경 시 없으면 자동 생성
     """
     # 도서 조회
-    book = db.query(Book).options(
-        joinedload(Book.authors),
-        joinedload(Book.categories)
-    ).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    result = await db.execute(
+        select(Book).options(
+            joinedload(Book.authors),
+            joinedload(Book.categories),
+            joinedload(Book.stats)
+        ).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
+    book = result.unique().scalar_one_or_none()
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # ISBN 변경 시 중복 검사
     if book_data.isbn and book_data.isbn != book.isbn:
-        existing_book = db.query(Book).filter(
-            Book.isbn == book_data.isbn,
-            Book.id != book_id
-        ).first()
+        existing_book = await db.scalar(
+            select(Book).where(
+                Book.isbn == book_data.isbn,
+                Book.id != book_id
+            )
+        )
         if existing_book:
-            return JSONResponse(
+            raise APIException(
                 status_code=status.HTTP_409_CONFLICT,
-                content=ErrorResponse(
-                    timestamp=datetime.now(),
-                    path=str(request.url.path),
-                    status=409,
-                    code="DUPLICATE_ISBN",
-                    message="이미 등록된 ISBN입니다",
-                    details={"isbn": book_data.isbn}
-                ).model_dump(mode="json")
+                code="DUPLICATE_ISBN",
+                message="이미 등록된 ISBN입니다",
+                details={"isbn": book_data.isbn}
             )
         book.isbn = book_data.isbn
 
@@ -353,44 +723,22 @@ async def update_book(
 
     # 저자 업데이트 (없으면 생성)
     if book_data.authors is not None:
-        authors = []
-        for author_name in book_data.authors:
-            author = db.query(Author).filter(Author.name == author_name).first()
-            if not author:
-                author = Author(name=author_name)
-                db.add(author)
-                db.flush()
-            authors.append(author)
-        book.authors = authors
+        book.authors = await _resolve_names(db, Author, book_data.authors)
+        book.author_names = searchable_authors(author.name for author in book.authors)
 
     # 카테고리 업데이트 (없으면 생성)
     if book_data.categories is not None:
-        categories = []
-        for category_name in book_data.categories:
-            category = db.query(Category).filter(Category.name == category_name).first()
-            if not category:
-                category = Category(name=category_name)
-                db.add(category)
-                db.flush()
-            categories.append(category)
-        book.categories = categories
-
-    db.commit()
-    db.refresh(book)
+        book.categories = await _resolve_names(db, Category, book_data.categories)
 
-    # 응답 생성
-    response_data = BookListItem(
-        id=book.id,
-        title=book.title,
-        categories=[cat.name for cat in book.categories],
-        authors=[auth.name for auth in book.authors],
-        description=book.description,
-        isbn=book.isbn,
-        cover_image_url=book.cover_image_url,
-        price=book.price,
-        publication_date=book.publication_date
+    await db.commit()
+    await invalidate_books(book_id)
+    search_backend.index_book(
+        book.id, book.title, book.description, [author.name for author in book.authors]
     )
 
+    # 응답 생성
+    response_data = _book_list_item(book)
+
     return APIResponse(
         is_success=True,
         message="도서가 성공적으로 수정되었습니다.",
@@ -411,10 +759,11 @@ async def update_book(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def delete_book(
     request: Request,
     book_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
@@ -423,27 +772,26 @@ async def delete_book(
     - 이미 삭제된 도서는 삭제 불가
     """
     # 도서 조회
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    book = await db.scalar(
+        select(Book).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
 
     #도서 존재 여부 확인
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # Soft Delete (deleted_at 설정)
     book.deleted_at = datetime.now()
-    db.commit()
+    await db.commit()
+    await invalidate_books(book_id)
+    search_backend.remove_book(book_id)
 
     return None
@@ -1,12 +1,17 @@
 #외부 모듈
 import math
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 #내부 모듈
-from src.database import get_db
+from src.database import get_async_db
+from src.replica import get_read_db
+from src.rate_limit import write_limit
+from src.query_debug import query_budget
 from src.schema.comments import (
     CommentCreate,
     CommentCreateResponse,
@@ -23,8 +28,12 @@ from src.schema.common import APIResponse, ErrorResponse
 from src.models.comment import Comment
 from src.models.comment_like import CommentLike
 from src.models.book import Book
+from src.models.book_stats import BookStats
 from src.models.user import User
-from src.auth.jwt import get_current_user
+from src.auth.jwt import APIException, get_current_user
+from src.pagination import encode_cursor, decode_cursor, seek_condition
+from src.stats import book_stats_delta
+from src.cache import invalidate_book_detail
 
 
 router = APIRouter(prefix="/api", tags=["Comments"])
@@ -44,11 +53,12 @@ router = APIRouter(prefix="/api", tags=["Comments"])
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def create_comment(
     request: Request,
     book_id: int,
     comment_data: CommentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -56,22 +66,19 @@ async def create_comment(
     - 인증 필요
     """
     # 도서 존재 여부 확인
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    book = await db.scalar(
+        select(Book).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # 댓글 생성
@@ -82,8 +89,10 @@ async def create_comment(
     )
 
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
+    await db.execute(book_stats_delta(book_id, comment_count=1))
+    await db.commit()
+    await db.refresh(new_comment)
+    await invalidate_book_detail(book_id)
 
     return APIResponse(
         is_success=True,
@@ -106,51 +115,68 @@ async def create_comment(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 async def get_comments(
     request: Request,
     book_id: int,
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     size: int = Query(10, ge=1, le=100, description="페이지당 댓글 수 (기본값: 10)"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 nextCursor, 지정 시 커서 기반 조회)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     특정 도서에 대한 댓글 목록을 페이지네이션으로 조회합니다.
     - 인증 불필요
     - 삭제된 도서는 조회 불가
+    - cursor 지정 시 OFFSET 대신 (created_at, id) 기준 seek 조회
+    - 전체 개수는 book_stats의 증분 카운터 사용
     """
-    # 도서 존재 여부 확인
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    # 도서 존재 여부 확인 + 댓글 수 조회 (한 번의 쿼리)
+    book = (await db.execute(
+        select(Book.id, BookStats.comment_count).outerjoin(
+            BookStats, BookStats.book_id == Book.id
+        ).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )).first()
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # 댓글 쿼리 (최신순 정렬)
-    query = db.query(Comment).filter(
+    query = select(Comment).where(
         Comment.book_id == book_id
-    ).order_by(Comment.created_at.desc())
+    ).order_by(Comment.created_at.desc(), Comment.id.desc())
 
     # 전체 개수
-    total_elements = query.count()
+    total_elements = book.comment_count or 0
     total_pages = math.ceil(total_elements / size) if total_elements > 0 else 1
 
-    # 페이지네이션 적용
-    offset = (page - 1) * size
-    comments = query.options(
-        joinedload(Comment.user)
-    ).offset(offset).limit(size).all()
+    # 페이지네이션 적용 (커서 지정 시 seek, 아니면 OFFSET)
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            seek_condition(Comment.created_at, Comment.id, cursor_created_at, cursor_id, ascending=False)
+        )
+    else:
+        query = query.offset((page - 1) * size)
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    comments = (await db.scalars(
+        query.options(
+            joinedload(Comment.user)
+        ).limit(size + 1)
+    )).all()
+
+    has_next = len(comments) > size
+    comments = comments[:size]
+    next_cursor = encode_cursor(comments[-1].created_at, comments[-1].id) if has_next else None
 
     # 응답 생성
     comment_items = [
@@ -164,9 +190,10 @@ async def get_comments(
     ]
 
     pagination = CommentPagination(
-        page=page,
+        page=page if cursor is None else None,
         totalPages=total_pages,
-        totalElements=total_elements
+        totalElements=total_elements,
+        nextCursor=next_cursor
     )
 
     return APIResponse(
@@ -190,11 +217,12 @@ async def get_comments(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def update_comment(
     request: Request,
     comment_id: int,
     comment_data: CommentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -203,42 +231,32 @@ async def update_comment(
     - 본인 댓글만 수정 가능
     """
     # 댓글 조회
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.scalar(select(Comment).where(Comment.id == comment_id))
 
     # 댓글 존재 여부 확인
     if not comment:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="COMMENT_NOT_FOUND",
-                message="해당 댓글을 찾을 수 없습니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="COMMENT_NOT_FOUND",
+            message="해당 댓글을 찾을 수 없습니다",
+            details={"comment_id": comment_id}
         )
 
     # 본인 댓글인지 확인
     if comment.user_id != current_user.id:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="본인의 댓글만 수정할 수 있습니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="본인의 댓글만 수정할 수 있습니다",
+            details={"comment_id": comment_id}
         )
 
     # 필드 업데이트
     comment.content = comment_data.content
     comment.updated_at = datetime.now()
 
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
+    await db.refresh(comment)
 
     return APIResponse(
         is_success=True,
@@ -263,10 +281,11 @@ async def update_comment(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def delete_comment(
     request: Request,
     comment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -275,42 +294,34 @@ async def delete_comment(
     - 본인 댓글만 삭제 가능
     """
     # 댓글 조회
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.scalar(select(Comment).where(Comment.id == comment_id))
 
     # 댓글 존재 여부 확인
     if not comment:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="COMMENT_NOT_FOUND",
-                message="해당 댓글을 찾을 수 없습니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="COMMENT_NOT_FOUND",
+            message="해당 댓글을 찾을 수 없습니다",
+            details={"comment_id": comment_id}
         )
 
     # 본인 댓글인지 확인
     if comment.user_id != current_user.id:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="본인의 댓글만 삭제할 수 있습니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="본인의 댓글만 삭제할 수 있습니다",
+            details={"comment_id": comment_id}
         )
 
     # 댓글 ID 저장 (삭제 후 반환용)
     deleted_id = comment.id
 
     # 댓글 삭제
-    db.delete(comment)
-    db.commit()
+    await db.delete(comment)
+    await db.execute(book_stats_delta(comment.book_id, comment_count=-1))
+    await db.commit()
+    await invalidate_book_detail(comment.book_id)
 
     return APIResponse(
         is_success=True,
@@ -334,10 +345,11 @@ async def delete_comment(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def like_comment(
     request: Request,
     comment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -345,39 +357,31 @@ async def like_comment(
     - 인증 필요
     - 중복 좋아요 불가
     """
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.scalar(select(Comment).where(Comment.id == comment_id))
 
     # 댓글 존재 여부 확인
     if not comment:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="COMMENT_NOT_FOUND",
-                message="해당 댓글을 찾을 수 없습니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="COMMENT_NOT_FOUND",
+            message="해당 댓글을 찾을 수 없습니다",
+            details={"comment_id": comment_id}
         )
 
     # 중복 좋아요 검사
-    existing_like = db.query(CommentLike).filter(
-        CommentLike.user_id == current_user.id,
-        CommentLike.comment_id == comment_id
-    ).first()
+    existing_like = await db.scalar(
+        select(CommentLike).where(
+            CommentLike.user_id == current_user.id,
+            CommentLike.comment_id == comment_id
+        )
+    )
 
     if existing_like:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=409,
-                code="DUPLICATE_LIKE",
-                message="이미 좋아요를 누른 댓글입니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="DUPLICATE_LIKE",
+            message="이미 좋아요를 누른 댓글입니다",
+            details={"comment_id": comment_id}
         )
 
     # 좋아요 생성
@@ -387,8 +391,14 @@ async def like_comment(
     )
 
     db.add(new_like)
-    db.commit()
-    db.refresh(new_like)
+    await db.flush()
+
+    # 좋아요 수 증가 (같은 트랜잭션에서 원자적으로 갱신)
+    await db.execute(
+        update(Comment).where(Comment.id == comment_id).values(like_count=Comment.like_count + 1)
+    )
+    await db.commit()
+    await db.refresh(new_like)
 
     return APIResponse(
         is_success=True,
@@ -412,10 +422,11 @@ async def like_comment(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def unlike_comment(
     request: Request,
     comment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -424,28 +435,33 @@ async def unlike_comment(
     - 본인이 누른 좋아요만 취소 가능
     """
     # 좋아요 조회
-    like = db.query(CommentLike).filter(
-        CommentLike.user_id == current_user.id,
-        CommentLike.comment_id == comment_id
-    ).first()
+    like = await db.scalar(
+        select(CommentLike).where(
+            CommentLike.user_id == current_user.id,
+            CommentLike.comment_id == comment_id
+        )
+    )
 
     # 좋아요 존재 여부 확인
     if not like:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="LIKE_NOT_FOUND",
-                message="좋아요를 누르지 않은 댓글입니다",
-                details={"comment_id": comment_id}
-            ).model_dump(mode="json")
+            code="LIKE_NOT_FOUND",
+            message="좋아요를 누르지 않은 댓글입니다",
+            details={"comment_id": comment_id}
         )
 
     # 좋아요 삭제
-    db.delete(like)
-    db.commit()
+    await db.delete(like)
+    await db.flush()
+
+    # 좋아요 수 감소
+    await db.execute(
+        update(Comment).where(Comment.id == comment_id, Comment.like_count > 0).values(
+            like_count=Comment.like_count - 1
+        )
+    )
+    await db.commit()
 
     return APIResponse(
         is_success=True,
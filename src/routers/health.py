@@ -1,9 +1,15 @@
 from fastapi import APIRouter
 from datetime import datetime
 
+from src.cache import cache_stats
+from src.auth.user_cache import user_cache
+from src.auth.jwt import token_cache
+from src.rate_limit import limiter
+
 router = APIRouter(prefix="/api/health", tags=["Health"])
 
 @router.get("/")
+@limiter.exempt
 async def health_check():
     """
     서버가 정상인지 확인
@@ -15,4 +21,28 @@ async def health_check():
         "service": "WSD_Subject API Server",
         "developer": "202117643 최강림"
     }
-    return health_status
\ No newline at end of file
+    return health_status
+
+
+@router.get("/cache")
+@limiter.exempt
+async def cache_health():
+    """
+    도서/사용자/토큰 캐시 적중/실패 카운터 (현재 워커 프로세스 기준)
+
+    - users.hits: get_current_user에서 생략된 DB 조회 수
+    - tokens.hits: verify_token에서 생략된 JWT 디코딩 수
+    """
+    return {
+        "books": _with_hit_ratio(cache_stats),
+        "users": _with_hit_ratio(user_cache.stats),
+        "tokens": _with_hit_ratio(token_cache.stats)
+    }
+
+
+def _with_hit_ratio(stats: dict) -> dict:
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0
+    }
@@ -1,13 +1,17 @@
 #외부 모듈
 import math
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request, status
-from fastapi.responses import JSONResponse
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 #내부 모듈
-from src.database import get_db
+from src.database import get_async_db
+from src.replica import get_read_db
+from src.rate_limit import write_limit
+from src.query_debug import query_budget
 from src.schema.reviews import (
     ReviewCreate,
     ReviewCreateResponse,
@@ -26,8 +30,12 @@ from src.schema.common import APIResponse, ErrorResponse
 from src.models.review import Review
 from src.models.review_like import ReviewLike
 from src.models.book import Book
+from src.models.book_stats import BookStats
 from src.models.user import User
-from src.auth.jwt import get_current_user
+from src.auth.jwt import APIException, get_current_user
+from src.pagination import encode_cursor, decode_cursor, seek_condition
+from src.stats import book_stats_delta, rating_deltas, rating_change_deltas
+from src.cache import invalidate_book_detail
 
 
 router = APIRouter(prefix="/api", tags=["Reviews"])
@@ -48,11 +56,12 @@ router = APIRouter(prefix="/api", tags=["Reviews"])
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def create_review(
     request: Request,
     book_id: int,
     review_data: ReviewCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -61,41 +70,35 @@ async def create_review(
     - 한 사용자가 같은 도서에 중복 리뷰 불가
     """
     # 도서 존재 여부 확인
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    book = await db.scalar(
+        select(Book).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # 중복 리뷰 검사
-    existing_review = db.query(Review).filter(
-        Review.user_id == current_user.id,
-        Review.book_id == book_id
-    ).first()
+    existing_review = await db.scalar(
+        select(Review).where(
+            Review.user_id == current_user.id,
+            Review.book_id == book_id
+        )
+    )
 
     if existing_review:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=409,
-                code="DUPLICATE_REVIEW",
-                message="이미 해당 도서에 리뷰를 작성하셨습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="DUPLICATE_REVIEW",
+            message="이미 해당 도서에 리뷰를 작성하셨습니다",
+            details={"book_id": book_id}
         )
 
     # 리뷰 생성
@@ -107,8 +110,10 @@ async def create_review(
     )
 
     db.add(new_review)
-    db.commit()
-    db.refresh(new_review)
+    await db.execute(book_stats_delta(book_id, review_count=1, **rating_deltas(review_data.rating)))
+    await db.commit()
+    await db.refresh(new_review)
+    await invalidate_book_detail(book_id)
 
     return APIResponse(
         is_success=True,
@@ -131,51 +136,68 @@ async def create_review(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 async def get_reviews(
     request: Request,
     book_id: int,
     page: int = Query(1, ge=1, description="페이지 번호 (기본값: 1)"),
     size: int = Query(10, ge=1, le=100, description="페이지당 리뷰 수 (기본값: 10)"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 nextCursor, 지정 시 커서 기반 조회)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     특정 도서에 대한 리뷰 목록을 페이지네이션으로 조회합니다.
     - 인증 불필요
     - 삭제된 도서는 조회 불가
+    - cursor 지정 시 OFFSET 대신 (created_at, id) 기준 seek 조회
+    - 전체 개수는 book_stats의 증분 카운터 사용
     """
-    # 도서 존재 여부 확인
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    # 도서 존재 여부 확인 + 리뷰 수 조회 (한 번의 쿼리)
+    book = (await db.execute(
+        select(Book.id, BookStats.review_count).outerjoin(
+            BookStats, BookStats.book_id == Book.id
+        ).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )).first()
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # 리뷰 쿼리 (최신순 정렬)
-    query = db.query(Review).filter(
+    query = select(Review).where(
         Review.book_id == book_id
-    ).order_by(Review.created_at.desc())
+    ).order_by(Review.created_at.desc(), Review.id.desc())
 
     # 전체 개수
-    total_elements = query.count()
+    total_elements = book.review_count or 0
     total_pages = math.ceil(total_elements / size) if total_elements > 0 else 1
 
-    # 페이지네이션 적용
-    offset = (page - 1) * size
-    reviews = query.options(
-        joinedload(Review.user)
-    ).offset(offset).limit(size).all()
+    # 페이지네이션 적용 (커서 지정 시 seek, 아니면 OFFSET)
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            seek_condition(Review.created_at, Review.id, cursor_created_at, cursor_id, ascending=False)
+        )
+    else:
+        query = query.offset((page - 1) * size)
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    reviews = (await db.scalars(
+        query.options(
+            joinedload(Review.user)
+        ).limit(size + 1)
+    )).all()
+
+    has_next = len(reviews) > size
+    reviews = reviews[:size]
+    next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id) if has_next else None
 
     # 응답 생성
     review_items = [
@@ -190,9 +212,10 @@ async def get_reviews(
     ]
 
     pagination = ReviewPagination(
-        page=page,
+        page=page if cursor is None else None,
         totalPages=total_pages,
-        totalElements=total_elements
+        totalElements=total_elements,
+        nextCursor=next_cursor
     )
 
     return APIResponse(
@@ -216,11 +239,12 @@ async def get_reviews(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def update_review(
     request: Request,
     review_id: int,
     review_data: ReviewUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -228,47 +252,43 @@ async def update_review(
     - 인증 필요
     - 본인 리뷰만 수정 가능
     """
-    # 리뷰 조회
-    review = db.query(Review).filter(Review.id == review_id).first()
+    # 리뷰 조회 (별점 집계를 이전 값 기준으로 옮기므로 행 잠금)
+    review = await db.scalar(select(Review).where(Review.id == review_id).with_for_update())
 
     # 리뷰 존재 여부 확인
     if not review:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="REVIEW_NOT_FOUND",
-                message="해당 리뷰를 찾을 수 없습니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="REVIEW_NOT_FOUND",
+            message="해당 리뷰를 찾을 수 없습니다",
+            details={"review_id": review_id}
         )
 
     # 본인 리뷰인지 확인
     if review.user_id != current_user.id:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="본인의 리뷰만 수정할 수 있습니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="본인의 리뷰만 수정할 수 있습니다",
+            details={"review_id": review_id}
         )
 
     # 필드 업데이트
     if review_data.content is not None:
         review.content = review_data.content
-    if review_data.rating is not None:
+    rating_changed = review_data.rating is not None and review_data.rating != review.rating
+    if rating_changed:
+        await db.execute(book_stats_delta(
+            review.book_id, **rating_change_deltas(review.rating, review_data.rating)
+        ))
         review.rating = review_data.rating
 
     review.updated_at = datetime.now()
 
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    await db.refresh(review)
+    if rating_changed:
+        await invalidate_book_detail(review.book_id)
 
     return APIResponse(
         is_success=True,
@@ -293,10 +313,11 @@ async def update_review(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def delete_review(
     request: Request,
     review_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -305,42 +326,36 @@ async def delete_review(
     - 본인 리뷰만 삭제 가능
     """
     # 리뷰 조회
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = await db.scalar(select(Review).where(Review.id == review_id))
 
     # 리뷰 존재 여부 확인
     if not review:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="REVIEW_NOT_FOUND",
-                message="해당 리뷰를 찾을 수 없습니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="REVIEW_NOT_FOUND",
+            message="해당 리뷰를 찾을 수 없습니다",
+            details={"review_id": review_id}
         )
 
     # 본인 리뷰인지 확인
     if review.user_id != current_user.id:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="본인의 리뷰만 삭제할 수 있습니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="본인의 리뷰만 삭제할 수 있습니다",
+            details={"review_id": review_id}
         )
 
     # 리뷰 ID 저장 (삭제 후 반환용)
     deleted_id = review.id
 
     # 리뷰 삭제
-    db.delete(review)
-    db.commit()
+    await db.delete(review)
+    await db.execute(book_stats_delta(
+        review.book_id, review_count=-1, **rating_deltas(review.rating, -1)
+    ))
+    await db.commit()
+    await invalidate_book_detail(review.book_id)
 
     return APIResponse(
         is_success=True,
@@ -364,10 +379,11 @@ async def delete_review(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def like_review(
     request: Request,
     review_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -375,39 +391,31 @@ async def like_review(
     - 인증 필요
     - 중복 좋아요 불가
     """
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = await db.scalar(select(Review).where(Review.id == review_id))
 
     # 리뷰 존재 여부 확인
     if not review:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="REVIEW_NOT_FOUND",
-                message="해당 리뷰를 찾을 수 없습니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="REVIEW_NOT_FOUND",
+            message="해당 리뷰를 찾을 수 없습니다",
+            details={"review_id": review_id}
         )
 
     # 중복 좋아요 검사
-    existing_like = db.query(ReviewLike).filter(
-        ReviewLike.user_id == current_user.id,
-        ReviewLike.review_id == review_id
-    ).first()
+    existing_like = await db.scalar(
+        select(ReviewLike).where(
+            ReviewLike.user_id == current_user.id,
+            ReviewLike.review_id == review_id
+        )
+    )
 
     if existing_like:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=409,
-                code="DUPLICATE_LIKE",
-                message="이미 좋아요를 누른 리뷰입니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="DUPLICATE_LIKE",
+            message="이미 좋아요를 누른 리뷰입니다",
+            details={"review_id": review_id}
         )
 
     # 좋아요 생성
@@ -417,8 +425,14 @@ async def like_review(
     )
 
     db.add(new_like)
-    db.commit()
-    db.refresh(new_like)
+    await db.flush()
+
+    # 좋아요 수 증가 (같은 트랜잭션에서 원자적으로 갱신)
+    await db.execute(
+        update(Review).where(Review.id == review_id).values(like_count=Review.like_count + 1)
+    )
+    await db.commit()
+    await db.refresh(new_like)
 
     return APIResponse(
         is_success=True,
@@ -442,10 +456,11 @@ async def like_review(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def unlike_review(
     request: Request,
     review_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -454,28 +469,33 @@ async def unlike_review(
     - 본인이 누른 좋아요만 취소 가능
     """
     # 좋아요 조회
-    like = db.query(ReviewLike).filter(
-        ReviewLike.user_id == current_user.id,
-        ReviewLike.review_id == review_id
-    ).first()
+    like = await db.scalar(
+        select(ReviewLike).where(
+            ReviewLike.user_id == current_user.id,
+            ReviewLike.review_id == review_id
+        )
+    )
 
     # 좋아요 존재 여부 확인
     if not like:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="LIKE_NOT_FOUND",
-                message="좋아요를 누르지 않은 리뷰입니다",
-                details={"review_id": review_id}
-            ).model_dump(mode="json")
+            code="LIKE_NOT_FOUND",
+            message="좋아요를 누르지 않은 리뷰입니다",
+            details={"review_id": review_id}
         )
 
     # 좋아요 삭제
-    db.delete(like)
-    db.commit()
+    await db.delete(like)
+    await db.flush()
+
+    # 좋아요 수 감소
+    await db.execute(
+        update(Review).where(Review.id == review_id, Review.like_count > 0).values(
+            like_count=Review.like_count - 1
+        )
+    )
+    await db.commit()
 
     return APIResponse(
         is_success=True,
@@ -496,68 +516,58 @@ async def unlike_review(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 async def get_top_reviews(
     request: Request,
     book_id: int,
     limit: int = Query(10, ge=1, le=50, description="조회할 리뷰 수 (기본값: 10, 최대: 50)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     특정 도서의 좋아요 순 Top-N 리뷰를 조회합니다.
     - 인증 불필요
     - 좋아요 수 기준 내림차순 정렬
     """
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    book = await db.scalar(
+        select(Book).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
 
     # 도서 존재 여부 확인
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
-    # 좋아요 수 기준 Top-N 리뷰 조회
-    like_count = func.count(ReviewLike.review_id).label("like_count")
-
-    reviews_with_likes = db.query(
-        Review,
-        like_count
-    ).outerjoin(
-        ReviewLike, Review.id == ReviewLike.review_id
-    ).filter(
-        Review.book_id == book_id
-    ).group_by(
-        Review.id
-    ).order_by(
-        like_count.desc(),
-        Review.created_at.desc()
-    ).limit(limit).all()
+    # 좋아요 수 기준 Top-N 리뷰 조회 (idx_reviews_book_likes 인덱스 역순 스캔, 작성자 함께 로드)
+    top_reviews = (await db.scalars(
+        select(Review).options(
+            joinedload(Review.user)
+        ).where(
+            Review.book_id == book_id
+        ).order_by(
+            Review.like_count.desc(),
+            Review.created_at.desc()
+        ).limit(limit)
+    )).all()
 
     # 응답 생성
-    review_items = []
-    for review, likes in reviews_with_likes:
-        # user 정보 로드
-        user = db.query(User).filter(User.id == review.user_id).first()
-        review_items.append(
-            TopReviewItem(
-                id=review.id,
-                author=ReviewAuthor(name=user.name if user else "Unknown"),
-                content=review.content,
-                rating=review.rating,
-                like_count=likes or 0,
-                created_at=review.created_at
-            )
+    review_items = [
+        TopReviewItem(
+            id=review.id,
+            author=ReviewAuthor(name=review.user.name if review.user else "Unknown"),
+            content=review.content,
+            rating=review.rating,
+            like_count=review.like_count,
+            created_at=review.created_at
         )
+        for review in top_reviews
+    ]
 
     return APIResponse(
         is_success=True,
@@ -1,17 +1,40 @@
 #외부 모듈
+from collections import defaultdict
 from datetime import datetime
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import bcrypt
 
 #내부 모듈
-from src.database import get_db
-from src.schema.users import UserCreate, UserCreateResponse, UserGetMeResponse, UserUpdate
+from src.database import get_db, get_async_db
+from src.rate_limit import write_limit
+from src.query_debug import query_budget
+from src.schema.users import (
+    UserCreate,
+    UserCreateResponse,
+    UserCursorPagination,
+    UserGetMeResponse,
+    UserListItem,
+    UserListResponse,
+    UserUpdate
+)
 from src.schema.common import APIResponse, ErrorResponse
 from src.models.user import User
-from src.auth.password import hash_password, verify_password
-from src.auth.jwt import get_current_user, get_current_admin_user
+from src.models.review import Review
+from src.models.comment import Comment
+from src.models.review_like import ReviewLike
+from src.models.comment_like import CommentLike
+from src.models.wishlist_item import WishlistItem
+from src.stats import book_stats_delta, rating_deltas
+from src.pagination import encode_cursor, decode_cursor, seek_condition
+from src.auth.password import hash_password_async, verify_password_async
+from src.auth.jwt import APIException, get_current_user, get_current_admin_user
+from src.auth.user_cache import publish_user_invalidation
+from src.redis import revoke_all_refresh_tokens, revoke_all_refresh_tokens_async
 
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
@@ -28,40 +51,36 @@ router = APIRouter(prefix="/api/users", tags=["Users"])
         409: {"model": ErrorResponse, "description": "이메일 중복"},
         422: {"model": ErrorResponse, "description": "입력값 검증 실패"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "비밀번호 해싱 대기열 초과"},
     }
 )
-async def create_user(request: Request, user: UserCreate, db: Session = Depends(get_db)):
+@write_limit
+async def create_user(request: Request, user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     회원가입
     - 이메일 중복 검사
-    - 비밀번호 bcrypt 해싱
+    - 비밀번호 bcrypt 해싱 (전용 프로세스 풀)
     """
     # 이메일 중복 검사
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user.email))
     if existing_user:
-        error = ErrorResponse(
-            timestamp=datetime.now(),
-            path=str(request.url.path),
-            status=409,
+        raise APIException(
+            status_code=status.HTTP_409_CONFLICT,
             code="DUPLICATE_EMAIL",
             message="이미 등록된 이메일입니다",
             details={"email": user.email}
         )
-        return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content=error.model_dump(mode="json")
-        )
 
     # 비밀번호 해싱 후 저장
     new_user = User(
         email=user.email,
-        password_hash=hash_password(user.password),
+        password_hash=await hash_password_async(user.password),
         name=user.name,
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return APIResponse(
         is_success=True,
@@ -83,6 +102,7 @@ async def create_user(request: Request, user: UserCreate, db: Session = Depends(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(1)
 def get_me(current_user: User = Depends(get_current_user)):
     """
     현재 로그인한 사용자의 프로필 정보를 조회합니다.
@@ -96,34 +116,132 @@ def get_me(current_user: User = Depends(get_current_user)):
 
 
 # 사용자 목록 조회 (ADMIN)
+
+# 목록/내보내기에서 조회하는 컬럼 (ORM 객체 대신 필요한 컬럼만)
+USER_LIST_COLUMNS = (User.id, User.email, User.name, User.role, User.created_at, User.updated_at)
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+USER_EXPORT_BATCH_SIZE = 1000
+
+
+def _prefix_pattern(prefix: str) -> str:
+    """LIKE 접두어 패턴 (%, _를 문자 그대로 비교)"""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def user_list_filters(
+    created_from: Optional[datetime] = Query(None, description="가입일 시작 (이상)"),
+    created_to: Optional[datetime] = Query(None, description="가입일 끝 (미만)"),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=100, description="이름 접두어"),
+    email_prefix: Optional[str] = Query(None, min_length=1, max_length=255, description="이메일 접두어")
+) -> list:
+    """사용자 목록/내보내기 공통 필터 조건 (관리자 계정 제외)"""
+    # role = 'user' 등치 조건이어야 idx_users_role_created를 정렬 순서대로 탐색 (관리자 제외와 동일)
+    conditions = [User.role == "user"]
+    if created_from is not None:
+        conditions.append(User.created_at >= created_from)
+    if created_to is not None:
+        conditions.append(User.created_at < created_to)
+    # 'prefix%' 형태의 LIKE는 인덱스 범위 탐색으로 처리됨
+    if name_prefix:
+        conditions.append(User.name.like(_prefix_pattern(name_prefix), escape="\\"))
+    if email_prefix:
+        conditions.append(User.email.like(_prefix_pattern(email_prefix), escape="\\"))
+    return conditions
+
+
 @router.get(
     "/",
     summary="사용자 목록 조회 (ADMIN)",
-    response_model=APIResponse[list[UserGetMeResponse]],
+    response_model=APIResponse[UserListResponse],
     status_code=status.HTTP_200_OK,
     responses={
+        400: {"model": ErrorResponse, "description": "유효하지 않은 커서"},
         401: {"model": ErrorResponse, "description": "인증 필요"},
         403: {"model": ErrorResponse, "description": "관리자 권한 필요"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 def get_users(
+    limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor)"),
+    conditions: list = Depends(user_list_filters),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
-    모든 사용자 목록을 조회합니다.
+    사용자 목록을 조회합니다.
     - 관리자 전용 API
     - 관리자 계정은 목록에서 제외됩니다.
+    - 가입일 최신순, (created_at, id) 커서 기반 페이지네이션
+    - 가입일 범위, 이름/이메일 접두어로 필터링
+    - 전체 내보내기는 GET /api/users/export 사용
     """
-    users = db.query(User).filter(User.role != "admin").all()
+    query = select(*USER_LIST_COLUMNS).where(*conditions)
+    if cursor is not None:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.where(seek_condition(User.created_at, User.id, created_at, last_id, ascending=False))
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = db.execute(
+        query.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    ).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
     return APIResponse(
         is_success=True,
         message="사용자 목록 조회 성공",
-        payload=[UserGetMeResponse.model_validate(user) for user in users]
+        payload=UserListResponse(
+            users=[UserListItem.model_validate(row) for row in rows],
+            pagination=UserCursorPagination(
+                next_cursor=encode_cursor(rows[-1].created_at, rows[-1].id) if has_next else None,
+                has_next=has_next,
+                page_size=limit
+            )
+        )
     )
 
 
+# 사용자 내보내기 (ADMIN)
+@router.get(
+    "/export",
+    summary="사용자 내보내기 (ADMIN, NDJSON)",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "사용자 1명당 한 줄 JSON"},
+        401: {"model": ErrorResponse, "description": "인증 필요"},
+        403: {"model": ErrorResponse, "description": "관리자 권한 필요"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+    }
+)
+@query_budget(2)
+async def export_users(
+    conditions: list = Depends(user_list_filters),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    필터에 맞는 사용자 전체를 NDJSON으로 스트리밍합니다.
+    - 관리자 전용 API (필터는 목록 조회와 동일)
+    - 서버 측 커서(yield_per)로 USER_EXPORT_BATCH_SIZE행씩 읽어 바로 전송하므로
+      사용자 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    result = await db.stream(
+        select(*USER_LIST_COLUMNS).where(*conditions).order_by(User.id).execution_options(
+            yield_per=USER_EXPORT_BATCH_SIZE
+        )
+    )
+
+    async def lines():
+        async for rows in result.partitions():
+            yield "".join(UserListItem.model_validate(row).model_dump_json() + "\n" for row in rows)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # 특정 사용자 조회 (ADMIN)
 @router.get(
     "/{user_id}",
@@ -137,6 +255,7 @@ def get_users(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 def get_user_by_id(
     request: Request,
     user_id: int,
@@ -150,16 +269,11 @@ def get_user_by_id(
     """
     user = db.query(User).filter(User.id == user_id, User.role != "admin").first()
     if not user:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="USER_NOT_FOUND",
-                message="사용자를 찾을 수 없습니다",
-                details={"user_id": user_id}
-            ).model_dump(mode="json")
+            code="USER_NOT_FOUND",
+            message="사용자를 찾을 수 없습니다",
+            details={"user_id": user_id}
         )
 
     return APIResponse(
@@ -183,12 +297,14 @@ def get_user_by_id(
         403: {"model": ErrorResponse, "description": "관리자 계정 수정 불가"},
         422: {"model": ErrorResponse, "description": "입력값 검증 실패"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "비밀번호 해싱 대기열 초과"},
     }
 )
-def update_me(
+@write_limit
+async def update_me(
     request: Request,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -199,73 +315,65 @@ def update_me(
     """
     # 관리자 계정 수정 차단
     if str(current_user.role) == "admin":
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="관리자 계정은 API를 통해 수정할 수 없습니다"
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="관리자 계정은 API를 통해 수정할 수 없습니다"
         )
 
+    # 캐시된(세션 미연결) 사용자일 수 있으므로 세션에 연결된 행으로 다시 조회
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise APIException(status_code=401, code="USER_NOT_FOUND", message="User not found")
+
     # 수정할 내용이 없는 경우
     if not user_update.name and not user_update.new_password:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=400,
-                code="BAD_REQUEST",
-                message="수정할 내용이 없습니다"
-            ).model_dump(mode="json")
+            code="BAD_REQUEST",
+            message="수정할 내용이 없습니다"
         )
 
     # 비밀번호 변경 요청인 경우
     if user_update.new_password:
         # 현재 비밀번호 필수 확인
         if not user_update.current_password:
-            return JSONResponse(
+            raise APIException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                content=ErrorResponse(
-                    timestamp=datetime.now(),
-                    path=str(request.url.path),
-                    status=400,
-                    code="VALIDATION_FAILED",
-                    message="비밀번호 변경 시 현재 비밀번호가 필요합니다",
-                    details={"current_password": "현재 비밀번호를 입력해주세요"}
-                ).model_dump(mode="json")
+                code="VALIDATION_FAILED",
+                message="비밀번호 변경 시 현재 비밀번호가 필요합니다",
+                details={"current_password": "현재 비밀번호를 입력해주세요"}
             )
 
         # 현재 비밀번호 검증
-        if not verify_password(user_update.current_password, str(current_user.password_hash)):
-            return JSONResponse(
+        if not await verify_password_async(user_update.current_password, str(user.password_hash)):
+            raise APIException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                content=ErrorResponse(
-                    timestamp=datetime.now(),
-                    path=str(request.url.path),
-                    status=401,
-                    code="UNAUTHORIZED",
-                    message="현재 비밀번호가 일치하지 않습니다"
-                ).model_dump(mode="json")
+                code="UNAUTHORIZED",
+                message="현재 비밀번호가 일치하지 않습니다"
             )
 
         # 새 비밀번호로 변경
-        current_user.password_hash = hash_password(user_update.new_password)
+        user.password_hash = await hash_password_async(user_update.new_password)
 
     # 이름 변경
     if user_update.name:
-        current_user.name = user_update.name
+        user.name = user_update.name
 
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(user)
+
+    # 모든 워커의 사용자 캐시 무효화
+    publish_user_invalidation(user.id)
+
+    # 비밀번호가 바뀌면 모든 기기의 Refresh Token 폐기 (다시 로그인 필요)
+    if user_update.new_password:
+        await revoke_all_refresh_tokens_async(user.id)
 
     return APIResponse(
         is_success=True,
         message="프로필 수정 성공",
-        payload=UserGetMeResponse.model_validate(current_user)
+        payload=UserGetMeResponse.model_validate(user)
     )
 
 
@@ -283,6 +391,7 @@ def update_me(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 def delete_me(
     request: Request,
     db: Session = Depends(get_db),
@@ -294,20 +403,51 @@ def delete_me(
     """
     # 관리자 계정 삭제 차단
     if str(current_user.role) == "admin":
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=403,
-                code="FORBIDDEN",
-                message="관리자 계정은 API를 통해 삭제할 수 없습니다"
-            ).model_dump(mode="json")
+            code="FORBIDDEN",
+            message="관리자 계정은 API를 통해 삭제할 수 없습니다"
         )
 
-    db.delete(current_user)
+    # 함께 삭제되는 리뷰(별점)/댓글/위시리스트 수만큼 도서 집계 차감
+    deltas: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    ratings = db.query(Review.book_id, Review.rating, func.count()).filter(
+        Review.user_id == current_user.id
+    ).group_by(Review.book_id, Review.rating).all()
+    for book_id, rating, count in ratings:
+        deltas[book_id]["review_count"] -= count
+        for column, delta in rating_deltas(rating, -1).items():
+            deltas[book_id][column] += delta * count
+    for model, column in ((Comment, "comment_count"), (WishlistItem, "wishlist_count")):
+        counts = db.query(model.book_id, func.count()).filter(
+            model.user_id == current_user.id
+        ).group_by(model.book_id).all()
+        for book_id, count in counts:
+            deltas[book_id][column] -= count
+    for book_id, columns in deltas.items():
+        db.execute(book_stats_delta(book_id, **columns))
+
+    # 함께 삭제되는 좋아요만큼 리뷰/댓글 좋아요 수 차감
+    for model, like_model, fk in ((Review, ReviewLike, "review_id"), (Comment, CommentLike, "comment_id")):
+        liked_ids = select(getattr(like_model, fk)).where(like_model.user_id == current_user.id)
+        db.execute(
+            update(model).where(model.id.in_(liked_ids), model.like_count > 0).values(
+                like_count=model.like_count - 1
+            )
+        )
+
+    # 캐시된(세션 미연결) 사용자일 수 있으므로 세션에 연결된 행으로 다시 조회
+    user = db.get(User, current_user.id)
+    if user is None:
+        raise APIException(status_code=401, code="USER_NOT_FOUND", message="User not found")
+
+    db.delete(user)
     db.commit()
 
+    # 모든 워커의 사용자 캐시 무효화, 모든 기기의 Refresh Token 폐기
+    publish_user_invalidation(current_user.id)
+    revoke_all_refresh_tokens(current_user.id)
+
     return APIResponse(
         is_success=True,
         message="회원 탈퇴가 완료되었습니다",
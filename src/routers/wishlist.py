@@ -1,11 +1,13 @@
 #외부 모듈
-from datetime import datetime
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 #내부 모듈
-from src.database import get_db
+from src.database import get_async_db
+from src.rate_limit import write_limit
+from src.query_debug import query_budget
 from src.schema.wishlist import (
     WishlistAddRequest,
     WishlistAddResponse,
@@ -13,13 +15,17 @@ from src.schema.wishlist import (
     WishlistBookInfo,
     WishlistListItem,
     WishlistListResponse,
+    WishlistPagination,
     WishlistDeleteResponse
 )
 from src.schema.common import APIResponse, ErrorResponse
 from src.models.wishlist_item import WishlistItem
 from src.models.book import Book
 from src.models.user import User
-from src.auth.jwt import get_current_user
+from src.auth.jwt import APIException, get_current_user
+from src.stats import book_stats_delta
+from src.cache import invalidate_book_detail
+from src.shelf import SHELF_SORT_PATTERN, shelf_page
 
 
 router = APIRouter(prefix="/api/me", tags=["Wishlist"])
@@ -40,10 +46,11 @@ router = APIRouter(prefix="/api/me", tags=["Wishlist"])
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def add_to_wishlist(
     request: Request,
     wishlist_data: WishlistAddRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -54,41 +61,35 @@ async def add_to_wishlist(
     book_id = wishlist_data.bookId
 
     # 도서 존재 여부 확인
-    book = db.query(Book).filter(
-        Book.id == book_id,
-        Book.deleted_at.is_(None)
-    ).first()
+    book = await db.scalar(
+        select(Book).where(
+            Book.id == book_id,
+            Book.deleted_at.is_(None)
+        )
+    )
 
     if not book:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="BOOK_NOT_FOUND",
-                message="해당 도서를 찾을 수 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="BOOK_NOT_FOUND",
+            message="해당 도서를 찾을 수 없습니다",
+            details={"book_id": book_id}
         )
 
     # 중복 추가 검사
-    existing_item = db.query(WishlistItem).filter(
-        WishlistItem.user_id == current_user.id,
-        WishlistItem.book_id == book_id
-    ).first()
+    existing_item = await db.scalar(
+        select(WishlistItem).where(
+            WishlistItem.user_id == current_user.id,
+            WishlistItem.book_id == book_id
+        )
+    )
 
     if existing_item:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=409,
-                code="DUPLICATE_WISHLIST_ITEM",
-                message="이미 위시리스트에 추가된 도서입니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="DUPLICATE_WISHLIST_ITEM",
+            message="이미 위시리스트에 추가된 도서입니다",
+            details={"book_id": book_id}
         )
 
     # 위시리스트 아이템 생성
@@ -98,8 +99,10 @@ async def add_to_wishlist(
     )
 
     db.add(new_item)
-    db.commit()
-    db.refresh(new_item)
+    await db.execute(book_stats_delta(book_id, wishlist_count=1))
+    await db.commit()
+    await db.refresh(new_item)
+    await invalidate_book_detail(book_id)
 
     return APIResponse(
         is_success=True,
@@ -118,51 +121,57 @@ async def add_to_wishlist(
     response_model=APIResponse[WishlistListResponse],
     status_code=status.HTTP_200_OK,
     responses={
+        400: {"model": ErrorResponse, "description": "유효하지 않은 커서"},
         401: {"model": ErrorResponse, "description": "인증 필요"},
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@query_budget(2)
 async def get_wishlist(
     request: Request,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (기본값: 20, 최대: 100)"),
+    sort: str = Query("added", pattern=SHELF_SORT_PATTERN, description="정렬 키 (added: 추가일, title: 제목, price: 가격)"),
+    sort_by: int = Query(0, ge=0, le=1, description="정렬 방향 (0: 내림차순, 1: 오름차순)"),
+    cursor: Optional[str] = Query(None, description="커서 (이전 응답의 next_cursor, 같은 sort/sort_by로 요청)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     내 위시리스트 도서 목록을 조회합니다.
     - 인증 필요
-    - 추가일 기준 최신순 정렬
+    - 기본 정렬: 추가일 최신순 (sort, sort_by로 변경)
+    - (정렬 값, 도서 id) 커서 기반 페이지네이션
+    - 삭제된 도서는 제외
     """
-    # 위시리스트 아이템 조회 (도서 정보 포함)
-    wishlist_items = db.query(WishlistItem).filter(
-        WishlistItem.user_id == current_user.id
-    ).options(
-        joinedload(WishlistItem.book).joinedload(Book.authors)
-    ).order_by(WishlistItem.created_at.desc()).all()
-
-    # 응답 생성
-    items = []
-    for item in wishlist_items:
-        book = item.book
-        # 삭제된 도서는 제외
-        if book and book.deleted_at is None:
-            # 첫 번째 저자 이름 가져오기
-            author_name = book.authors[0].name if book.authors else "Unknown"
-            items.append(
-                WishlistListItem(
-                    book=WishlistBookInfo(
-                        id=book.id,
-                        title=book.title,
-                        author=WishlistBookAuthor(name=author_name),
-                        isbn=book.isbn
-                    ),
-                    createdAt=item.created_at
-                )
-            )
+    rows, next_cursor = await shelf_page(
+        db, WishlistItem, current_user.id, sort, sort_by == 1, cursor, limit
+    )
+
+    items = [
+        WishlistListItem(
+            book=WishlistBookInfo(
+                id=row.book_id,
+                title=row.title,
+                author=WishlistBookAuthor(name=row.author_name),
+                isbn=row.isbn,
+                price=row.price
+            ),
+            createdAt=row.created_at
+        )
+        for row in rows
+    ]
 
     return APIResponse(
         is_success=True,
         message="위시리스트 목록이 성공적으로 조회되었습니다.",
-        payload=WishlistListResponse(items=items)
+        payload=WishlistListResponse(
+            items=items,
+            pagination=WishlistPagination(
+                next_cursor=next_cursor,
+                has_next=next_cursor is not None,
+                page_size=limit
+            )
+        )
     )
 
 
@@ -178,10 +187,11 @@ async def get_wishlist(
         500: {"model": ErrorResponse, "description": "서버 내부 오류"},
     }
 )
+@write_limit
 async def remove_from_wishlist(
     request: Request,
     book_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -190,28 +200,27 @@ async def remove_from_wishlist(
     - 본인 위시리스트의 도서만 삭제 가능
     """
     # 위시리스트 아이템 조회
-    wishlist_item = db.query(WishlistItem).filter(
-        WishlistItem.user_id == current_user.id,
-        WishlistItem.book_id == book_id
-    ).first()
+    wishlist_item = await db.scalar(
+        select(WishlistItem).where(
+            WishlistItem.user_id == current_user.id,
+            WishlistItem.book_id == book_id
+        )
+    )
 
     # 위시리스트 아이템 존재 여부 확인
     if not wishlist_item:
-        return JSONResponse(
+        raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                timestamp=datetime.now(),
-                path=str(request.url.path),
-                status=404,
-                code="WISHLIST_ITEM_NOT_FOUND",
-                message="위시리스트에 해당 도서가 없습니다",
-                details={"book_id": book_id}
-            ).model_dump(mode="json")
+            code="WISHLIST_ITEM_NOT_FOUND",
+            message="위시리스트에 해당 도서가 없습니다",
+            details={"book_id": book_id}
         )
 
     # 위시리스트 아이템 삭제
-    db.delete(wishlist_item)
-    db.commit()
+    await db.delete(wishlist_item)
+    await db.execute(book_stats_delta(book_id, wishlist_count=-1))
+    await db.commit()
+    await invalidate_book_detail(book_id)
 
     return APIResponse(
         is_success=True,
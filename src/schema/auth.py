@@ -28,4 +28,5 @@ class LoginResponse(BaseModel):
 class TokenRefreshResponse(BaseModel):
     """토큰 갱신 응답"""
     access_token: str = Field(..., json_schema_extra={"example": "eyJhbGciOiJIUzI1NiIs...", "description": "새 Access Token"})
+    refresh_token: str = Field(..., json_schema_extra={"example": "eyJhbGciOiJIUzI1NiIs...", "description": "새 Refresh Token (이전 토큰은 무효화)"})
     token_type: str = Field(default="bearer", json_schema_extra={"example": "bearer", "description": "토큰 타입"})
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Book Schemas"""
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Union
 from pydantic import BaseModel, Field
 
 
+# 일괄 조회 1회 최대 도서 수
+BOOK_BATCH_MAX_IDS = 200
+
+
 # ==================== Request Schemas ====================
 
 class BookCreate(BaseModel):
@@ -95,6 +99,16 @@ class BookUpdate(BaseModel):
     )
 
 
+class BookBatchRequest(BaseModel):
+    """도서 일괄 조회 요청 (POST - 긴 id 목록용)"""
+    ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=BOOK_BATCH_MAX_IDS,
+        json_schema_extra={"example": [3, 1, 2], "description": "조회할 도서 id 목록 (응답은 이 순서를 따름)"}
+    )
+
+
 # ==================== Response Schemas ====================
 
 class BookCreateResponse(BaseModel):
@@ -113,6 +127,16 @@ class BookCreateResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class BookStatsSummary(BaseModel):
+    """도서 집계 (리뷰/별점/댓글/라이브러리/위시리스트)"""
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: dict[int, int] = Field(default_factory=lambda: {rating: 0 for rating in range(1, 6)})
+    comment_count: int = 0
+    library_count: int = 0
+    wishlist_count: int = 0
+
+
 class BookListItem(BaseModel):
     """도서 목록 아이템"""
     id: int
@@ -124,6 +148,7 @@ class BookListItem(BaseModel):
     cover_image_url: Optional[str] = None
     price: Decimal
     publication_date: Optional[date] = None
+    stats: BookStatsSummary = Field(default_factory=BookStatsSummary)
 
 
 class BookPagination(BaseModel):
@@ -133,9 +158,60 @@ class BookPagination(BaseModel):
     current_page: int
     page_size: int
     page_sort: int
+    next_cursor: Optional[str] = None
+
+
+class BookCursorPagination(BaseModel):
+    """도서 커서 페이지네이션 정보"""
+    next_cursor: Optional[str] = None
+    has_next: bool
+    page_size: int
+    page_sort: int
+    total_books: Optional[int] = None
 
 
 class BookListResponse(BaseModel):
     """도서 목록 조회 응답"""
     books: list[BookListItem]
-    pagination: BookPagination
+    pagination: Union[BookPagination, BookCursorPagination]
+
+
+class BookSearchItem(BookListItem):
+    """도서 검색 결과 아이템"""
+    score: float
+
+
+class BookSearchPagination(BaseModel):
+    """도서 검색 커서 페이지네이션 정보"""
+    next_cursor: Optional[str] = None
+    has_next: bool
+    page_size: int
+
+
+class BookSearchResponse(BaseModel):
+    """도서 검색 응답 (관련도 내림차순)"""
+    books: list[BookSearchItem]
+    pagination: BookSearchPagination
+
+
+class BookBatchResponse(BaseModel):
+    """도서 일괄 조회 응답 (요청 순서 유지)"""
+    books: list[BookListItem]
+    missing_ids: list[int]
+
+
+class BookImportError(BaseModel):
+    """도서 일괄 등록 행 오류"""
+    row: int
+    isbn: Optional[str] = None
+    code: str
+    message: str
+    details: Optional[dict] = None
+
+
+class BookImportResponse(BaseModel):
+    """도서 일괄 등록 결과"""
+    total_rows: int
+    imported: int
+    failed: int
+    errors: list[BookImportError]
@@ -1,5 +1,6 @@
 """Comment Schemas"""
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -71,9 +72,10 @@ class CommentListItem(BaseModel):
 
 class CommentPagination(BaseModel):
     """댓글 페이지네이션 정보"""
-    page: int
+    page: Optional[int] = None
     totalPages: int
     totalElements: int
+    nextCursor: Optional[str] = None
 
 
 class CommentListResponse(BaseModel):
@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Generic, TypeVar, Optional, List, Any
 from pydantic import BaseModel
+from starlette.responses import Response
 
 T = TypeVar("T")
 
@@ -27,6 +28,37 @@ class ErrorResponse(BaseModel):
     details: Optional[dict[str, Any]] = None
 
 
+# 모델 생성 시 컴파일된 pydantic-core 직렬화기 (dict 변환/json.dumps 없이 바로 JSON bytes)
+_error_serializer = ErrorResponse.__pydantic_serializer__
+
+
+def error_response(
+    status_code: int,
+    code: str,
+    message: str,
+    path: str,
+    details: Optional[dict[str, Any]] = None
+) -> Response:
+    """
+    ErrorResponse 형식의 JSON 응답 생성 (전역 예외 처리기 공용)
+
+    값은 서버 코드가 만든 것이므로 검증(model_construct)을 생략하고 직렬화만 한 번 수행합니다.
+    """
+    error = ErrorResponse.model_construct(
+        timestamp=datetime.now(),
+        path=path,
+        status=status_code,
+        code=code,
+        message=message,
+        details=details
+    )
+    return Response(
+        _error_serializer.to_json(error),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 # ==================== 페이지네이션 응답 ====================
 
 class PagedResponse(BaseModel, Generic[T]):
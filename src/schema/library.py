@@ -1,5 +1,7 @@
 """Library Schemas"""
 from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -34,6 +36,7 @@ class LibraryBookInfo(BaseModel):
     title: str
     author: LibraryBookAuthor
     isbn: str
+    price: Decimal
 
     model_config = {"from_attributes": True}
 
@@ -46,9 +49,17 @@ class LibraryListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class LibraryPagination(BaseModel):
+    """라이브러리 목록 커서 페이지네이션 정보"""
+    next_cursor: Optional[str] = None
+    has_next: bool
+    page_size: int
+
+
 class LibraryListResponse(BaseModel):
     """라이브러리 목록 조회 응답"""
     items: list[LibraryListItem]
+    pagination: LibraryPagination
 
 
 class LibraryDeleteResponse(BaseModel):
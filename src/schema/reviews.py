@@ -85,9 +85,10 @@ class ReviewListItem(BaseModel):
 
 class ReviewPagination(BaseModel):
     """리뷰 페이지네이션 정보"""
-    page: int
+    page: Optional[int] = None
     totalPages: int
     totalElements: int
+    nextCursor: Optional[str] = None
 
 
 class ReviewListResponse(BaseModel):
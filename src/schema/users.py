@@ -38,4 +38,21 @@ class UserGetMeResponse(BaseModel):
     role: str
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+class UserListItem(UserGetMeResponse):
+    """사용자 목록 아이템 (ADMIN)"""
+    created_at: datetime
+
+
+class UserCursorPagination(BaseModel):
+    """사용자 목록 커서 페이지네이션 정보"""
+    next_cursor: Optional[str] = None
+    has_next: bool
+    page_size: int
+
+
+class UserListResponse(BaseModel):
+    """사용자 목록 조회 응답 (가입일 최신순)"""
+    users: list[UserListItem]
+    pagination: UserCursorPagination
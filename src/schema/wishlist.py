@@ -1,5 +1,7 @@
 """Wishlist Schemas"""
 from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -33,6 +35,7 @@ class WishlistBookInfo(BaseModel):
     title: str
     author: WishlistBookAuthor
     isbn: str
+    price: Decimal
 
     model_config = {"from_attributes": True}
 
@@ -45,9 +48,17 @@ class WishlistListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class WishlistPagination(BaseModel):
+    """위시리스트 목록 커서 페이지네이션 정보"""
+    next_cursor: Optional[str] = None
+    has_next: bool
+    page_size: int
+
+
 class WishlistListResponse(BaseModel):
     """위시리스트 목록 조회 응답"""
     items: list[WishlistListItem]
+    pagination: WishlistPagination
 
 class WishlistDeleteResponse(BaseModel):
     """위시리스트 도서 삭제 응답"""
@@ -0,0 +1,183 @@
+"""도서 전문 검색 백엔드 (MariaDB FULLTEXT / 메모리 역색인)"""
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.config import settings
+from src.models.book import Book
+
+# (book_id, 관련도 점수) 목록 - 점수 내림차순, 같은 점수는 id 내림차순
+SearchHits = list[tuple[int, float]]
+
+
+def searchable_authors(names: Iterable[str]) -> str:
+    """books.author_names(검색용 비정규화 컬럼)에 저장할 저자 이름 문자열"""
+    return ", ".join(names)
+
+
+class SearchBackend(ABC):
+    """
+    도서 검색 백엔드 인터페이스
+
+    - search: 커서(after) 이후의 결과를 관련도 순으로 최대 limit건 반환
+    - index_book / remove_book / invalidate: 도서 변경 알림 (DB 인덱스 기반 백엔드는 무시)
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        limit: int,
+        after: Optional[tuple[float, int]] = None
+    ) -> SearchHits:
+        """after: 이전 페이지 마지막 항목의 (점수, id)"""
+
+    def index_book(self, book_id: int, title: str, description: Optional[str], authors: list[str]) -> None:
+        pass
+
+    def remove_book(self, book_id: int) -> None:
+        pass
+
+    def invalidate(self) -> None:
+        pass
+
+
+class MySQLSearchBackend(SearchBackend):
+    """books(title, description, author_names) FULLTEXT 인덱스 기반 검색 (자연어 모드)"""
+
+    async def search(self, db, query, limit, after=None):
+        relevance = match(
+            Book.title, Book.description, Book.author_names, against=query
+        ).in_natural_language_mode()
+        # 커서 왕복 시 실수 비교가 정확히 일치하도록 소수점 6자리로 고정
+        # (WHERE의 일치 조건은 FULLTEXT 인덱스를 타도록 MATCH를 감싸지 않고 그대로 비교)
+        score = func.round(relevance, 6)
+
+        stmt = select(Book.id, score.label("score")).where(
+            Book.deleted_at.is_(None),
+            relevance > 0
+        )
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(or_(
+                score < after_score,
+                and_(score == after_score, Book.id < after_id)
+            ))
+        result = await db.execute(stmt.order_by(score.desc(), Book.id.desc()).limit(limit))
+        return [(book_id, float(book_score)) for book_id, book_score in result.all()]
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# 필드별 가중치 (제목 > 저자 > 설명)
+_FIELD_WEIGHTS = {"title": 3.0, "authors": 2.0, "description": 1.0}
+
+
+def _tokenize(text: Optional[str]) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.casefold()) if text else []
+
+
+class InMemorySearchBackend(SearchBackend):
+    """
+    프로세스 내 역색인 검색 (테스트/단일 워커 소규모 배포용)
+
+    첫 검색 시 DB의 전체 도서로 색인을 만들고 이후 변경은 index_book/remove_book으로 반영합니다.
+    다른 워커의 변경은 반영되지 않으므로 여러 워커 환경에서는 MySQL 백엔드를 사용합니다.
+    점수는 필드 가중치를 곱한 TF-IDF 합입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+        # token -> {book_id: 가중치 적용 출현 빈도}
+        self._postings: dict[str, dict[int, float]] = defaultdict(dict)
+        # book_id -> 색인된 token 목록 (삭제/갱신 시 제거용)
+        self._book_tokens: dict[int, set[str]] = {}
+
+    def _remove(self, book_id: int) -> None:
+        for token in self._book_tokens.pop(book_id, ()):
+            postings = self._postings[token]
+            postings.pop(book_id, None)
+            if not postings:
+                del self._postings[token]
+
+    def _add(self, book_id: int, title: str, description: Optional[str], authors: list[str]) -> None:
+        self._remove(book_id)
+        weights: dict[str, float] = defaultdict(float)
+        for field, text in (("title", title), ("authors", " ".join(authors)), ("description", description)):
+            for token in _tokenize(text):
+                weights[token] += _FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            self._postings[token][book_id] = weight
+        self._book_tokens[book_id] = set(weights)
+
+    async def _ensure_built(self, db: AsyncSession) -> None:
+        if self._built:
+            return
+        books = (await db.scalars(
+            select(Book).options(selectinload(Book.authors)).where(Book.deleted_at.is_(None))
+        )).all()
+        with self._lock:
+            self._postings.clear()
+            self._book_tokens.clear()
+            for book in books:
+                self._add(book.id, book.title, book.description, [author.name for author in book.authors])
+            self._built = True
+
+    async def search(self, db, query, limit, after=None):
+        await self._ensure_built(db)
+
+        scores: dict[int, float] = defaultdict(float)
+        with self._lock:
+            total = max(len(self._book_tokens), 1)
+            for token in set(_tokenize(query)):
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                idf = math.log(1 + total / len(postings))
+                for book_id, weight in postings.items():
+                    scores[book_id] += weight * idf
+
+        hits = sorted(
+            ((book_id, round(score, 6)) for book_id, score in scores.items()),
+            key=lambda hit: (hit[1], hit[0]),
+            reverse=True
+        )
+        if after is not None:
+            hits = [hit for hit in hits if (hit[1], hit[0]) < after]
+        return hits[:limit]
+
+    def index_book(self, book_id, title, description, authors):
+        with self._lock:
+            if self._built:
+                self._add(book_id, title, description, authors)
+
+    def remove_book(self, book_id):
+        with self._lock:
+            self._remove(book_id)
+
+    def invalidate(self):
+        """다음 검색 시 DB에서 색인을 다시 만듦 (일괄 등록 후 등)"""
+        with self._lock:
+            self._built = False
+
+
+def create_search_backend(name: str) -> SearchBackend:
+    """설정 이름(mysql, memory)으로 검색 백엔드 생성"""
+    if name == "memory":
+        return InMemorySearchBackend()
+    if name == "mysql":
+        return MySQLSearchBackend()
+    raise ValueError(f"Unknown search backend: {name}")
+
+
+search_backend = create_search_backend(settings.SEARCH_BACKEND)
@@ -0,0 +1,100 @@
+"""
+내 라이브러리/위시리스트 목록 공통 조회
+
+- 아이템과 도서에서 응답에 필요한 컬럼만 고르는 단일 projection 쿼리 (ORM 객체/저자 컬렉션 미적재)
+- 삭제된 도서(Book.deleted_at)는 SQL에서 제외
+- 정렬 키(added/title/price) + book_id 보조 키로 keyset 페이지네이션
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.author import Author
+from src.models.book import Book
+from src.models.book_author import BookAuthor
+from src.pagination import decode_sort_cursor, encode_sort_cursor, seek_condition
+
+# 정렬 키 Query 패턴 (added: 추가일, title: 제목, price: 가격)
+SHELF_SORT_PATTERN = "^(added|title|price)$"
+
+
+def _text(value) -> str:
+    if not isinstance(value, str):
+        raise TypeError("cursor value must be a string")
+    return value
+
+
+# 정렬 키별 커서 값 파서
+_CURSOR_PARSERS = {
+    "added": datetime.fromisoformat,
+    "title": _text,
+    "price": Decimal,
+}
+
+
+def _sort_column(item_model, sort: str):
+    return {"added": item_model.created_at, "title": Book.title, "price": Book.price}[sort]
+
+
+def _first_author_name():
+    # 저자 id가 가장 작은 저자 (기존 authors[0]과 같은 book_authors PK 순서)
+    return func.coalesce(
+        select(Author.name)
+        .join(BookAuthor, BookAuthor.author_id == Author.id)
+        .where(BookAuthor.book_id == Book.id)
+        .order_by(BookAuthor.author_id)
+        .limit(1)
+        .correlate(Book)
+        .scalar_subquery(),
+        "Unknown"
+    )
+
+
+async def shelf_page(
+    db: AsyncSession,
+    item_model,
+    user_id: int,
+    sort: str,
+    ascending: bool,
+    cursor: Optional[str],
+    limit: int
+) -> tuple[list, Optional[str]]:
+    """
+    사용자의 LibraryItem/WishlistItem 한 페이지 조회
+
+    행은 created_at(추가일), book_id, title, isbn, price, author_name 컬럼을 가지며
+    다음 페이지가 없으면 next_cursor는 None입니다.
+    """
+    sort_col = _sort_column(item_model, sort)
+    query = (
+        select(
+            item_model.created_at,
+            item_model.book_id,
+            Book.title,
+            Book.isbn,
+            Book.price,
+            _first_author_name().label("author_name")
+        )
+        .join(Book, Book.id == item_model.book_id)
+        .where(item_model.user_id == user_id, Book.deleted_at.is_(None))
+    )
+    if cursor is not None:
+        value, last_id = decode_sort_cursor(cursor, _CURSOR_PARSERS[sort])
+        query = query.where(seek_condition(sort_col, item_model.book_id, value, last_id, ascending))
+
+    if ascending:
+        query = query.order_by(sort_col.asc(), item_model.book_id.asc())
+    else:
+        query = query.order_by(sort_col.desc(), item_model.book_id.desc())
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    sort_value = {"added": last.created_at, "title": last.title, "price": last.price}[sort]
+    return rows, encode_sort_cursor(sort_value, last.book_id)
@@ -0,0 +1,146 @@
+"""도서 집계(book_stats) 증분 갱신 및 보정 유틸리티"""
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from src.models.book import Book
+from src.models.book_stats import BookStats
+from src.models.review import Review
+from src.models.comment import Comment
+from src.models.library_item import LibraryItem
+from src.models.wishlist_item import WishlistItem
+from src.schema.books import BookStatsSummary
+
+RATINGS = range(1, 6)
+
+# 보정 대상 집계 컬럼
+STAT_COLUMNS = (
+    "review_count", "comment_count", "rating_sum",
+    *(f"rating_{rating}" for rating in RATINGS),
+    "library_count", "wishlist_count",
+)
+
+
+def book_stats_delta(book_id: int, **deltas: int):
+    """
+    book_stats 카운터 증감 구문 생성 (행이 없으면 생성)
+
+    호출한 쪽의 트랜잭션 안에서 실행되므로 원본 데이터 변경과 함께 커밋/롤백됩니다.
+    예) db.execute(book_stats_delta(book_id, review_count=1))
+    """
+    stmt = insert(BookStats).values(
+        book_id=book_id,
+        **{column: max(delta, 0) for column, delta in deltas.items()}
+    )
+    return stmt.on_duplicate_key_update(
+        **{
+            column: func.greatest(getattr(BookStats, column) + delta, 0)
+            for column, delta in deltas.items()
+        }
+    )
+
+
+def rating_deltas(rating: int, sign: int = 1) -> dict[str, int]:
+    """별점 1건 추가(sign=1) 또는 제거(sign=-1)에 해당하는 집계 증감"""
+    return {"rating_sum": sign * rating, f"rating_{rating}": sign}
+
+
+def rating_change_deltas(old_rating: int, new_rating: int) -> dict[str, int]:
+    """별점 변경(old -> new)에 해당하는 집계 증감"""
+    deltas = rating_deltas(old_rating, -1)
+    for column, delta in rating_deltas(new_rating).items():
+        deltas[column] = deltas.get(column, 0) + delta
+    return deltas
+
+
+def book_stats_summary(stats: Optional[BookStats]) -> BookStatsSummary:
+    """BookStats 행을 응답용 요약으로 변환 (행이 없으면 0)"""
+    if stats is None:
+        return BookStatsSummary()
+    return BookStatsSummary(
+        review_count=stats.review_count,
+        average_rating=round(stats.rating_sum / stats.review_count, 2) if stats.review_count else None,
+        rating_histogram={rating: getattr(stats, f"rating_{rating}") for rating in RATINGS},
+        comment_count=stats.comment_count,
+        library_count=stats.library_count,
+        wishlist_count=stats.wishlist_count
+    )
+
+
+def _expected_stats(db: Session, book_ids: list[int]) -> dict[int, dict[str, int]]:
+    """원본 테이블 GROUP BY로 도서별 집계 계산"""
+    expected = {book_id: dict.fromkeys(STAT_COLUMNS, 0) for book_id in book_ids}
+
+    reviews = db.execute(
+        select(Review.book_id, Review.rating, func.count())
+        .where(Review.book_id.in_(book_ids))
+        .group_by(Review.book_id, Review.rating)
+    )
+    for book_id, rating, count in reviews:
+        row = expected[book_id]
+        row["review_count"] += count
+        row["rating_sum"] += rating * count
+        if rating in RATINGS:
+            row[f"rating_{rating}"] += count
+
+    for model, column in (
+        (Comment, "comment_count"),
+        (LibraryItem, "library_count"),
+        (WishlistItem, "wishlist_count"),
+    ):
+        counts = db.execute(
+            select(model.book_id, func.count())
+            .where(model.book_id.in_(book_ids))
+            .group_by(model.book_id)
+        )
+        for book_id, count in counts:
+            expected[book_id][column] = count
+
+    return expected
+
+
+def reconcile_book_stats(db: Session, batch_size: int = 500) -> int:
+    """
+    원본 테이블 기준으로 book_stats를 다시 계산하여 어긋난 행만 보정 (도서 id 순 배치)
+
+    배치마다 해당 book_stats 행을 잠근 뒤 계산하므로 진행 중인 증분 갱신과 섞이지 않습니다.
+    반환값: 보정된 도서 수
+    """
+    fixed = 0
+    last_id = 0
+    while True:
+        book_ids = list(db.scalars(
+            select(Book.id).where(Book.id > last_id).order_by(Book.id).limit(batch_size)
+        ))
+        if not book_ids:
+            return fixed
+        last_id = book_ids[-1]
+        # 위 조회로 시작된 읽기 스냅샷을 끝내고, 잠금 이후 시점의 데이터로 계산
+        db.commit()
+
+        current = {
+            stats.book_id: stats
+            for stats in db.scalars(
+                select(BookStats).where(BookStats.book_id.in_(book_ids)).with_for_update()
+            )
+        }
+        drifted = []
+        for book_id, values in _expected_stats(db, book_ids).items():
+            stats = current.get(book_id)
+            if stats is None:
+                if any(values.values()):
+                    drifted.append({"book_id": book_id, **values})
+            elif any(getattr(stats, column) != value for column, value in values.items()):
+                drifted.append({"book_id": book_id, **values})
+
+        if drifted:
+            stmt = insert(BookStats).values(drifted)
+            db.execute(stmt.on_duplicate_key_update(
+                **{column: stmt.inserted[column] for column in STAT_COLUMNS}
+            ))
+        db.commit()
+        # 배치마다 로드한 BookStats가 세션에 쌓이지 않도록 비움
+        db.expunge_all()
+        fixed += len(drifted)
@@ -1,19 +1,33 @@
 # pytest 설정 및 공통 fixture
 # 외부 모듈
 import os
+# fixture가 DB에 직접 쓰므로 캐시 무효화가 일어나지 않음 -> 테스트에서는 도서 캐시 비활성화
+os.environ.setdefault("BOOK_CACHE_ENABLED", "false")
+# TestClient마다 앱이 재시작되므로 해싱은 프로세스 풀 대신 스레드풀로 실행
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+# 픽스처가 같은 IP로 로그인을 반복하므로 레이트리밋은 전용 테스트에서만 활성화
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# 요청별 문장 형태를 모아 N+1 의심 패턴을 로그로 남김
+os.environ.setdefault("QUERY_DEBUG", "true")
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 # 내부 모듈
 from src.main import app
-from src.database import Base, get_db
+from src.database import Base, get_db, get_async_db
 from src.models.user import User
 from src.models.book import Book
 from src.models.author import Author
 from src.models.category import Category
 from src.auth.password import hash_password
+from src.auth.user_cache import user_cache
+from src.metrics import instrument_engine
+from src.query_debug import budget_violations
+from src.replica import ReplicaRouter, get_read_db
 
 # 테스트용 DB 설정 (TEST_DB_* 환경변수 사용, 프로덕션 DB와 분리)
 DB_HOST = os.getenv("DB_HOST", "localhost")
@@ -24,9 +38,34 @@ DB_NAME = "test_wsd_db"
 
 SQLALCHEMY_DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
+ASYNC_SQLALCHEMY_DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
+
 engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient는 매번 새 이벤트 루프를 만들므로 커넥션을 풀링하지 않음
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+# 요청별 쿼리 수 메트릭이 테스트 DB 엔진에서도 집계되도록 등록
+instrument_engine(engine)
+instrument_engine(async_engine)
+
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# 복제본 역할의 두 번째 로컬 DB (복제되지 않으므로 primary에만 있는 데이터로 라우팅을 확인)
+REPLICA_DB_NAME = "test_wsd_db_replica"
+ASYNC_REPLICA_DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{REPLICA_DB_NAME}?charset=utf8mb4"
+
+
+@pytest.fixture(autouse=True)
+def query_budget_guard():
+    """라우트에 선언된 쿼리 예산(query_budget)을 초과한 요청이 있으면 테스트 실패"""
+    budget_violations.clear()
+    yield
+    violations = list(budget_violations)
+    budget_violations.clear()
+    if violations:
+        pytest.fail("query budget exceeded:\n" + "\n".join(str(v) for v in violations))
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -58,10 +97,19 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_async_db
+    # TRUNCATE 후 id가 재사용되므로 테스트 간 사용자 캐시 초기화
+    user_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+    user_cache.clear()
 
 
 @pytest.fixture
@@ -149,3 +197,40 @@ def test_book(db_session):
     db_session.commit()
     db_session.refresh(book)
     return book
+
+
+@pytest.fixture
+def replica_router(client, monkeypatch):
+    """조회 라우트가 복제본 라우팅을 사용하도록 설정 (복제본 = 빈 로컬 DB)"""
+    import redis.asyncio as aioredis
+    from src import replica
+    from src.config import settings
+
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {REPLICA_DB_NAME}"))
+    replica_sync_engine = create_engine(SQLALCHEMY_DATABASE_URL.replace(DB_NAME, REPLICA_DB_NAME, 1))
+    Base.metadata.create_all(bind=replica_sync_engine)
+
+    # TestClient마다 이벤트 루프가 바뀌므로 Redis 클라이언트도 새로 생성
+    router = ReplicaRouter(
+        TestingAsyncSessionLocal,
+        async_sessionmaker(
+            bind=create_async_engine(ASYNC_REPLICA_DATABASE_URL, poolclass=NullPool),
+            autoflush=False,
+            expire_on_commit=False
+        ),
+        redis=aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            decode_responses=True
+        ),
+        check_interval_seconds=60
+    )
+    monkeypatch.setattr(replica, "read_router", router)
+    monkeypatch.delitem(app.dependency_overrides, get_read_db)
+    yield router
+
+    with replica_sync_engine.begin() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {REPLICA_DB_NAME}"))
+    replica_sync_engine.dispose()
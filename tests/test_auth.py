@@ -47,6 +47,64 @@ class TestLogin:
         data = response.json()
         assert data["code"] == "UNAUTHORIZED"
 
+    def test_login_hash_queue_full(self, client, test_user, monkeypatch):
+        """해싱 대기열이 가득 차면 즉시 503"""
+        from src.config import settings
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+
+        response = client.post(
+            "/api/auth/login",
+            json={
+                "email": "user1@example.com",
+                "password": "P@ssw0rd!"
+            }
+        )
+        assert response.status_code == 503
+        assert response.json()["code"] == "SERVICE_UNAVAILABLE"
+
+
+class TestRateLimit:
+    """레이트리밋 테스트 (테스트 환경에서는 기본 비활성화)"""
+
+    @pytest.fixture
+    def rate_limiter(self, monkeypatch):
+        from src.rate_limit import limiter
+        monkeypatch.setattr(limiter, "enabled", True)
+        limiter.reset()
+        yield limiter
+        limiter.reset()
+
+    def test_login_rate_limited(self, client, test_user, rate_limiter):
+        """로그인 한도를 넘으면 429"""
+        from limits import parse
+        from src.config import settings
+        allowed = parse(settings.RATE_LIMIT_LOGIN).amount
+
+        statuses = [
+            client.post(
+                "/api/auth/login",
+                json={"email": "user1@example.com", "password": "WrongPassword!"}
+            ).status_code
+            for _ in range(allowed + 1)
+        ]
+        assert statuses[:-1] == [401] * allowed
+        assert statuses[-1] == 429
+
+    def test_rate_limit_key_uses_token_subject(self, client, test_user, user_token):
+        """유효한 토큰은 사용자 기준, 위조 토큰은 IP 기준 키"""
+        from starlette.requests import Request
+        from src.rate_limit import rate_limit_key
+
+        def request_with(token):
+            return Request({
+                "type": "http",
+                "headers": [(b"authorization", f"Bearer {token}".encode())],
+                "client": ("203.0.113.7", 50000)
+            })
+
+        assert rate_limit_key(request_with(user_token)) == f"user:{test_user.id}"
+        assert rate_limit_key(request_with("forged.token.value")) == "ip:203.0.113.7"
+
 
 class TestRefreshToken:
     """토큰 재발급 테스트"""
@@ -72,6 +130,49 @@ class TestRefreshToken:
         data = response.json()
         assert data["is_success"] is True
         assert "access_token" in data["payload"]
+        assert data["payload"]["refresh_token"] != refresh_token
+
+    def _login_refresh_token(self, client):
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "user1@example.com", "password": "P@ssw0rd!"}
+        )
+        return response.json()["payload"]["refresh_token"]
+
+    def test_refresh_token_reuse_revokes_family(self, client, test_user):
+        """회전된 Refresh Token 재사용 시 401, 해당 기기 세션의 새 토큰도 폐기"""
+        old_token = self._login_refresh_token(client)
+        new_token = client.post("/api/auth/refresh", json={"refresh_token": old_token}).json()["payload"]["refresh_token"]
+
+        reused = client.post("/api/auth/refresh", json={"refresh_token": old_token})
+        assert reused.status_code == 401
+        assert reused.json()["code"] == "REFRESH_TOKEN_REUSED"
+
+        response = client.post("/api/auth/refresh", json={"refresh_token": new_token})
+        assert response.status_code == 401
+        assert response.json()["code"] == "INVALID_REFRESH_TOKEN"
+
+    def test_refresh_tokens_per_device(self, client, test_user):
+        """두 번째 기기 로그인이 첫 번째 기기 세션을 끊지 않음"""
+        first_device = self._login_refresh_token(client)
+        second_device = self._login_refresh_token(client)
+
+        assert client.post("/api/auth/refresh", json={"refresh_token": first_device}).status_code == 200
+        assert client.post("/api/auth/refresh", json={"refresh_token": second_device}).status_code == 200
+
+    def test_password_change_revokes_all_refresh_tokens(self, client, test_user, user_token):
+        """비밀번호 변경 시 모든 기기의 Refresh Token 폐기"""
+        refresh_token = self._login_refresh_token(client)
+
+        client.patch(
+            "/api/users/me",
+            json={"current_password": "P@ssw0rd!", "new_password": "N3wP@ssw0rd!"},
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+
+        response = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+        assert response.status_code == 401
+        assert response.json()["code"] == "INVALID_REFRESH_TOKEN"
 
 
 class TestLogout:
@@ -92,3 +193,157 @@ class TestLogout:
         """토큰 없이 로그아웃 실패"""
         response = client.post("/api/auth/logout")
         assert response.status_code == 401
+
+    def test_logout_revokes_access_token(self, client, user_token):
+        """로그아웃한 Access Token 재사용 시 401"""
+        client.post("/api/auth/logout", headers={"Authorization": f"Bearer {user_token}"})
+
+        response = client.get("/api/users/me", headers={"Authorization": f"Bearer {user_token}"})
+        assert response.status_code == 401
+        assert response.json()["code"] == "TOKEN_BLACKLISTED"
+
+
+class TestRevocationFilter:
+    """폐기 토큰 필터 테스트"""
+
+    def test_filter_pass_skips_redis(self, monkeypatch):
+        """필터에 없는 jti는 Redis 확인 없이 통과, 추가된 jti만 Redis로 확인"""
+        from src.auth import revocation
+
+        checked = []
+        monkeypatch.setattr(revocation, "revoked_jtis", lambda: ["revoked-jti"])
+        monkeypatch.setattr(revocation, "is_token_blacklisted", lambda jti: checked.append(jti) or jti == "revoked-jti")
+
+        revocation_filter = revocation.RevocationFilter(1000, 0.001, rebuild_seconds=60)
+        revocation_filter.rebuild()
+        revocation_filter.subscribed = True
+
+        assert revocation_filter.is_revoked("revoked-jti") is True
+        assert not any(revocation_filter.is_revoked(f"active-{i}") for i in range(200))
+        assert checked[0] == "revoked-jti"
+        # 오탐률 0.1% 기준 200건 중 Redis 확인은 거의 없어야 함
+        assert len(checked) <= 3
+
+    def test_rebuild_runs_off_request_path(self, monkeypatch):
+        """재생성은 백그라운드 스레드에서만 실행되고 요청(is_revoked)은 Redis 전체 조회를 하지 않음"""
+        import threading
+        import time
+        from src.auth import revocation
+
+        rebuilt = threading.Event()
+        scans = []
+
+        def revoked_jtis():
+            scans.append(threading.current_thread().name)
+            rebuilt.set()
+            return ["revoked-jti"]
+
+        monkeypatch.setattr(revocation, "revoked_jtis", revoked_jtis)
+        monkeypatch.setattr(revocation, "is_token_blacklisted", lambda jti: jti == "revoked-jti")
+
+        revocation_filter = revocation.RevocationFilter(1000, 0.001, rebuild_seconds=0.01)
+        revocation_filter.subscribed = True
+        # 적재 전에는 요청마다 Redis로 확인하고 재생성하지 않음
+        assert revocation_filter.is_revoked("active") is False
+        assert scans == []
+
+        revocation_filter.start_rebuilding()
+        try:
+            assert rebuilt.wait(5)
+            deadline = time.monotonic() + 5
+            while not revocation_filter.ready and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            revocation_filter.stop_rebuilding()
+        assert revocation_filter.ready
+        assert set(scans) == {"revocation-filter-rebuild"}
+        assert revocation_filter.is_revoked("revoked-jti") is True
+
+
+class TestRedisCircuitBreaker:
+    """Redis 차단기 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패 시 열려 호출 없이 실패하고, 대기 후 시험 호출이 성공하면 닫힘"""
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+        from src.redis import CircuitBreaker, RedisUnavailableError
+
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+        for _ in range(2):
+            with pytest.raises(RedisTimeoutError):
+                with breaker:
+                    raise RedisTimeoutError()
+        assert breaker.is_open
+
+        calls = []
+        with pytest.raises(RedisUnavailableError):
+            with breaker:
+                calls.append("redis")
+        assert calls == []
+
+        # 재시도 대기 시간이 지나면 한 호출만 시험
+        breaker.opened_at -= 60
+        with breaker:
+            pass
+        assert not breaker.is_open
+
+    def test_social_login_redis_error_returns_503(self, client, test_user, monkeypatch):
+        """소셜 로그인 중 Redis 장애는 500으로 감싸지 않고 503으로 응답"""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from src.routers import auth
+
+        async def failing_login_tokens(user):
+            raise RedisConnectionError("connection refused")
+
+        monkeypatch.setattr(auth, "verify_firebase_token", lambda token: {"email": "user1@example.com"})
+        monkeypatch.setattr(auth, "_login_tokens", failing_login_tokens)
+
+        response = client.post("/api/auth/firebase", json={"id_token": "token"})
+        assert response.status_code == 503
+        assert response.json()["code"] == "SERVICE_UNAVAILABLE"
+
+
+class TestTokenVerification:
+    """토큰 검증 백엔드/캐시 테스트"""
+
+    def test_hmac_backend_matches_jose(self):
+        """hmac 백엔드와 jose 백엔드가 서로의 토큰을 검증하고 변조 토큰은 거부"""
+        from datetime import datetime, timedelta, timezone
+        from jose.exceptions import JWTError
+        from src.auth.jwt_backend import HMACBackend, JoseBackend
+
+        jose_backend = JoseBackend("secret", "HS256")
+        hmac_backend = HMACBackend("secret", "HS256")
+        claims = {"sub": "1", "type": "access", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+
+        assert hmac_backend.decode(jose_backend.encode(claims))["sub"] == "1"
+        assert jose_backend.decode(hmac_backend.encode(claims))["sub"] == "1"
+
+        token = hmac_backend.encode(claims)
+        with pytest.raises(JWTError):
+            hmac_backend.decode(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+        with pytest.raises(JWTError):
+            HMACBackend("secret", "HS512").decode(token)
+
+    def test_verify_token_caches_payload(self, monkeypatch):
+        """같은 토큰은 한 번만 디코딩하고, 만료된 캐시 항목은 사용하지 않음"""
+        from src.auth import jwt as jwt_module
+
+        token = jwt_module.create_access_token({"sub": "1"})
+        decode = jwt_module.jwt_backend.decode
+        calls = []
+        monkeypatch.setattr(jwt_module.jwt_backend, "decode", lambda t: calls.append(t) or decode(t))
+
+        assert jwt_module.verify_token(token)["sub"] == "1"
+        assert jwt_module.verify_token(token)["sub"] == "1"
+        assert len(calls) == 1
+
+        # 캐시 항목이 만료되면 다시 디코딩 (실제 토큰도 만료되었다면 TOKEN_EXPIRED)
+        key = jwt_module.token_cache.key(token)
+        _, payload = jwt_module.token_cache._entries[key]
+        jwt_module.token_cache._entries[key] = (0, payload)
+        jwt_module.verify_token(token)
+        assert len(calls) == 2
+
+        with pytest.raises(jwt_module.APIException):
+            jwt_module.verify_token(token, "refresh")
@@ -63,6 +63,36 @@ class TestReviewRead:
         assert data["is_success"] is True
         assert "reviews" in data["payload"]
 
+    def test_get_reviews_count_from_stats(self, client, user_token, test_book):
+        """리뷰 작성 시 book_stats 카운터로 전체 개수 반영"""
+        client.post(
+            f"/api/books/{test_book.id}/reviews",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"rating": 4, "content": "Good book!"}
+        )
+        response = client.get(f"/api/books/{test_book.id}/reviews")
+        assert response.status_code == 200
+        assert response.json()["payload"]["pagination"]["totalElements"] == 1
+
+    def test_get_reviews_cursor(self, client, db_session, test_book, test_review, test_admin):
+        """커서 기반 리뷰 목록 조회 성공"""
+        db_session.add(Review(user_id=test_admin.id, book_id=test_book.id, rating=3, content="Not bad"))
+        db_session.commit()
+
+        first = client.get(f"/api/books/{test_book.id}/reviews", params={"size": 1})
+        next_cursor = first.json()["payload"]["pagination"]["nextCursor"]
+        assert next_cursor is not None
+
+        second = client.get(
+            f"/api/books/{test_book.id}/reviews",
+            params={"size": 1, "cursor": next_cursor}
+        )
+        assert second.status_code == 200
+        payload = second.json()["payload"]
+        assert len(payload["reviews"]) == 1
+        assert payload["reviews"][0]["id"] != first.json()["payload"]["reviews"][0]["id"]
+        assert payload["pagination"]["nextCursor"] is None
+
 
 class TestReviewUpdate:
     """리뷰 수정 테스트"""
@@ -96,3 +126,70 @@ class TestReviewDelete:
         assert response.status_code == 200
         data = response.json()
         assert data["is_success"] is True
+
+
+class TestReviewLike:
+    """리뷰 좋아요 테스트"""
+
+    def test_like_updates_top_reviews(self, client, user_token, test_book, test_review):
+        """좋아요 등록/취소 시 Top-N 리뷰의 like_count 반영"""
+        like = client.post(
+            f"/api/reviews/{test_review.id}/like",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        assert like.status_code == 201
+
+        top = client.get(f"/api/books/{test_book.id}/reviews/top")
+        assert top.status_code == 200
+        assert top.json()["payload"]["reviews"][0]["like_count"] == 1
+
+        unlike = client.delete(
+            f"/api/reviews/{test_review.id}/like",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        assert unlike.status_code == 200
+
+        top = client.get(f"/api/books/{test_book.id}/reviews/top")
+        assert top.json()["payload"]["reviews"][0]["like_count"] == 0
+
+
+class TestReviewStats:
+    """리뷰 별점 집계(book_stats) 테스트"""
+
+    def test_rating_stats_follow_review_changes(self, client, user_token, test_book):
+        """리뷰 작성/별점 수정/삭제가 도서 집계에 반영됨"""
+        headers = {"Authorization": f"Bearer {user_token}"}
+        review_id = client.post(
+            f"/api/books/{test_book.id}/reviews",
+            headers=headers,
+            json={"rating": 4, "content": "Good book!"}
+        ).json()["payload"]["id"]
+
+        stats = client.get(f"/api/books/{test_book.id}").json()["payload"]["stats"]
+        assert stats["review_count"] == 1
+        assert stats["average_rating"] == 4.0
+        assert stats["rating_histogram"]["4"] == 1
+
+        client.patch(f"/api/reviews/{review_id}", headers=headers, json={"rating": 2})
+        stats = client.get(f"/api/books/{test_book.id}").json()["payload"]["stats"]
+        assert stats["average_rating"] == 2.0
+        assert stats["rating_histogram"]["4"] == 0
+        assert stats["rating_histogram"]["2"] == 1
+
+        client.delete(f"/api/reviews/{review_id}", headers=headers)
+        stats = client.get(f"/api/books/{test_book.id}").json()["payload"]["stats"]
+        assert stats["review_count"] == 0
+        assert stats["average_rating"] is None
+
+    def test_reconcile_fixes_drift(self, client, db_session, test_book, test_review):
+        """직접 삽입된 리뷰(집계 누락)를 보정 작업이 복구"""
+        from src.stats import reconcile_book_stats
+
+        # 보정 작업이 세션을 비우므로 id를 먼저 저장
+        book_id = test_book.id
+        assert reconcile_book_stats(db_session, batch_size=1) == 1
+        assert reconcile_book_stats(db_session) == 0
+
+        stats = client.get(f"/api/books/{book_id}").json()["payload"]["stats"]
+        assert stats["review_count"] == 1
+        assert stats["average_rating"] == 5.0
@@ -1,6 +1,11 @@
 # 사용자 API 테스트
+import json
+from datetime import datetime, timedelta
+
 import pytest
 
+from src.models.user import User
+
 
 class TestUserRegistration:
     """회원가입 테스트"""
@@ -78,3 +83,83 @@ class TestUserProfile:
         data = response.json()
         assert data["is_success"] is True
         assert data["payload"]["name"] == "Updated Name"
+
+    def test_update_my_profile_invalidates_user_cache(self, client, user_token):
+        """내 정보 수정 후 캐시된 사용자 정보가 갱신됨"""
+        headers = {"Authorization": f"Bearer {user_token}"}
+        # 첫 조회로 사용자 캐시 적재
+        client.get("/api/users/me", headers=headers)
+
+        client.patch("/api/users/me", headers=headers, json={"name": "Cached Name"})
+
+        response = client.get("/api/users/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["payload"]["name"] == "Cached Name"
+
+
+class TestUserList:
+    """사용자 목록/내보내기 테스트 (ADMIN)"""
+
+    @pytest.fixture
+    def many_users(self, db_session):
+        base = datetime(2024, 1, 1)
+        users = [
+            User(
+                email=f"member{i}@example.com",
+                password_hash="x",
+                name=f"Member {i}" if i % 2 else f"Reader {i}",
+                role="user",
+                created_at=base + timedelta(days=i)
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    def test_list_users_cursor_pagination(self, client, admin_token, many_users):
+        """커서로 다음 페이지를 이어서 조회 (최신순, 관리자 제외)"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        first = client.get("/api/users", params={"limit": 3}, headers=headers).json()["payload"]
+        assert [u["email"] for u in first["users"]] == [
+            "member4@example.com", "member3@example.com", "member2@example.com"
+        ]
+        assert first["pagination"]["has_next"] is True
+
+        second = client.get(
+            "/api/users",
+            params={"limit": 3, "cursor": first["pagination"]["next_cursor"]},
+            headers=headers
+        ).json()["payload"]
+        assert [u["email"] for u in second["users"]] == ["member1@example.com", "member0@example.com"]
+        assert second["pagination"]["has_next"] is False
+        assert second["pagination"]["next_cursor"] is None
+
+    def test_list_users_filters(self, client, admin_token, many_users):
+        """가입일 범위와 이름 접두어로 필터링"""
+        response = client.get(
+            "/api/users",
+            params={"name_prefix": "Member", "created_from": "2024-01-02T00:00:00"},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert response.status_code == 200
+        emails = [u["email"] for u in response.json()["payload"]["users"]]
+        assert emails == ["member3@example.com", "member1@example.com"]
+
+    def test_list_users_forbidden_for_user(self, client, user_token):
+        """일반 사용자는 목록 조회 불가"""
+        response = client.get("/api/users", headers={"Authorization": f"Bearer {user_token}"})
+        assert response.status_code == 403
+
+    def test_export_users_ndjson(self, client, admin_token, many_users):
+        """필터에 맞는 사용자를 한 줄에 한 명씩 NDJSON으로 내보냄"""
+        response = client.get(
+            "/api/users/export",
+            params={"email_prefix": "member"},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [u["email"] for u in lines] == [f"member{i}@example.com" for i in range(5)]
+        assert all("password_hash" not in u for u in lines)